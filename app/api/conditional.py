@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha256
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def http_date(moment: datetime) -> str:
+    return format_datetime(moment.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    candidates = (candidate.strip() for candidate in header.split(","))
+    return etag.removeprefix("W/") in (
+        candidate.removeprefix("W/") for candidate in candidates
+    )
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    # HTTP dates have a one second resolution.
+    modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+    return modified <= since
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        return _not_modified_since(if_modified_since, last_modified)
+
+    return False
+
+
+def has_conditions(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def cache_headers(etag: str, last_modified: datetime | None = None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=cache_headers(etag, last_modified),
+    )
@@ -1,10 +1,59 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Query
+from sqlalchemy import func
+from sqlmodel import col
+
+from app.db.models.job_application import JobApplication, JobApplicationStatus
+
+
 class JobApplicationsFiltration:
     def __init__(
         self,
-        name: str | None = None,
         company: str | None = None,
-        status: str | None = None,
+        company_contains: str | None = None,
+        status: Annotated[list[JobApplicationStatus] | None, Query()] = None,
+        applied_after: datetime | None = None,
+        applied_before: datetime | None = None,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
     ) -> None:
-        self.name = name
         self.company = company
+        self.company_contains = company_contains
         self.status = status
+        self.applied_after = applied_after
+        self.applied_before = applied_before
+        self.updated_after = updated_after
+        self.updated_before = updated_before
+
+    def apply(self, query):
+        company = func.lower(col(JobApplication.company))
+
+        if self.company:
+            query = query.where(company == self.company.lower())
+
+        if self.company_contains:
+            pattern = _escape_like(self.company_contains.lower())
+            query = query.where(company.like(f"%{pattern}%", escape="\\"))
+
+        if self.status:
+            query = query.where(col(JobApplication.status).in_(self.status))
+
+        if self.applied_after:
+            query = query.where(col(JobApplication.applied_at) >= self.applied_after)
+
+        if self.applied_before:
+            query = query.where(col(JobApplication.applied_at) < self.applied_before)
+
+        if self.updated_after:
+            query = query.where(col(JobApplication.updated_at) >= self.updated_after)
+
+        if self.updated_before:
+            query = query.where(col(JobApplication.updated_at) < self.updated_before)
+
+        return query
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
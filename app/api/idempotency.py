@@ -0,0 +1,110 @@
+import json
+from hashlib import sha256
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Header, HTTPException, Request, status
+from fastapi.responses import Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.idempotency import claim_idempotency_key, record_idempotent_response
+from app.utils.concurrency import KeyedLock
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Replays carry everything but the length, which Response computes itself.
+SKIPPED_HEADERS = {"content-length"}
+
+idempotency_locks = KeyedLock()
+
+
+class Idempotency:
+    def __init__(self, request: Request, key: str | None) -> None:
+        self.request = request
+        self.key = key
+        self._lock_key = None
+        self._user_id: UUID | None = None
+        self._session: AsyncSession | None = None
+
+    async def begin(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+    ) -> Response | None:
+        # Returns the stored response when the request is a retry; otherwise
+        # the caller proceeds and hands its response to complete().
+        if self.key is None:
+            return None
+
+        # Duplicates arriving at this worker wait here for the first one to
+        # commit; other workers wait on the key's row in the database.
+        self._lock_key = (user_id, self.key)
+        await idempotency_locks.acquire(self._lock_key)
+
+        self._user_id = user_id
+        self._session = session
+        fingerprint = await self._fingerprint()
+
+        existing = await claim_idempotency_key(session, user_id, self.key, fingerprint)
+        if existing is None:
+            return None
+
+        if existing.fingerprint != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request",
+            )
+
+        if existing.status_code is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+            )
+
+        return Response(
+            content=existing.body,
+            status_code=existing.status_code,
+            headers={**json.loads(existing.headers), REPLAYED_HEADER: "true"},
+        )
+
+    async def complete(self, response: Response) -> None:
+        # Stored in the request's own transaction, so the write and its
+        # replayable response commit or roll back together.
+        if self._session is None:
+            return
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in SKIPPED_HEADERS
+        }
+        await record_idempotent_response(
+            self._session,
+            self._user_id,
+            self.key,
+            response.status_code,
+            json.dumps(headers),
+            response.body,
+        )
+
+    def release(self) -> None:
+        if self._lock_key is not None:
+            idempotency_locks.release(self._lock_key)
+            self._lock_key = None
+
+    async def _fingerprint(self) -> str:
+        digest = sha256()
+        digest.update(f"{self.request.method} {self.request.url.path}\n".encode())
+        digest.update(await self.request.body())
+        return digest.hexdigest()
+
+
+async def idempotency(
+    request: Request,
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
+):
+    idempotency = Idempotency(request, idempotency_key)
+    try:
+        yield idempotency
+    finally:
+        idempotency.release()
@@ -0,0 +1,119 @@
+import math
+import time
+from uuid import uuid4
+
+from app.api.rate_limit import RateLimiter, rate_limiter
+from app.core.metrics import (
+    QueryStats,
+    db_queries_per_request,
+    db_query_seconds_per_request,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+    rate_limited_requests_total,
+    request_query_stats,
+)
+from app.utils.logger import request_id
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+
+class RequestIdMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        value = headers.get(REQUEST_ID_HEADER, b"").decode("latin-1")[:128]
+        value = value or uuid4().hex
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"].append((REQUEST_ID_HEADER, value.encode("latin-1")))
+            await send(message)
+
+        token = request_id.set(value)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id.reset(token)
+
+
+class MetricsMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = QueryStats()
+        token = request_query_stats.set(stats)
+        http_requests_in_flight.inc()
+        started_at = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            http_requests_in_flight.dec()
+            request_query_stats.reset(token)
+
+            # The router stores the matched route in the scope, which keeps the
+            # label cardinality bounded by the number of routes.
+            route = scope.get("route")
+            labels = {
+                "method": scope["method"],
+                "route": route.path if route else "unmatched",
+            }
+            http_requests_total.inc(status=status_code, **labels)
+            http_request_duration_seconds.observe(elapsed, **labels)
+            db_queries_per_request.observe(stats.count, **labels)
+            db_query_seconds_per_request.observe(stats.seconds, **labels)
+
+
+class RateLimitMiddleware:
+    def __init__(self, app, limiter: RateLimiter = rate_limiter) -> None:
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limited = await self.limiter.check(scope)
+        if limited is None:
+            await self.app(scope, receive, send)
+            return
+
+        rule, retry_after = limited
+        rate_limited_requests_total.inc(rule=rule.name)
+
+        body = b'{"detail":"Too many requests"}'
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(retry_after)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
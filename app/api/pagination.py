@@ -1,3 +1,13 @@
+import hashlib
+import hmac
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+
+from app.core.config import settings
+
+
 class OffsetPagination:
     def __init__(
         self,
@@ -16,3 +26,68 @@ class PagePagination:
     ) -> None:
         self.page = page
         self.size = size
+
+
+class CursorPagination:
+    def __init__(
+        self,
+        cursor: str | None = None,
+    ) -> None:
+        self.cursor = cursor
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class Cursor:
+    NEXT = "next"
+    PREV = "prev"
+
+    def __init__(
+        self,
+        applied_at: datetime,
+        id: UUID,
+        direction: str = NEXT,
+    ) -> None:
+        self.applied_at = applied_at
+        self.id = id
+        self.direction = direction
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.applied_at.isoformat(), str(self.id), self.direction],
+            separators=(",", ":"),
+        )
+        body = _b64encode(payload.encode())
+        return f"{body}.{_sign(body)}"
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        body, _, signature = value.partition(".")
+        if not hmac.compare_digest(signature, _sign(body)):
+            raise InvalidCursorError("Cursor signature mismatch")
+
+        try:
+            applied_at, id, direction = json.loads(_b64decode(body))
+            cursor = cls(datetime.fromisoformat(applied_at), UUID(id), direction)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+
+        if cursor.direction not in (cls.NEXT, cls.PREV):
+            raise InvalidCursorError("Unknown cursor direction")
+
+        return cursor
+
+
+def _sign(body: str) -> str:
+    digest = hmac.new(settings.HASH_KEY.encode(), body.encode(), hashlib.sha256)
+    return _b64encode(digest.digest()[:16])
+
+
+def _b64encode(data: bytes) -> str:
+    return urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return urlsafe_b64decode(data + "=" * (-len(data) % 4))
@@ -0,0 +1,79 @@
+from functools import cache
+
+from fastapi import HTTPException, status
+from pydantic import ConfigDict, TypeAdapter, create_model
+from sqlmodel import select
+
+from app.core.models.job_application import (
+    JobApplicationRead,
+    job_application_adapter,
+    job_application_list_adapter,
+)
+from app.db.models.job_application import JobApplication
+
+
+class JobApplicationFields:
+    FIELDS = tuple(JobApplicationRead.model_fields)
+
+    def __init__(
+        self,
+        fields: str | None = None,
+    ) -> None:
+        requested = {field.strip() for field in fields.split(",")} if fields else set()
+
+        for field in requested:
+            if field not in self.FIELDS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field: {field}",
+                )
+
+        self.fields = tuple(field for field in self.FIELDS if field in requested)
+
+    @property
+    def is_full(self) -> bool:
+        return not self.fields or len(self.fields) == len(self.FIELDS)
+
+    def require(self, *fields: str) -> None:
+        if not self.is_full:
+            self.fields = tuple(
+                field
+                for field in self.FIELDS
+                if field in self.fields or field in fields
+            )
+
+    def select(self, *columns: str):
+        # Only the requested columns are read, plus whatever the caller needs
+        # for cursors or validators; the adapter serializes just the former.
+        if self.is_full:
+            return select(JobApplication)
+
+        names = dict.fromkeys([*self.fields, *columns])
+        return select(*(getattr(JobApplication, name) for name in names))
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        if self.is_full:
+            return job_application_adapter
+        return _projection_adapters(self.fields)[0]
+
+    @property
+    def list_adapter(self) -> TypeAdapter:
+        if self.is_full:
+            return job_application_list_adapter
+        return _projection_adapters(self.fields)[1]
+
+
+@cache
+def _projection_adapters(fields: tuple[str, ...]) -> tuple[TypeAdapter, TypeAdapter]:
+    # One model per field combination, built on first use; there are only as
+    # many combinations as subsets of JobApplicationRead's fields.
+    model = create_model(
+        "JobApplicationProjection",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (JobApplicationRead.model_fields[name].annotation, ...)
+            for name in fields
+        },
+    )
+    return TypeAdapter(model), TypeAdapter(list[model])
@@ -0,0 +1,145 @@
+import logging
+import time
+
+from app.core.config import settings
+from app.utils.cache import InMemorySharedStore, LRUCache
+from app.utils.rate_limit import LocalBucketStore, SharedBucketStore
+from app.utils.token import decode_access_token
+
+AUTHORIZATION_HEADER = b"authorization"
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitRule:
+    def __init__(
+        self,
+        name: str,
+        rate: float | None,
+        burst: float = 1,
+        paths: tuple[str, ...] = (),
+        prefixes: tuple[str, ...] = (),
+        methods: tuple[str, ...] | None = None,
+        per_user: bool = True,
+    ) -> None:
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.paths = frozenset(paths)
+        self.prefixes = prefixes
+        self.methods = methods
+        self.per_user = per_user
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return path in self.paths or path.startswith(self.prefixes)
+
+
+class RateLimiter:
+    def __init__(self, store, rules: list[RateLimitRule], max_tokens: int = 10_000):
+        self.store = store
+        self.rules = rules
+        # Subjects of verified bearer tokens, keyed by the raw header value, so
+        # a repeat caller costs one dict lookup instead of a token decode.
+        self.subjects = LRUCache(max_size=max_tokens)
+
+    def rule_for(self, method: str, path: str) -> RateLimitRule | None:
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
+
+    async def check(self, scope) -> tuple[RateLimitRule, float] | None:
+        rule = self.rule_for(scope["method"], scope["path"])
+        if rule is None or rule.rate is None:
+            return None
+
+        key = f"{rule.name}:{self.identity(scope, rule.per_user)}"
+        retry_after = await self.store.take(key, rule.rate, rule.burst)
+        return (rule, retry_after) if retry_after else None
+
+    def identity(self, scope, per_user: bool) -> str:
+        # Authenticated requests are limited per user wherever they come from;
+        # anything that does not verify falls back to the client address.
+        if per_user:
+            for name, value in scope["headers"]:
+                if name == AUTHORIZATION_HEADER:
+                    subject = self._subject(value)
+                    if subject is not None:
+                        return subject
+                    break
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    def _subject(self, authorization: bytes) -> str | None:
+        subject = self.subjects.get(authorization)
+        if subject is not None:
+            return subject
+
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        payload = decode_access_token(token) if scheme.lower() == "bearer" else None
+        if not payload or not payload.get("sub"):
+            return None
+
+        subject = f"user:{payload['sub']}"
+        expires_in = payload.get("exp", 0) - time.time()
+        if expires_in > 0:
+            self.subjects.set(authorization, subject, ttl=expires_in)
+        return subject
+
+
+def create_rate_limiter(shared_store=None) -> RateLimiter:
+    # The shared backend needs a store every worker talks to, with an atomic
+    # ``take_token(key, rate, burst)`` such as a Redis script. Pass it here and
+    # hand the limiter to RateLimitMiddleware. Without one it falls back to the
+    # in-process fake, which limits each worker on its own.
+    if settings.RATE_LIMIT_BACKEND == "shared":
+        if shared_store is None:
+            logger.warning(
+                "RATE_LIMIT_BACKEND=shared without a shared store, "
+                "limits are kept per process"
+            )
+            shared_store = InMemorySharedStore()
+        store = SharedBucketStore(shared_store)
+    else:
+        store = LocalBucketStore(
+            shards=settings.RATE_LIMIT_SHARDS,
+            max_keys=settings.RATE_LIMIT_MAX_KEYS,
+        )
+
+    return RateLimiter(
+        store,
+        rules=[
+            # Password endpoints are limited per client address: they are
+            # unauthenticated and each request costs a bcrypt operation.
+            # Behind a reverse proxy the server has to trust its forwarded
+            # headers, or every caller shares the proxy's bucket.
+            RateLimitRule(
+                "auth",
+                rate=settings.RATE_LIMIT_AUTH_PER_MINUTE / 60,
+                burst=settings.RATE_LIMIT_AUTH_BURST,
+                paths=("/api/v1/token", "/api/v1/register"),
+                methods=("POST",),
+                per_user=False,
+            ),
+            RateLimitRule(
+                "bulk",
+                rate=settings.RATE_LIMIT_BULK_PER_MINUTE / 60,
+                burst=settings.RATE_LIMIT_BULK_BURST,
+                prefixes=("/api/v1/bulk", "/api/v1/export"),
+            ),
+            # Load balancers poll the probes and must never be throttled.
+            RateLimitRule("health", rate=None, prefixes=("/api/v1/health",)),
+            RateLimitRule(
+                "api",
+                rate=settings.RATE_LIMIT_API_PER_SECOND,
+                burst=settings.RATE_LIMIT_API_BURST,
+                prefixes=("/api/v1",),
+            ),
+        ],
+    )
+
+
+rate_limiter = create_rate_limiter()
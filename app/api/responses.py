@@ -0,0 +1,27 @@
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+any_adapter = TypeAdapter(Any)
+
+
+class PydanticJSONResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: dict | None = None,
+        adapter: TypeAdapter | None = None,
+    ) -> None:
+        self.adapter = adapter
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        if self.adapter is None:
+            return any_adapter.dump_json(content)
+
+        validated = self.adapter.validate_python(content, from_attributes=True)
+        return self.adapter.dump_json(validated)
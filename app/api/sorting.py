@@ -0,0 +1,38 @@
+from fastapi import HTTPException, status
+from sqlmodel import col
+
+from app.db.models.job_application import JobApplication
+
+
+class JobApplicationsSorting:
+    FIELDS = {
+        "applied_at": JobApplication.applied_at,
+        "updated_at": JobApplication.updated_at,
+        "company": JobApplication.company,
+        "status": JobApplication.status,
+    }
+    DEFAULT = ["applied_at"]
+
+    def __init__(
+        self,
+        sort: str | None = None,
+    ) -> None:
+        self.fields = [field.strip() for field in sort.split(",")] if sort else []
+
+        for field in self.fields:
+            if field.removeprefix("-") not in self.FIELDS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown sort field: {field}",
+                )
+
+    @property
+    def is_default(self) -> bool:
+        return not self.fields or self.fields == self.DEFAULT
+
+    def apply(self, query):
+        for field in self.fields or self.DEFAULT:
+            column = col(self.FIELDS[field.removeprefix("-")])
+            query = query.order_by(column.desc() if field.startswith("-") else column)
+
+        return query.order_by(col(JobApplication.id))
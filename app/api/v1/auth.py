@@ -1,81 +1,210 @@
 from datetime import timedelta
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.params import Depends
-from fastapi.responses import JSONResponse
+from fastapi.params import Body, Depends
+from fastapi.responses import Response
 from fastapi.security import OAuth2PasswordRequestForm
-from jwt import InvalidTokenError
-from sqlmodel import Session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
 from app.core.config import settings
-from app.core.hash import get_password_hash, verify_password
-from app.core.models.token import Token, TokenData
+from app.core.hash import HashingServiceBusy, hashing_service
+from app.core.models.token import RefreshTokenRequest, Token, TokenData
+from app.core.models.user import UserPrincipal
 from app.core.security import oauth2_scheme
 from app.db.base import get_session
 from app.db.models.user import User
+from app.db.refresh_tokens import (
+    RefreshTokenReused,
+    issue_refresh_token,
+    mirror_revocations,
+    revoke_sessions,
+    rotate_refresh_token,
+)
+from app.utils.ids import uuid7
 from app.utils.tags import ApplicationTags
 from app.utils.token import create_access_token, decode_access_token
 
 router = APIRouter(tags=[ApplicationTags.auth])
 
 
-def authenticate_user(session: Session, username: str, password: str):
-    user = session.query(User).filter(User.username == username).first()
-    if not user or not verify_password(password, user.hashed_password):
+def hashing_busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many password operations in progress",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def authenticate_user(session: AsyncSession, username: str, password: str):
+    query = select(User).filter(User.username == username)
+    user = (await session.exec(query)).first()
+    if not user:
         return False
+
+    verified, new_hash = await hashing_service.verify(password, user.hashed_password)
+    if not verified:
+        return False
+
+    if new_hash:
+        user.hashed_password = new_hash
+        session.add(user)
+        await session.commit()
+
     return user
 
 
 @router.post("/token")
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
-    user = authenticate_user(session, form_data.username, form_data.password)
+    try:
+        user = await authenticate_user(session, form_data.username, form_data.password)
+    except HashingServiceBusy:
+        raise hashing_busy_exception()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Wrong credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    session_id = uuid7()
+    refresh_token = issue_refresh_token(session, user.id, session_id)
+    await session.commit()
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=issue_tokens(user.username, session_id, refresh_token),
+    )
+
+
+@router.post("/token/refresh")
+async def refresh_access_token(
+    body: Annotated[RefreshTokenRequest, Body()],
+    session: AsyncSession = Depends(get_session),
+):
+    try:
+        rotated = await rotate_refresh_token(session, body.refresh_token)
+    except RefreshTokenReused as e:
+        await session.commit()
+        mirror_revocations(e.revoked)
+        rotated = None
+    else:
+        await session.commit()
+
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=issue_tokens(
+            rotated.username, rotated.session_id, rotated.refresh_token
+        ),
+    )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    session_id = current_session_id(token)
+    if session_id:
+        revoked = await revoke_sessions(session, user.id, [UUID(session_id)])
+        await session.commit()
+        mirror_revocations(revoked)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/logout/all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    revoked = await revoke_sessions(session, user.id)
+
+    # The current session may have no live refresh token left, but its access
+    # token must stop working as well.
+    session_id = current_session_id(token)
+    if session_id and all(str(r.session_id) != session_id for r in revoked):
+        revoked += await revoke_sessions(session, user.id, [UUID(session_id)])
+
+    await session.commit()
+    mirror_revocations(revoked)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def current_session_id(token: str) -> str | None:
+    # The token was valid when get_current_user checked it, but a concurrent
+    # logout or its expiry may have ended it since.
+    payload = decode_access_token(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload.get("sid")
+
+
+def issue_tokens(username: str, session_id: UUID, refresh_token: str) -> Token:
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username},
+        data={"sub": username, "sid": str(session_id)},
         expires_delta=access_token_expires,
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content=Token(access_token=access_token, token_type="bearer").model_dump(),
+    return Token(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=int(access_token_expires.total_seconds()),
+        refresh_token=refresh_token,
     )
 
 
 @router.post("/register")
-def register_user(
+async def register_user(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
-    db_user = session.query(User).filter(User.username == form_data.username).first()
+    query = select(User).filter(User.username == form_data.username)
+    db_user = (await session.exec(query)).first()
 
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
 
-    hashed_password = get_password_hash(form_data.password)
+    try:
+        hashed_password = await hashing_service.hash(form_data.password)
+    except HashingServiceBusy:
+        raise hashing_busy_exception()
+
     db_user = User(
         username=form_data.username,
         hashed_password=hashed_password,
     )
 
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
+    await session.commit()
+    await session.refresh(db_user)
 
-    return JSONResponse(
+    return PydanticJSONResponse(
         status_code=status.HTTP_201_CREATED,
-        content=TokenData(username=db_user.username).model_dump(),
+        content=TokenData(username=db_user.username),
     )
 
 
@@ -86,15 +215,15 @@ async def me(token: Annotated[str, Depends(oauth2_scheme)]):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = decode_access_token(token)
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content=TokenData(username=username).model_dump(),
-        )
-    except InvalidTokenError:
+    payload = decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
+
+    username: str = payload.get("sub")
+    if username is None:
         raise credentials_exception
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=TokenData(username=username),
+    )
@@ -0,0 +1,73 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.params import Depends
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.projection import JobApplicationFields
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.config import settings
+from app.core.models.job_application import JobApplicationRead
+from app.core.models.user import UserPrincipal
+from app.db.base import get_session
+from app.db.models.job_application import JobApplication, not_deleted
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/batch",
+    tags=[ApplicationTags.applications],
+)
+
+
+def parse_ids(ids: str) -> list[UUID]:
+    try:
+        parsed = list(dict.fromkeys(UUID(id.strip()) for id in ids.split(",")))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma separated list of application ids",
+        )
+
+    if len(parsed) > settings.BATCH_GET_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_GET_MAX_IDS} ids can be read at once",
+        )
+
+    return parsed
+
+
+@router.get(
+    "",
+    response_model=list[JobApplicationRead],
+)
+async def get_applications_by_ids(
+    ids: Annotated[str, Query(min_length=1)],
+    projection: Annotated[
+        JobApplicationFields,
+        Depends(JobApplicationFields),
+    ],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    requested = parse_ids(ids)
+    # Results are matched back to the requested ids, so projections always
+    # carry the id. Unknown, foreign and deleted ids are left out.
+    projection.require("id")
+
+    query = (
+        projection.select("id")
+        .where(col(JobApplication.id).in_(requested))
+        .where(JobApplication.user_id == user.id)
+        .where(not_deleted())
+    )
+    found = {row.id: row for row in (await session.exec(query)).all()}
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=[found[id] for id in requested if id in found],
+        adapter=projection.list_adapter,
+    )
@@ -0,0 +1,330 @@
+import json
+from collections import defaultdict
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.params import Depends
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import bindparam, insert, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.idempotency import Idempotency, idempotency
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.config import settings
+from app.core.models.job_application import (
+    JobApplicationBulkUpdate,
+    JobApplicationCreate,
+)
+from app.core.models.user import UserPrincipal
+from app.db.base import get_session
+from app.db.changes import ApplicationChanges
+from app.db.deletes import delete_applications_statement
+from app.db.models.job_application import JobApplication, not_deleted
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/bulk",
+    tags=[ApplicationTags.applications],
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+create_adapter = TypeAdapter(JobApplicationCreate)
+update_adapter = TypeAdapter(JobApplicationBulkUpdate)
+id_adapter = TypeAdapter(UUID)
+
+
+async def read_items(request: Request):
+    count = 0
+
+    if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        items = _read_ndjson(request)
+    else:
+        items = _read_json_array(request)
+
+    async for item in items:
+        count += 1
+        if count > settings.BULK_MAX_ITEMS:
+            raise too_large(
+                f"Bulk requests are limited to {settings.BULK_MAX_ITEMS} items"
+            )
+        yield item
+
+
+def too_large(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=detail,
+    )
+
+
+async def _stream_body(request: Request):
+    # The size is checked as chunks arrive, so an oversized body is refused
+    # before it is held in memory or parsed.
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > settings.BULK_MAX_BYTES:
+            raise too_large(
+                f"Bulk requests are limited to {settings.BULK_MAX_BYTES} bytes"
+            )
+        yield chunk
+
+
+async def _read_ndjson(request: Request):
+    buffer = b""
+    async for chunk in _stream_body(request):
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+
+    if buffer.strip():
+        yield buffer
+
+
+async def _read_json_array(request: Request):
+    body = b"".join([chunk async for chunk in _stream_body(request)])
+    try:
+        items = json.loads(body)
+    except ValueError:
+        items = None
+
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body must be a JSON array or NDJSON stream",
+        )
+
+    for item in items:
+        yield item
+
+
+def validate_item(adapter: TypeAdapter, item):
+    if isinstance(item, bytes):
+        return adapter.validate_json(item)
+    return adapter.validate_python(item)
+
+
+def duplicate_error(index: int) -> dict:
+    return {
+        "index": index,
+        "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "errors": [
+            {"type": "duplicate_id", "msg": "Id appears earlier in this request"}
+        ],
+    }
+
+
+def item_error(index: int, error: ValidationError) -> dict:
+    return {
+        "index": index,
+        "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "errors": json.loads(error.json(include_url=False)),
+    }
+
+
+def bulk_update_statement(columns: tuple[str, ...], user_id: UUID, now: datetime):
+    table = JobApplication.__table__
+    return (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .where(table.c.user_id == user_id)
+        .where(table.c.deleted_at.is_(None))
+        .values(
+            **{column: bindparam(column) for column in columns},
+            version=table.c.version + 1,
+            updated_at=now,
+        )
+    )
+
+
+def chunked(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@router.post("")
+async def bulk_create_applications(
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    idempotency: Idempotency = Depends(idempotency),
+):
+    replayed = await idempotency.begin(session, user.id)
+    if replayed is not None:
+        return replayed
+
+    results = []
+    rows = []
+    changes = ApplicationChanges(user.id)
+
+    async for item in read_items(request):
+        index = len(results)
+        try:
+            body = validate_item(create_adapter, item)
+        except ValidationError as e:
+            results.append(item_error(index, e))
+            continue
+
+        db_job_application = JobApplication.model_validate(body)
+        db_job_application.user_id = user.id
+        rows.append(db_job_application.model_dump())
+        changes.created(db_job_application)
+
+        results.append(
+            {
+                "index": index,
+                "status": status.HTTP_201_CREATED,
+                "id": str(db_job_application.id),
+            }
+        )
+
+        if len(rows) >= settings.BULK_CHUNK_SIZE:
+            await session.exec(insert(JobApplication), params=rows)
+            rows = []
+
+    if rows:
+        await session.exec(insert(JobApplication), params=rows)
+
+    await changes.flush(session)
+
+    response = PydanticJSONResponse(status_code=status.HTTP_200_OK, content=results)
+    await idempotency.complete(response)
+    await session.commit()
+
+    return response
+
+
+@router.patch("")
+async def bulk_update_applications(
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    idempotency: Idempotency = Depends(idempotency),
+):
+    replayed = await idempotency.begin(session, user.id)
+    if replayed is not None:
+        return replayed
+
+    results = []
+    updates = []
+    seen = set()
+
+    async for item in read_items(request):
+        index = len(results)
+        try:
+            body = validate_item(update_adapter, item)
+        except ValidationError as e:
+            results.append(item_error(index, e))
+            continue
+
+        # Updates are grouped by column set below, so a second item for the
+        # same id could be applied out of request order; it is refused.
+        if body.id in seen:
+            results.append({**duplicate_error(index), "id": str(body.id)})
+            continue
+
+        seen.add(body.id)
+        results.append({"index": index, "id": str(body.id)})
+        updates.append((index, body))
+
+    # The rows stay locked until commit, so the statuses read here are the
+    # ones the UPDATE replaces and a concurrent write cannot slip in between.
+    # Locking in id order keeps concurrent bulk requests from deadlocking.
+    current_statuses = {}
+    ids = sorted({body.id for _, body in updates})
+    for chunk in chunked(ids, settings.BULK_CHUNK_SIZE):
+        query = (
+            select(JobApplication.id, JobApplication.status)
+            .where(col(JobApplication.id).in_(chunk))
+            .where(JobApplication.user_id == user.id)
+            .where(not_deleted())
+            .order_by(col(JobApplication.id))
+            .with_for_update()
+        )
+        current_statuses.update((await session.exec(query)).all())
+
+    now = datetime.utcnow()
+    groups = defaultdict(list)
+    changes = ApplicationChanges(user.id)
+    for index, body in updates:
+        if body.id not in current_statuses:
+            results[index]["status"] = status.HTTP_404_NOT_FOUND
+            continue
+
+        values = body.model_dump(exclude_unset=True, exclude={"id"})
+        changes.updated(body.id, current_statuses[body.id], values)
+
+        groups[tuple(sorted(values))].append({**values, "b_id": body.id})
+        results[index]["status"] = status.HTTP_200_OK
+
+    # Items touching the same columns share one executemany statement, which
+    # bumps the row version in SQL so concurrent single updates still conflict.
+    for columns, rows in groups.items():
+        statement = bulk_update_statement(columns, user.id, now)
+        for chunk in chunked(rows, settings.BULK_CHUNK_SIZE):
+            await session.exec(statement, params=chunk)
+
+    await changes.flush(session)
+
+    response = PydanticJSONResponse(status_code=status.HTTP_200_OK, content=results)
+    await idempotency.complete(response)
+    await session.commit()
+
+    return response
+
+
+@router.delete("")
+async def bulk_delete_applications(
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    idempotency: Idempotency = Depends(idempotency),
+):
+    replayed = await idempotency.begin(session, user.id)
+    if replayed is not None:
+        return replayed
+
+    results = []
+    ids = []
+
+    async for item in read_items(request):
+        index = len(results)
+        try:
+            id = validate_item(id_adapter, item)
+        except ValidationError as e:
+            results.append(item_error(index, e))
+            continue
+
+        results.append({"index": index, "id": str(id)})
+        ids.append((index, id))
+
+    deleted_ids = set()
+    changes = ApplicationChanges(user.id)
+    for chunk in chunked([id for _, id in ids], settings.BULK_CHUNK_SIZE):
+        query = delete_applications_statement(
+            col(JobApplication.id).in_(chunk),
+            JobApplication.user_id == user.id,
+        )
+        for id, job_status, applied_at in await session.exec(query):
+            deleted_ids.add(id)
+            changes.deleted(id, job_status, applied_at)
+
+    await changes.flush(session)
+
+    for index, id in ids:
+        results[index]["status"] = (
+            status.HTTP_204_NO_CONTENT
+            if id in deleted_ids
+            else status.HTTP_404_NOT_FOUND
+        )
+
+    response = PydanticJSONResponse(status_code=status.HTTP_200_OK, content=results)
+    await idempotency.complete(response)
+    await session.commit()
+
+    return response
@@ -0,0 +1,130 @@
+import asyncio
+import json
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.change_feed import change_feed
+from app.core.config import settings
+from app.core.models.user import UserPrincipal
+from app.db.base import engine, get_session
+from app.db.models.outbox import OutboxEvent
+from app.db.outbox import (
+    current_sequence,
+    missed_events,
+    outbox_event_json,
+    read_outbox_events,
+)
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/changes",
+    tags=[ApplicationTags.changes],
+)
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+
+async def resume_from(
+    session: AsyncSession,
+    user_id: UUID,
+    since: int | None,
+) -> int:
+    if since is None:
+        return await current_sequence(session, user_id)
+
+    if await missed_events(session, user_id, since):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Changes after this sequence are no longer available; "
+            "reload the applications and resume from the current sequence",
+        )
+    return since
+
+
+def format_event(event: OutboxEvent) -> str:
+    data = json.dumps(outbox_event_json(event))
+    return f"id: {event.sequence}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+async def render_stream(user_id: UUID, sequence: int):
+    # The backlog is read page by page straight from the outbox, so a client
+    # far behind catches up at the pace it reads; only then does the stream
+    # join the feed, which continues from the last sequence sent.
+    while True:
+        async with AsyncSession(engine) as session:
+            events = await read_outbox_events(
+                session, {user_id: sequence}, settings.OUTBOX_BATCH_SIZE
+            )
+        if events:
+            yield "".join(format_event(event) for event in events)
+            sequence = events[-1].sequence
+        if len(events) < settings.OUTBOX_BATCH_SIZE:
+            break
+
+    subscriber = change_feed.subscribe(user_id, sequence)
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscriber.queue.get(), settings.CHANGE_STREAM_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            events = [event]
+            while not subscriber.queue.empty():
+                events.append(subscriber.queue.get_nowait())
+
+            delivered = [event for event in events if event is not None]
+            if delivered:
+                yield "".join(format_event(event) for event in delivered)
+            if len(delivered) < len(events):
+                return
+    finally:
+        change_feed.unsubscribe(subscriber)
+
+
+@router.get("")
+async def get_changes(
+    since: Annotated[int | None, Query(ge=0)] = None,
+    limit: Annotated[int, Query(ge=1, le=settings.OUTBOX_BATCH_SIZE)] = 100,
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    sequence = await resume_from(session, user.id, since)
+    events = await read_outbox_events(session, {user.id: sequence}, limit)
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "events": [outbox_event_json(event) for event in events],
+            "sequence": events[-1].sequence if events else sequence,
+        },
+    )
+
+
+@router.get("/stream")
+async def stream_changes(
+    since: Annotated[int | None, Query(ge=0)] = None,
+    last_event_id: Annotated[int | None, Header(ge=0)] = None,
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    # Browsers reconnect with Last-Event-ID; other clients may pass ?since=.
+    sequence = await resume_from(
+        session, user.id, last_event_id if last_event_id is not None else since
+    )
+
+    return StreamingResponse(
+        render_stream(user.id, sequence),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,94 @@
+import csv
+import io
+from enum import Enum
+from typing import Annotated
+
+from fastapi import APIRouter
+from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.filtration import JobApplicationsFiltration
+from app.api.v1.job_applications import get_current_user
+from app.core.config import settings
+from app.core.models.job_application import JobApplicationRead
+from app.core.models.user import UserPrincipal
+from app.db.base import engine
+from app.db.models.job_application import JobApplication, not_deleted
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/export",
+    tags=[ApplicationTags.applications],
+)
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def stream_partitions(query):
+    # The request-scoped session is closed before the response body is sent,
+    # so the export owns a session for the lifetime of the stream.
+    async with AsyncSession(engine) as session:
+        result = await session.stream_scalars(query)
+        async for partition in result.partitions():
+            yield [JobApplicationRead.model_validate(row) for row in partition]
+
+
+async def render_ndjson(query):
+    async for partition in stream_partitions(query):
+        yield "".join(f"{item.model_dump_json()}\n" for item in partition)
+
+
+async def render_csv(query):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(JobApplicationRead.model_fields))
+    writer.writeheader()
+
+    async for partition in stream_partitions(query):
+        writer.writerows(item.model_dump(mode="json") for item in partition)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("")
+async def export_applications(
+    filtration: Annotated[
+        JobApplicationsFiltration,
+        Depends(JobApplicationsFiltration),
+    ],
+    format: ExportFormat = ExportFormat.NDJSON,
+    user: UserPrincipal = Depends(get_current_user),
+):
+    query = (
+        filtration.apply(
+            select(JobApplication)
+            .where(JobApplication.user_id == user.id)
+            .where(not_deleted())
+        )
+        .order_by(col(JobApplication.applied_at), col(JobApplication.id))
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+
+    render = render_csv if format == ExportFormat.CSV else render_ndjson
+
+    return StreamingResponse(
+        render(query),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="applications.{format.value}"'
+        },
+    )
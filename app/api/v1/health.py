@@ -1,6 +1,9 @@
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 
+from app.api.responses import PydanticJSONResponse
+from app.core.health import health_monitor
+from app.db.engine import engines
 from app.utils.tags import ApplicationTags
 
 router = APIRouter(tags=[ApplicationTags.health])
@@ -8,19 +11,45 @@ router = APIRouter(tags=[ApplicationTags.health])
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check() -> Response:
-    return JSONResponse(
+    return PydanticJSONResponse(
         status_code=status.HTTP_200_OK,
         content={"status": "healthy"},
     )
 
 
+@router.get("/health/live", status_code=status.HTTP_200_OK)
+async def liveness_check() -> Response:
+    # Liveness only says whether the process should be restarted, so it never
+    # depends on the database or other services.
+    live = health_monitor.live
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK if live else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "live" if live else "stalled"},
+    )
+
+
+@router.get("/health/ready", status_code=status.HTTP_200_OK)
+async def readiness_check() -> Response:
+    ready = health_monitor.ready
+    return PydanticJSONResponse(
+        status_code=(
+            status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content={
+            "status": "ready" if ready else "not ready",
+            "probes": {
+                name: result.healthy for name, result in health_monitor.results.items()
+            },
+        },
+    )
+
+
 @router.get("/health/details", status_code=status.HTTP_200_OK)
 async def detailed_health_check() -> Response:
-    return JSONResponse(
+    return PydanticJSONResponse(
         status_code=status.HTTP_200_OK,
         content={
-            "database_status": "TODO",
-            "service_a_status": "TODO",
-            "service_b_status": "TODO",
+            **health_monitor.as_dict(),
+            "database_pool": engines.pool_status(),
         },
     )
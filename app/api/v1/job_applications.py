@@ -1,18 +1,49 @@
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.params import Body, Depends, Path
-from fastapi.responses import JSONResponse
-from sqlmodel import Session, select
-
+from sqlalchemy import tuple_
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.conditional import (
+    cache_headers,
+    has_conditions,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
 from app.api.filtration import JobApplicationsFiltration
-from app.api.pagination import OffsetPagination
-from app.core.models.job_application import JobApplicationCreate, JobApplicationRead
+from app.api.idempotency import Idempotency, idempotency
+from app.api.pagination import (
+    Cursor,
+    CursorPagination,
+    InvalidCursorError,
+    OffsetPagination,
+)
+from app.api.projection import JobApplicationFields
+from app.api.responses import PydanticJSONResponse
+from app.api.sorting import JobApplicationsSorting
+from app.core.models.job_application import (
+    JobApplicationCreate,
+    JobApplicationRead,
+    JobApplicationUpdate,
+    job_application_adapter,
+)
+from app.core.models.user import UserPrincipal
 from app.core.security import oauth2_scheme
+from app.core.user_cache import user_cache
 from app.db.base import get_session
-from app.db.models.job_application import JobApplication
+from app.db.changes import ApplicationChanges
+from app.db.deletes import (
+    delete_applications_statement,
+    restore_application_statement,
+)
+from app.db.models.job_application import JobApplication, not_deleted
 from app.db.models.user import User
+from app.db.updates import update_job_application
+from app.db.versions import get_collection_version
+from app.utils.concurrency import read_flights
 from app.utils.tags import ApplicationTags
 from app.utils.token import decode_access_token
 
@@ -21,10 +52,10 @@ router = APIRouter(
 )
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    session: Session = Depends(get_session),
-) -> User:
+    session: AsyncSession = Depends(get_session),
+) -> UserPrincipal:
     token_data = decode_access_token(token)
     if not token_data:
         raise HTTPException(status_code=401, detail="Invalid token")
@@ -33,13 +64,20 @@ def get_current_user(
     if not username:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    principal = await user_cache.get(username)
+    if principal:
+        return principal
+
     query = select(User).filter(User.username == username)
-    user = session.exec(query).first()
+    user = (await session.exec(query)).first()
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return user
+    principal = UserPrincipal.model_validate(user)
+    await user_cache.set(principal)
+
+    return principal
 
 
 @router.get(
@@ -47,31 +85,128 @@ def get_current_user(
     response_model=list[JobApplicationRead],
 )
 async def get_applications(
+    request: Request,
     pagination: Annotated[
         OffsetPagination,
         Depends(OffsetPagination),
     ],
+    cursor_pagination: Annotated[
+        CursorPagination,
+        Depends(CursorPagination),
+    ],
     filtration: Annotated[
         JobApplicationsFiltration,
         Depends(JobApplicationsFiltration),
     ],
-    user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    sorting: Annotated[
+        JobApplicationsSorting,
+        Depends(JobApplicationsSorting),
+    ],
+    projection: Annotated[
+        JobApplicationFields,
+        Depends(JobApplicationFields),
+    ],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ):
+    # Every write bumps the per-user collection version, so a page can be
+    # revalidated with a primary key lookup instead of re-running the query.
+    # Identical reads of one user that overlap share a single query; the
+    # page key includes the version so they never span a write.
+    collection = await read_flights.do(
+        user.id, ("collection",), lambda: get_collection_version(session, user.id)
+    )
+    version = collection.version if collection else 0
+    last_modified = collection.updated_at if collection else None
+    etag = make_etag(user.id, version, request.url.query)
+
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
     query = (
-        select(JobApplication)
+        projection.select("applied_at", "id")
         .where(JobApplication.user_id == str(user.id))
-        .offset(pagination.offset)
-        .limit(pagination.limit)
+        .where(not_deleted())
+    )
+    query = filtration.apply(query)
+    sort_key = tuple_(col(JobApplication.applied_at), col(JobApplication.id))
+
+    if cursor_pagination.cursor:
+        if not sorting.is_default:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination only supports the default sort order",
+            )
+
+        try:
+            cursor = Cursor.decode(cursor_pagination.cursor)
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+        if cursor.direction == Cursor.NEXT:
+            query = query.where(sort_key > (cursor.applied_at, cursor.id)).order_by(
+                col(JobApplication.applied_at), col(JobApplication.id)
+            )
+        else:
+            query = query.where(sort_key < (cursor.applied_at, cursor.id)).order_by(
+                col(JobApplication.applied_at).desc(), col(JobApplication.id).desc()
+            )
+    else:
+        cursor = None
+        query = sorting.apply(query).offset(pagination.offset)
+
+    query = query.limit(pagination.limit + 1)
+    result = await read_flights.do(
+        user.id,
+        ("list", version, request.url.query),
+        lambda: _fetch_all(session, query),
+    )
+
+    has_more = len(result) > pagination.limit
+    result = result[: pagination.limit]
+
+    if cursor and cursor.direction == Cursor.PREV:
+        result.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, cursor is not None or pagination.offset > 0
+
+    headers = cache_headers(etag, last_modified)
+    if result and sorting.is_default:
+        links = []
+        if has_next:
+            next_cursor = Cursor(result[-1].applied_at, result[-1].id, Cursor.NEXT)
+            links.append(_cursor_link(request, next_cursor, "next"))
+        if has_prev:
+            prev_cursor = Cursor(result[0].applied_at, result[0].id, Cursor.PREV)
+            links.append(_cursor_link(request, prev_cursor, "prev"))
+        if links:
+            headers["Link"] = ", ".join(links)
+
+    return PydanticJSONResponse(
+        status_code=200,
+        content=result,
+        headers=headers,
+        adapter=projection.list_adapter,
     )
 
-    result = session.exec(query).all()
 
-    applications = [
-        jsonable_encoder(JobApplicationRead.model_validate(app)) for app in result
-    ]
+async def _fetch_all(session: AsyncSession, query) -> list:
+    return (await session.exec(query)).all()
 
-    return JSONResponse(status_code=200, content=applications)
+
+async def _fetch_first(session: AsyncSession, query):
+    return (await session.exec(query)).first()
+
+
+def _cursor_link(request: Request, cursor: Cursor, rel: str) -> str:
+    url = request.url.remove_query_params("offset").include_query_params(
+        cursor=cursor.encode()
+    )
+    return f'<{url}>; rel="{rel}"'
 
 
 @router.get(
@@ -79,27 +214,76 @@ async def get_applications(
     response_model=JobApplicationRead,
 )
 async def get_application(
+    request: Request,
     id: Annotated[str, Path(max_length=55)],
-    user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    projection: Annotated[
+        JobApplicationFields,
+        Depends(JobApplicationFields),
+    ],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ):
+    fields = () if projection.is_full else projection.fields
+
+    if has_conditions(request):
+        # Revalidation only needs the version column; the row is loaded and
+        # serialized only when it has actually changed.
+        version_query = (
+            select(JobApplication.version, JobApplication.updated_at)
+            .where(JobApplication.id == id)
+            .where(JobApplication.user_id == str(user.id))
+            .where(not_deleted())
+        )
+        current = await read_flights.do(
+            user.id, ("version", id), lambda: _fetch_first(session, version_query)
+        )
+        if current is not None:
+            version, updated_at = current
+            etag = _application_etag(version, fields)
+            if is_not_modified(request, etag, updated_at):
+                return not_modified(etag, updated_at)
+
     job_query = (
-        select(JobApplication)
+        projection.select("version", "updated_at")
         .where(JobApplication.id == id)
         .where(JobApplication.user_id == str(user.id))
+        .where(not_deleted())
+    )
+    job_application = await read_flights.do(
+        user.id,
+        ("application", id, projection.fields),
+        lambda: _fetch_first(session, job_query),
     )
-    job_application = session.exec(job_query).first()
     if not job_application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job application not found",
         )
 
-    obj = jsonable_encoder(JobApplicationRead.model_validate(job_application))
-
-    return JSONResponse(
+    return PydanticJSONResponse(
         status_code=status.HTTP_200_OK,
-        content=obj,
+        content=job_application,
+        headers=_application_cache_headers(job_application, fields),
+        adapter=projection.adapter,
+    )
+
+
+def _application_etag(version: int, fields: tuple[str, ...] = ()) -> str:
+    # The row version is the validator, which lets If-Match carry it straight
+    # into the UPDATE's WHERE clause. A ?fields= projection is another
+    # representation of that version, so its validator names the fields and
+    # is weak, which If-Match never accepts.
+    if not fields:
+        return f'"{version}"'
+    return f'W/"{version}:{"+".join(fields)}"'
+
+
+def _application_cache_headers(
+    job_application: JobApplication, fields: tuple[str, ...] = ()
+) -> dict:
+    return cache_headers(
+        _application_etag(job_application.version, fields),
+        job_application.updated_at,
     )
 
 
@@ -109,21 +293,34 @@ async def get_application(
 )
 async def create_application(
     body: Annotated[JobApplicationCreate, Body()],
-    user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    idempotency: Idempotency = Depends(idempotency),
 ):
+    replayed = await idempotency.begin(session, user.id)
+    if replayed is not None:
+        return replayed
+
     db_job_application = JobApplication.model_validate(body)
-    db_job_application.user = user
+    db_job_application.user_id = user.id
 
-    session.add(db_job_application)
-    session.commit()
-    session.refresh(db_job_application)
+    changes = ApplicationChanges(user.id)
+    changes.created(db_job_application)
 
-    response_model = jsonable_encoder(
-        JobApplicationRead.model_validate(db_job_application)
+    session.add(db_job_application)
+    await changes.flush(session)
+    await session.refresh(db_job_application)
+
+    response = PydanticJSONResponse(
+        status_code=201,
+        content=db_job_application,
+        headers=_application_cache_headers(db_job_application),
+        adapter=job_application_adapter,
     )
+    await idempotency.complete(response)
+    await session.commit()
 
-    return JSONResponse(status_code=201, content=response_model)
+    return response
 
 
 @router.put(
@@ -131,67 +328,173 @@ async def create_application(
     response_model=JobApplicationRead,
 )
 async def update_application(
+    request: Request,
     id: Annotated[str, Path()],
     body: Annotated[JobApplicationCreate, Body()],
-    user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    idempotency: Idempotency = Depends(idempotency),
 ):
-    query = select(JobApplication).where(JobApplication.id == id)
-    db_job_application = session.exec(query)
+    return await _update_application(
+        request, id, body.model_dump(exclude_unset=True), user, session, idempotency
+    )
 
-    if not db_job_application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job application not found",
-        )
 
-    if db_job_application.user_id != user.id:
+@router.patch(
+    "/{id}",
+    response_model=JobApplicationRead,
+)
+async def patch_application(
+    request: Request,
+    id: Annotated[str, Path()],
+    body: Annotated[JobApplicationUpdate, Body()],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    idempotency: Idempotency = Depends(idempotency),
+):
+    return await _update_application(
+        request, id, body.model_dump(exclude_unset=True), user, session, idempotency
+    )
+
+
+async def _update_application(
+    request: Request,
+    id: str,
+    values: dict,
+    user: UserPrincipal,
+    session: AsyncSession,
+    idempotency: Idempotency,
+):
+    expected_version = _if_match_version(request)
+
+    replayed = await idempotency.begin(session, user.id)
+    if replayed is not None:
+        return replayed
+
+    updated = await update_job_application(
+        session, id, user.id, values, version=expected_version
+    )
+    if updated is None:
+        await session.rollback()
+        raise await _update_failed(session, id, user)
+
+    job_application = updated.application
+
+    changes = ApplicationChanges(user.id)
+    changes.updated(job_application.id, updated.previous_status, values)
+    await changes.flush(session)
+
+    response = PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=job_application,
+        headers=_application_cache_headers(job_application),
+        adapter=job_application_adapter,
+    )
+    await idempotency.complete(response)
+    await session.commit()
+
+    return response
+
+
+def _if_match_version(request: Request) -> int | None:
+    header = request.headers.get("if-match")
+    if header is None or header.strip() == "*":
+        return None
+
+    # If-Match uses the strong comparison, so weak validators never match.
+    try:
+        return int(header.strip().removeprefix('"').removesuffix('"'))
+    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied",
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="If-Match must be a single application ETag",
         )
 
-    job_application_data = body.model_dump(exclude_unset=True)
-
-    for key, value in job_application_data.items():
-        setattr(db_job_application, key, value)
 
-    session.add(db_job_application)
-    session.commit()
-    session.refresh(db_job_application)
+async def _update_failed(
+    session: AsyncSession,
+    id: str,
+    user: UserPrincipal,
+) -> HTTPException:
+    # Only reached when the conditional UPDATE matched nothing, so the extra
+    # lookup is paid by failed writes rather than by every update.
+    query = (
+        select(JobApplication.version)
+        .where(JobApplication.id == id)
+        .where(JobApplication.user_id == str(user.id))
+        .where(not_deleted())
+    )
+    version = (await session.exec(query)).first()
 
-    obj = jsonable_encoder(JobApplicationRead.model_validate(db_job_application))
+    if version is None:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job application not found",
+        )
 
-    return JSONResponse(status_code=status.HTTP_200_OK, content=obj)
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Job application was modified by another request",
+        headers={"ETag": _application_etag(version)},
+    )
 
 
 @router.delete(
     "/{id}",
-    response_model=dict,
+    status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_application(
     id: Annotated[str, Path()],
-    user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ):
-    query = select(JobApplication).where(JobApplication.id == id)
-    job_application = session.exec(query).first()
-    if not job_application:
+    statement = delete_applications_statement(
+        JobApplication.id == id,
+        JobApplication.user_id == user.id,
+    )
+    deleted = (await session.exec(statement)).first()
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job application not found",
         )
 
-    if job_application.user_id != user.id:
+    changes = ApplicationChanges(user.id)
+    changes.deleted(*deleted)
+    await changes.flush(session)
+    await session.commit()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/{id}/restore",
+    response_model=JobApplicationRead,
+)
+async def restore_application(
+    id: Annotated[str, Path()],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    statement = restore_application_statement(
+        JobApplication.id == id,
+        JobApplication.user_id == user.id,
+    )
+    job_application = (await session.exec(statement)).scalar()
+    if job_application is None:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Deleted job application not found",
         )
 
-    session.delete(job_application)
-    session.commit()
+    changes = ApplicationChanges(user.id)
+    changes.restored(job_application)
+    await changes.flush(session)
+    await session.commit()
 
-    return JSONResponse(
-        status_code=status.HTTP_204_NO_CONTENT,
-        content={},
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=job_application,
+        headers=_application_cache_headers(job_application),
+        adapter=job_application_adapter,
     )
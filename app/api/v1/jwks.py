@@ -0,0 +1,17 @@
+from fastapi import APIRouter, status
+from fastapi.responses import Response
+
+from app.api.responses import PydanticJSONResponse
+from app.utils.tags import ApplicationTags
+from app.utils.token import token_keys
+
+router = APIRouter(tags=[ApplicationTags.auth])
+
+
+@router.get("/.well-known/jwks.json", status_code=status.HTTP_200_OK)
+async def jwks() -> Response:
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=token_keys.jwks(),
+        headers={"Cache-Control": "public, max-age=300"},
+    )
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse, Response
+
+from app.core.metrics import registry
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(tags=[ApplicationTags.metrics])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request, status
+from fastapi.params import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.filtration import JobApplicationsFiltration
+from app.api.pagination import OffsetPagination
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.models.job_application import (
+    JobApplicationSearchResult,
+    search_result_list_adapter,
+)
+from app.core.models.user import UserPrincipal
+from app.db.base import get_session
+from app.db.search import search_statement, search_terms
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/search",
+    tags=[ApplicationTags.applications],
+)
+
+
+@router.get(
+    "",
+    response_model=list[JobApplicationSearchResult],
+)
+async def search_applications(
+    request: Request,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    pagination: Annotated[
+        OffsetPagination,
+        Depends(OffsetPagination),
+    ],
+    filtration: Annotated[
+        JobApplicationsFiltration,
+        Depends(JobApplicationsFiltration),
+    ],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    terms = search_terms(q)
+    if not terms:
+        return PydanticJSONResponse(status_code=status.HTTP_200_OK, content=[])
+
+    query = filtration.apply(search_statement(session, user.id, terms))
+    query = query.offset(pagination.offset).limit(pagination.limit + 1)
+    rows = (await session.exec(query)).all()
+
+    results = [
+        {**application.model_dump(), "rank": rank}
+        for application, rank in rows[: pagination.limit]
+    ]
+
+    headers = {}
+    if len(rows) > pagination.limit:
+        url = request.url.include_query_params(
+            offset=pagination.offset + pagination.limit
+        )
+        headers["Link"] = f'<{url}>; rel="next"'
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=results,
+        headers=headers,
+        adapter=search_result_list_adapter,
+    )
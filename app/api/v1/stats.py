@@ -0,0 +1,48 @@
+from fastapi import APIRouter, status
+from fastapi.params import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.models.user import UserPrincipal
+from app.db.base import get_session
+from app.db.stats import read_stats, rebuild_stats
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/stats",
+    tags=[ApplicationTags.applications],
+)
+
+
+@router.get("")
+async def get_stats(
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=await read_stats(session, user.id),
+    )
+
+
+@router.get("/verify")
+async def verify_stats(
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=await rebuild_stats(session, user.id),
+    )
+
+
+@router.post("/repair")
+async def repair_stats(
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=await rebuild_stats(session, user.id, repair=True),
+    )
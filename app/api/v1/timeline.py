@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.params import Depends, Path
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.models.job_application import (
+    JobApplicationEventRead,
+    event_list_adapter,
+)
+from app.core.models.user import UserPrincipal
+from app.db.base import get_session
+from app.db.models.event import JobApplicationEvent
+from app.db.models.job_application import JobApplication, not_deleted
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    tags=[ApplicationTags.applications],
+)
+
+
+def naive_utc(moment: datetime | None) -> datetime | None:
+    # Events are stored as naive UTC; aware bounds such as "...Z" are
+    # converted so they compare with the stored values.
+    if moment is None or moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@router.get(
+    "/{id}/timeline",
+    response_model=list[JobApplicationEventRead],
+)
+async def get_application_timeline(
+    id: Annotated[str, Path(max_length=55)],
+    since: datetime | None = None,
+    until: datetime | None = None,
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    since, until = naive_utc(since), naive_utc(until)
+    application_query = (
+        select(JobApplication.id, JobApplication.applied_at)
+        .where(JobApplication.id == id)
+        .where(JobApplication.user_id == str(user.id))
+        .where(not_deleted())
+    )
+    application = (await session.exec(application_query)).first()
+    if application is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job application not found",
+        )
+
+    # No event predates the application, so bounding occurred_at by its
+    # creation lets Postgres prune every older monthly partition.
+    application_id, applied_at = application
+    query = (
+        select(JobApplicationEvent)
+        .where(JobApplicationEvent.application_id == application_id)
+        .where(
+            col(JobApplicationEvent.occurred_at) >= max(applied_at, since or applied_at)
+        )
+        .order_by(col(JobApplicationEvent.occurred_at), col(JobApplicationEvent.id))
+    )
+    if until:
+        query = query.where(col(JobApplicationEvent.occurred_at) < until)
+
+    events = (await session.exec(query)).all()
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=events,
+        adapter=event_list_adapter,
+    )
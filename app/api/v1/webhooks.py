@@ -0,0 +1,107 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.params import Body, Depends, Path
+from pydantic import TypeAdapter
+from sqlalchemy import delete
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.responses import PydanticJSONResponse
+from app.api.v1.job_applications import get_current_user
+from app.core.models.user import UserPrincipal
+from app.core.models.webhook import WebhookCreate, WebhookCreated, WebhookRead
+from app.core.webhooks import UnsafeWebhookURL, resolve_webhook_url
+from app.db.base import get_session
+from app.db.models.outbox import Webhook
+from app.db.outbox import current_sequence
+from app.utils.tags import ApplicationTags
+
+router = APIRouter(
+    prefix="/webhooks",
+    tags=[ApplicationTags.changes],
+)
+
+webhook_created_adapter = TypeAdapter(WebhookCreated)
+webhook_list_adapter = TypeAdapter(list[WebhookRead])
+
+
+@router.post(
+    "",
+    response_model=WebhookCreated,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_webhook(
+    body: Annotated[WebhookCreate, Body()],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    try:
+        await resolve_webhook_url(str(body.url))
+    except UnsafeWebhookURL as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+
+    # Deliveries start with the next change; earlier ones are available from
+    # GET /changes. The secret is only ever returned here.
+    webhook = Webhook(
+        user_id=user.id,
+        url=str(body.url),
+        secret=body.secret or secrets.token_urlsafe(32),
+        last_sequence=await current_sequence(session, user.id),
+    )
+    session.add(webhook)
+    await session.commit()
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content=webhook,
+        adapter=webhook_created_adapter,
+    )
+
+
+@router.get(
+    "",
+    response_model=list[WebhookRead],
+)
+async def get_webhooks(
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    query = (
+        select(Webhook)
+        .where(Webhook.user_id == user.id)
+        .order_by(col(Webhook.created_at))
+    )
+    webhooks = (await session.exec(query)).all()
+
+    return PydanticJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=webhooks,
+        adapter=webhook_list_adapter,
+    )
+
+
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_webhook(
+    id: Annotated[str, Path(max_length=55)],
+    user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    statement = (
+        delete(Webhook)
+        .where(col(Webhook.id) == id)
+        .where(col(Webhook.user_id) == user.id)
+    )
+    result = await session.exec(statement)
+    if not result.rowcount:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Webhook not found",
+        )
+    await session.commit()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,111 @@
+import asyncio
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.base import engine
+from app.db.changes import commit_listeners
+from app.db.models.outbox import OutboxEvent
+from app.db.outbox import read_outbox_events
+
+
+class Subscriber:
+    def __init__(self, user_id: UUID, sequence: int) -> None:
+        self.user_id = user_id
+        self.sequence = sequence
+        # None marks the end of the stream.
+        self.queue: asyncio.Queue[OutboxEvent | None] = asyncio.Queue()
+
+
+class ChangeFeed:
+    # Fans outbox events out to the change streams connected to this worker.
+    # One poll reads the new events of every subscribed user in a single
+    # query; local commits wake it immediately, other workers' commits are
+    # seen on the next interval.
+
+    def __init__(
+        self,
+        interval: float = settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        queue_size: int = settings.CHANGE_STREAM_QUEUE_SIZE,
+    ) -> None:
+        self.interval = interval
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.subscribers: dict[UUID, set[Subscriber]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+
+    def subscribe(self, user_id: UUID, sequence: int) -> Subscriber:
+        subscriber = Subscriber(user_id, sequence)
+        self.subscribers.setdefault(user_id, set()).add(subscriber)
+        self._wake_up()
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        subscribers = self.subscribers.get(subscriber.user_id)
+        if subscribers is None:
+            return
+
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self.subscribers[subscriber.user_id]
+
+    def notify(self, user_ids: set[UUID]) -> None:
+        if not user_ids.isdisjoint(self.subscribers):
+            self._wake_up()
+
+    def _wake_up(self) -> None:
+        # Commits made outside the feed's loop, such as sync sessions in other
+        # threads, are picked up on the next interval instead.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is self._loop:
+            self._wake.set()
+
+    async def poll(self) -> None:
+        # The event belongs to the loop the feed runs on; an application
+        # restarted in the same process starts a new one.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop, self._wake = loop, asyncio.Event()
+
+        try:
+            await asyncio.wait_for(self._wake.wait(), self.interval)
+        except TimeoutError:
+            pass
+        self._wake.clear()
+
+        while self.subscribers:
+            cursors = {
+                user_id: min(subscriber.sequence for subscriber in subscribers)
+                for user_id, subscribers in self.subscribers.items()
+            }
+            async with AsyncSession(engine) as session:
+                events = await read_outbox_events(session, cursors, self.batch_size)
+
+            for event in events:
+                for subscriber in list(self.subscribers.get(event.user_id, ())):
+                    if event.sequence > subscriber.sequence:
+                        self._deliver(subscriber, event)
+
+            if len(events) < self.batch_size:
+                return
+
+    def _deliver(self, subscriber: Subscriber, event: OutboxEvent) -> None:
+        # A client that stops reading is disconnected rather than buffered
+        # without bound; it resumes from its last event id.
+        if subscriber.queue.qsize() >= self.queue_size:
+            self.unsubscribe(subscriber)
+            subscriber.queue.put_nowait(None)
+            return
+
+        subscriber.queue.put_nowait(event)
+        subscriber.sequence = event.sequence
+
+
+change_feed = ChangeFeed()
+commit_listeners.append(change_feed.notify)
@@ -11,6 +11,117 @@ class Settings(BaseSettings):
     HASH_ALGORITHM: str = os.environ.get("HASH_ALGORITHM", "md5")
     HASH_KEY: str = os.environ.get("HASH_KEY", "key")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", 10)
+    JWT_PRIVATE_KEY_FILE: str | None = os.environ.get("JWT_PRIVATE_KEY_FILE", None)
+    JWT_KEY_ID: str | None = os.environ.get("JWT_KEY_ID", None)
+    JWT_JWKS_FILE: str | None = os.environ.get("JWT_JWKS_FILE", None)
+    TOKEN_CACHE_MAX_SIZE: int = os.environ.get("TOKEN_CACHE_MAX_SIZE", 10_000)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", 30)
+    REVOCATION_REFRESH_SECONDS: float = os.environ.get("REVOCATION_REFRESH_SECONDS", 5)
+    REVOCATION_INDEX_CAPACITY: int = os.environ.get(
+        "REVOCATION_INDEX_CAPACITY", 100_000
+    )
+
+    DB_ECHO: bool = os.environ.get("DB_ECHO", False)
+    DB_POOL_SIZE: int = os.environ.get("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW: int = os.environ.get("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT: float = os.environ.get("DB_POOL_TIMEOUT", 30)
+    DB_POOL_RECYCLE: int = os.environ.get("DB_POOL_RECYCLE", 1800)
+    DB_POOL_PRE_PING: bool = os.environ.get("DB_POOL_PRE_PING", True)
+    DB_STATEMENT_TIMEOUT_MS: int | None = os.environ.get(
+        "DB_STATEMENT_TIMEOUT_MS", None
+    )
+    DB_EXTERNAL_POOLER: bool = os.environ.get("DB_EXTERNAL_POOLER", False)
+
+    HEALTH_PROBE_INTERVAL_SECONDS: float = os.environ.get(
+        "HEALTH_PROBE_INTERVAL_SECONDS", 5
+    )
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = os.environ.get(
+        "HEALTH_PROBE_TIMEOUT_SECONDS", 2
+    )
+    HEALTH_POOL_SATURATION_THRESHOLD: float = os.environ.get(
+        "HEALTH_POOL_SATURATION_THRESHOLD", 0.9
+    )
+
+    BCRYPT_ROUNDS: int = os.environ.get("BCRYPT_ROUNDS", 12)
+    HASH_POOL: str = os.environ.get("HASH_POOL", "thread")
+    HASH_WORKERS: int | None = os.environ.get("HASH_WORKERS", None)
+    HASH_QUEUE_LIMIT: int = os.environ.get("HASH_QUEUE_LIMIT", 64)
+
+    BULK_MAX_ITEMS: int = os.environ.get("BULK_MAX_ITEMS", 100_000)
+    BULK_CHUNK_SIZE: int = os.environ.get("BULK_CHUNK_SIZE", 1_000)
+    BULK_MAX_BYTES: int = os.environ.get("BULK_MAX_BYTES", 64 * 1024 * 1024)
+    EXPORT_BATCH_SIZE: int = os.environ.get("EXPORT_BATCH_SIZE", 1_000)
+    BATCH_GET_MAX_IDS: int = os.environ.get("BATCH_GET_MAX_IDS", 100)
+
+    SOFT_DELETE: bool = os.environ.get("SOFT_DELETE", False)
+    PURGE_INTERVAL_SECONDS: float = os.environ.get("PURGE_INTERVAL_SECONDS", 60)
+    PURGE_BATCH_SIZE: int = os.environ.get("PURGE_BATCH_SIZE", 500)
+    PURGE_RETENTION_SECONDS: float = os.environ.get("PURGE_RETENTION_SECONDS", 86_400)
+
+    EVENT_PARTITION_INTERVAL_SECONDS: float = os.environ.get(
+        "EVENT_PARTITION_INTERVAL_SECONDS", 3600
+    )
+    EVENT_PARTITION_MONTHS_AHEAD: int = os.environ.get(
+        "EVENT_PARTITION_MONTHS_AHEAD", 3
+    )
+    EVENT_RETENTION_MONTHS: int = os.environ.get("EVENT_RETENTION_MONTHS", 24)
+
+    IDEMPOTENCY_TTL_SECONDS: float = os.environ.get("IDEMPOTENCY_TTL_SECONDS", 86_400)
+
+    OUTBOX_POLL_INTERVAL_SECONDS: float = os.environ.get(
+        "OUTBOX_POLL_INTERVAL_SECONDS", 1
+    )
+    OUTBOX_BATCH_SIZE: int = os.environ.get("OUTBOX_BATCH_SIZE", 500)
+    OUTBOX_RETENTION_SECONDS: float = os.environ.get(
+        "OUTBOX_RETENTION_SECONDS", 7 * 86_400
+    )
+    CHANGE_STREAM_HEARTBEAT_SECONDS: float = os.environ.get(
+        "CHANGE_STREAM_HEARTBEAT_SECONDS", 15
+    )
+    CHANGE_STREAM_QUEUE_SIZE: int = os.environ.get("CHANGE_STREAM_QUEUE_SIZE", 1_000)
+
+    WEBHOOK_POLL_INTERVAL_SECONDS: float = os.environ.get(
+        "WEBHOOK_POLL_INTERVAL_SECONDS", 1
+    )
+    WEBHOOK_BATCH_SIZE: int = os.environ.get("WEBHOOK_BATCH_SIZE", 100)
+    WEBHOOK_CONCURRENCY: int = os.environ.get("WEBHOOK_CONCURRENCY", 20)
+    WEBHOOK_TIMEOUT_SECONDS: float = os.environ.get("WEBHOOK_TIMEOUT_SECONDS", 5)
+    WEBHOOK_LEASE_SECONDS: float = os.environ.get("WEBHOOK_LEASE_SECONDS", 30)
+    WEBHOOK_BACKOFF_BASE_SECONDS: float = os.environ.get(
+        "WEBHOOK_BACKOFF_BASE_SECONDS", 1
+    )
+    WEBHOOK_BACKOFF_MAX_SECONDS: float = os.environ.get(
+        "WEBHOOK_BACKOFF_MAX_SECONDS", 3600
+    )
+    WEBHOOK_MAX_ATTEMPTS: int = os.environ.get("WEBHOOK_MAX_ATTEMPTS", 12)
+    # Comma-separated hosts that may resolve to private addresses, such as an
+    # internal receiver; every other webhook host must be publicly routable.
+    WEBHOOK_ALLOWED_HOSTS: str = os.environ.get("WEBHOOK_ALLOWED_HOSTS", "")
+
+    RATE_LIMIT_ENABLED: bool = os.environ.get("RATE_LIMIT_ENABLED", True)
+    RATE_LIMIT_BACKEND: str = os.environ.get("RATE_LIMIT_BACKEND", "local")
+    RATE_LIMIT_SHARDS: int = os.environ.get("RATE_LIMIT_SHARDS", 64)
+    RATE_LIMIT_MAX_KEYS: int = os.environ.get("RATE_LIMIT_MAX_KEYS", 100_000)
+    RATE_LIMIT_AUTH_PER_MINUTE: float = os.environ.get("RATE_LIMIT_AUTH_PER_MINUTE", 10)
+    RATE_LIMIT_AUTH_BURST: int = os.environ.get("RATE_LIMIT_AUTH_BURST", 5)
+    RATE_LIMIT_BULK_PER_MINUTE: float = os.environ.get("RATE_LIMIT_BULK_PER_MINUTE", 30)
+    RATE_LIMIT_BULK_BURST: int = os.environ.get("RATE_LIMIT_BULK_BURST", 5)
+    RATE_LIMIT_API_PER_SECOND: float = os.environ.get("RATE_LIMIT_API_PER_SECOND", 20)
+    RATE_LIMIT_API_BURST: int = os.environ.get("RATE_LIMIT_API_BURST", 40)
+
+    LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "DEBUG")
+    LOG_JSON: bool = os.environ.get("LOG_JSON", True)
+    LOG_DEBUG_RATE: float = os.environ.get("LOG_DEBUG_RATE", 100)
+    LOG_QUEUE_SIZE: int = os.environ.get("LOG_QUEUE_SIZE", 10_000)
+
+    METRICS_DIR: str | None = os.environ.get("METRICS_DIR", None)
+    METRICS_FLUSH_INTERVAL_SECONDS: float = os.environ.get(
+        "METRICS_FLUSH_INTERVAL_SECONDS", 5
+    )
+
+    USER_CACHE_BACKEND: str = os.environ.get("USER_CACHE_BACKEND", "local")
+    USER_CACHE_TTL_SECONDS: float = os.environ.get("USER_CACHE_TTL_SECONDS", 60)
+    USER_CACHE_MAX_SIZE: int = os.environ.get("USER_CACHE_MAX_SIZE", 10_000)
 
     class Config:
         env_file = ".env"
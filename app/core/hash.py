@@ -1,11 +1,101 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.core.metrics import password_hash_seconds
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password, hashed_password):
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password):
     return pwd_context.hash(password)
+
+
+def _timed(fn, *args):
+    started_at = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started_at
+
+
+class HashingServiceBusy(Exception):
+    pass
+
+
+class HashingService:
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        queue_limit: int = 64,
+        pool: str = "thread",
+    ) -> None:
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.pool = pool
+        self.pending = 0
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.pool == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="hashing",
+                )
+        return self._executor
+
+    async def _run(self, operation: str, fn, *args):
+        if self.pending >= self.queue_limit:
+            raise HashingServiceBusy()
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(
+                self.executor, _timed, fn, *args
+            )
+        finally:
+            self.pending -= 1
+
+        password_hash_seconds.observe(elapsed, operation=operation)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        return await self._run(
+            "verify", verify_and_update_password, password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hashing_service = HashingService(
+    max_workers=settings.HASH_WORKERS,
+    queue_limit=settings.HASH_QUEUE_LIMIT,
+    pool=settings.HASH_POOL,
+)
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from functools import cache
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.hash import hashing_service
+from app.db.base import engine
+from app.db.engine import engines
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class ProbeResult:
+    def __init__(
+        self,
+        name: str,
+        healthy: bool,
+        latency_ms: float,
+        details: dict | None = None,
+    ) -> None:
+        self.name = name
+        self.healthy = healthy
+        self.latency_ms = latency_ms
+        self.details = details or {}
+        self.checked_at = time.time()
+
+    def as_dict(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "latency_ms": round(self.latency_ms, 3),
+            "checked_at": self.checked_at,
+            **self.details,
+        }
+
+
+class Probe:
+    def __init__(self, name: str, check, critical: bool = True) -> None:
+        self.name = name
+        self.check = check
+        self.critical = critical
+
+    async def run(self, timeout: float) -> ProbeResult:
+        started_at = time.perf_counter()
+        try:
+            healthy, details = await asyncio.wait_for(self.check(), timeout)
+        except asyncio.TimeoutError:
+            healthy, details = False, {"error": f"timed out after {timeout}s"}
+        except Exception as e:
+            healthy, details = False, {"error": f"{type(e).__name__}: {e}"}
+
+        latency_ms = (time.perf_counter() - started_at) * 1000
+        return ProbeResult(self.name, healthy, latency_ms, details)
+
+
+class HealthMonitor:
+    # Probes run on a background interval and requests only read the cached
+    # results, so however often load balancers poll, they never open
+    # database connections themselves.
+
+    def __init__(self, probes: list[Probe], interval: float, timeout: float) -> None:
+        self.probes = probes
+        self.interval = interval
+        self.timeout = timeout
+        self.results: dict[str, ProbeResult] = {}
+        self.last_run_at: float | None = None
+
+    async def run(self) -> None:
+        results = await asyncio.gather(
+            *(probe.run(self.timeout) for probe in self.probes)
+        )
+        self.results = {result.name: result for result in results}
+        self.last_run_at = time.time()
+
+    @property
+    def stale(self) -> bool:
+        # Three missed intervals mean the probe loop itself is stuck.
+        if self.last_run_at is None:
+            return False
+        return time.time() - self.last_run_at > 3 * (self.interval + self.timeout)
+
+    @property
+    def live(self) -> bool:
+        return not self.stale
+
+    @property
+    def ready(self) -> bool:
+        if self.last_run_at is None or self.stale:
+            return False
+        return all(
+            self.results[probe.name].healthy
+            for probe in self.probes
+            if probe.critical and probe.name in self.results
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "live": self.live,
+            "ready": self.ready,
+            "last_run_at": self.last_run_at,
+            "probes": {name: result.as_dict() for name, result in self.results.items()},
+        }
+
+
+async def check_database():
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    return True, {}
+
+
+async def check_pool():
+    pool = engines.async_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return True, {"pool": pool.status()}
+
+    capacity = pool.size() + settings.DB_MAX_OVERFLOW
+    saturation = pool.checkedout() / capacity if capacity else 0.0
+    return saturation < settings.HEALTH_POOL_SATURATION_THRESHOLD, {
+        "checked_out": pool.checkedout(),
+        "capacity": capacity,
+        "saturation": round(saturation, 3),
+    }
+
+
+@cache
+def migration_heads() -> frozenset[str]:
+    # Revision files don't change while the process runs.
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    return frozenset(ScriptDirectory.from_config(config).get_heads())
+
+
+async def check_migrations():
+    async with engine.connect() as connection:
+        current = set(
+            await connection.run_sync(
+                lambda sync: MigrationContext.configure(sync).get_current_heads()
+            )
+        )
+
+    heads = migration_heads()
+    details = {"current": sorted(current), "head": sorted(heads)}
+    # Schemas created by init_db() rather than alembic carry no version.
+    if not current:
+        return True, {**details, "managed": False}
+    return current == heads, details
+
+
+async def check_hashing():
+    pending = hashing_service.pending
+    return pending < hashing_service.queue_limit, {
+        "pending": pending,
+        "queue_limit": hashing_service.queue_limit,
+    }
+
+
+health_monitor = HealthMonitor(
+    probes=[
+        Probe("database", check_database),
+        Probe("database_pool", check_pool),
+        Probe("migrations", check_migrations),
+        Probe("hashing_queue", check_hashing, critical=False),
+    ],
+    interval=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+    timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,355 @@
+import fcntl
+import json
+import math
+import os
+import threading
+from contextvars import ContextVar
+from pathlib import Path
+
+from app.core.config import settings
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+# Metrics are aggregated per process. Besides the event loop thread, the sync
+# pool events and the hashing executor update them from worker threads, so
+# each metric guards its samples with a lock. Workers share their numbers by
+# writing snapshots that the scraped worker merges.
+
+# Counters and histograms of exited workers are folded into this snapshot.
+DEAD_SNAPSHOT = "dead"
+
+
+class Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.samples: dict[tuple, object] = {}
+        self.lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(label, "")) for label in self.labelnames)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return self.snapshot_unlocked()
+
+    def snapshot_unlocked(self) -> dict:
+        return {
+            "type": self.type,
+            "help": self.documentation,
+            "labelnames": self.labelnames,
+            "samples": [
+                [list(key), list(value) if isinstance(value, list) else value]
+                for key, value in self.samples.items()
+            ],
+        }
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self.samples[key] = self.samples.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self.samples[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self.samples[key] = self.samples.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets=DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self.lock:
+            sample = self.samples.get(key)
+            if sample is None:
+                sample = self.samples[key] = [0] * len(self.buckets) + [0, 0.0]
+
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    sample[index] += 1
+            sample[-2] += 1
+            sample[-1] += value
+
+    def snapshot_unlocked(self) -> dict:
+        return {**super().snapshot_unlocked(), "buckets": self.buckets}
+
+
+class MetricsRegistry:
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = Path(directory) if directory else None
+        self.metrics: dict[str, Metric] = {}
+
+    def _register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets=DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> dict:
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def drain(self) -> dict:
+        snapshot = {}
+        for name, metric in self.metrics.items():
+            with metric.lock:
+                snapshot[name] = metric.snapshot_unlocked()
+                if metric.type != "gauge":
+                    metric.samples.clear()
+        return snapshot
+
+    def flush(self) -> None:
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        temporary.replace(path)
+
+    def collect(self) -> dict:
+        if self.directory is None:
+            return self.snapshot()
+
+        self.flush()
+        merged: dict = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            alive = path.stem.isdigit() and _process_alive(int(path.stem))
+            for name, metric in snapshot.items():
+                # Counters and histograms of exited workers still count towards
+                # the totals; their gauges describe state that no longer exists.
+                if metric["type"] == "gauge" and not alive:
+                    continue
+                _merge(merged, name, metric)
+        return merged
+
+    def mark_process_dead(self, pid: int) -> None:
+        # Folds the counters and histograms of an exited worker into one
+        # snapshot and removes its own, so restarts do not pile up files and a
+        # reused pid cannot overwrite them. Its gauges are dropped.
+        if self.directory is None:
+            return
+
+        path = self.directory / f"{pid}.json"
+        with open(self.directory / f"{DEAD_SNAPSHOT}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if pid == os.getpid():
+                # Taking the numbers out keeps later flushes of this process
+                # from counting them a second time.
+                snapshot = self.drain()
+            else:
+                try:
+                    snapshot = json.loads(path.read_text())
+                except (OSError, ValueError):
+                    return
+            dead = self.directory / f"{DEAD_SNAPSHOT}.json"
+            try:
+                merged = json.loads(dead.read_text())
+            except (OSError, ValueError):
+                merged = {}
+            for name, metric in snapshot.items():
+                if metric["type"] != "gauge":
+                    _merge(merged, name, metric)
+            temporary = dead.with_suffix(".tmp")
+            temporary.write_text(json.dumps(merged))
+            temporary.replace(dead)
+            path.unlink(missing_ok=True)
+
+    def render(self) -> str:
+        lines = []
+        for name, metric in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            labelnames = metric["labelnames"]
+            for key, value in metric["samples"]:
+                labels = dict(zip(labelnames, key))
+                if metric["type"] == "histogram":
+                    lines.extend(_render_histogram(name, labels, metric, value))
+                else:
+                    lines.append(f"{name}{_render_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge(merged: dict, name: str, metric: dict) -> None:
+    target = merged.setdefault(name, {**metric, "samples": []})
+    samples = {tuple(key): value for key, value in target["samples"]}
+
+    for key, value in metric["samples"]:
+        key = tuple(key)
+        current = samples.get(key)
+        if current is None:
+            samples[key] = value
+        elif metric["type"] == "histogram":
+            samples[key] = [a + b for a, b in zip(current, value)]
+        else:
+            samples[key] = current + value
+
+    target["samples"] = [[list(key), value] for key, value in samples.items()]
+
+
+def _render_histogram(name: str, labels: dict, metric: dict, value: list):
+    for bound, count in zip(metric["buckets"], value):
+        bucket_labels = {**labels, "le": _number(bound)}
+        yield f"{name}_bucket{_render_labels(bucket_labels)} {count}"
+    yield f'{name}_bucket{_render_labels({**labels, "le": "+Inf"})} {value[-2]}'
+    yield f"{name}_count{_render_labels(labels)} {value[-2]}"
+    yield f"{name}_sum{_render_labels(labels)} {_number(value[-1])}"
+
+
+def _render_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+
+request_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+registry = MetricsRegistry(settings.METRICS_DIR)
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests handled",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled",
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request",
+    "Database statements executed per HTTP request",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+db_query_seconds_per_request = registry.histogram(
+    "db_query_seconds_per_request",
+    "Time spent executing database statements per HTTP request",
+    ("method", "route"),
+)
+db_pool_checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    ("engine",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+password_hash_seconds = registry.histogram(
+    "password_hash_seconds",
+    "CPU time of bcrypt hash and verify operations",
+    ("operation",),
+)
+jwt_decode_seconds = registry.histogram(
+    "jwt_decode_seconds",
+    "Access token decode and verification time",
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01),
+)
+jwt_claims_cache_total = registry.counter(
+    "jwt_claims_cache_total",
+    "Verified access token claims cache lookups",
+    ("result",),
+)
+user_cache_total = registry.counter(
+    "user_cache_total",
+    "Authenticated user cache lookups",
+    ("result",),
+)
+rate_limited_requests_total = registry.counter(
+    "rate_limited_requests_total",
+    "Requests rejected by the rate limiter",
+    ("rule",),
+)
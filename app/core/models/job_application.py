@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 from sqlmodel import SQLModel
 
 from app.db.models.job_application import JobApplicationStatus
@@ -22,3 +22,38 @@ class JobApplicationRead(SQLModel):
     url: str | None
     applied_at: datetime
     updated_at: datetime | None
+
+
+class JobApplicationSearchResult(JobApplicationRead):
+    rank: float
+
+
+class JobApplicationEventRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    from_status: JobApplicationStatus | None
+    to_status: JobApplicationStatus
+    occurred_at: datetime
+
+
+class JobApplicationUpdate(BaseModel):
+    company: str | None = None
+    status: JobApplicationStatus | None = None
+    url: str | None = None
+
+    @field_validator("company", "status")
+    @classmethod
+    def not_null(cls, value):
+        if value is None:
+            raise ValueError("Field may be omitted but not set to null")
+        return value
+
+
+class JobApplicationBulkUpdate(JobApplicationUpdate):
+    id: UUID
+
+
+job_application_adapter = TypeAdapter(JobApplicationRead)
+job_application_list_adapter = TypeAdapter(list[JobApplicationRead])
+search_result_list_adapter = TypeAdapter(list[JobApplicationSearchResult])
+event_list_adapter = TypeAdapter(list[JobApplicationEventRead])
@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class UserPrincipal(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    username: str
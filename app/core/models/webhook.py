@@ -0,0 +1,26 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+
+
+class WebhookCreate(BaseModel):
+    url: HttpUrl
+    secret: str | None = Field(default=None, min_length=16, max_length=255)
+
+
+class WebhookRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    url: str
+    active: bool
+    last_sequence: int
+    attempts: int
+    next_attempt_at: datetime
+    last_error: str | None
+    created_at: datetime
+
+
+class WebhookCreated(WebhookRead):
+    secret: str
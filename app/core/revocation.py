@@ -0,0 +1,47 @@
+import time
+
+from app.core.config import settings
+from app.utils.bloom import BloomFilter
+
+
+class RevocationIndex:
+    # Revoked session ids mirrored from the revoked_sessions table. Nearly
+    # every lookup is for a live session, which the Bloom filter rejects
+    # without touching the exact set; positives are confirmed against it.
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.bloom = BloomFilter(capacity)
+        self.revoked: dict[str, float] = {}
+
+    def add(self, session_id: str, expires_at: float) -> None:
+        self.revoked[session_id] = expires_at
+        self.bloom.add(session_id)
+
+    def is_revoked(self, session_id: str | None) -> bool:
+        if session_id is None or session_id not in self.bloom:
+            return False
+
+        expires_at = self.revoked.get(session_id)
+        return expires_at is not None and expires_at > time.time()
+
+    def merge(self, entries: dict[str, float]) -> None:
+        # Bloom filters can't forget keys, so expired entries are dropped by
+        # rebuilding. Live entries already known are kept, including those
+        # mirrored while ``entries`` was being read: revocations are never
+        # undone, only outlived.
+        now = time.time()
+        merged = {
+            session_id: expires_at
+            for session_id, expires_at in self.revoked.items()
+            if expires_at > now
+        }
+        merged.update(entries)
+
+        bloom = BloomFilter(max(self.capacity, len(merged)))
+        for session_id in merged:
+            bloom.add(session_id)
+        self.bloom, self.revoked = bloom, merged
+
+
+revocation_index = RevocationIndex(settings.REVOCATION_INDEX_CAPACITY)
@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+PRIVATE_JWK_MEMBERS = {"d", "p", "q", "dp", "dq", "qi"}
+
+
+class TokenKeys:
+    def __init__(
+        self,
+        algorithm: str,
+        secret: str,
+        private_key_file: str | None = None,
+        key_id: str | None = None,
+        jwks_file: str | None = None,
+    ) -> None:
+        self.algorithm = algorithm
+        self.secret = secret
+        self.key_id = key_id
+        self.private_key = None
+        # kid -> (public key, algorithm); binding the algorithm to the key
+        # keeps a token from choosing how it gets verified.
+        self.public_keys: dict[str | None, tuple] = {}
+        self.public_jwks: list[dict] = []
+
+        if jwks_file:
+            self._load_jwks(Path(jwks_file))
+        if private_key_file:
+            self._load_private_key(Path(private_key_file))
+
+    @property
+    def symmetric(self) -> bool:
+        return self.algorithm in SYMMETRIC_ALGORITHMS
+
+    @property
+    def signing_key(self):
+        if self.symmetric:
+            return self.secret
+        if self.private_key is None:
+            raise RuntimeError(
+                f"{self.algorithm} tokens require JWT_PRIVATE_KEY_FILE to be set"
+            )
+        return self.private_key
+
+    @property
+    def headers(self) -> dict | None:
+        return {"kid": self.key_id} if self.key_id else None
+
+    def verification_key(self, token: str) -> tuple:
+        if self.symmetric:
+            return self.secret, self.algorithm
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None and len(self.public_keys) == 1:
+            kid = next(iter(self.public_keys))
+
+        try:
+            return self.public_keys[kid]
+        except KeyError:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+
+    def jwks(self) -> dict:
+        return {"keys": self.public_jwks}
+
+    def _load_jwks(self, path: Path) -> None:
+        for jwk in json.loads(path.read_text())["keys"]:
+            # Shared secrets never belong in a published key set.
+            if jwk.get("kty") == "oct":
+                continue
+
+            algorithm = jwk.get("alg", self.algorithm)
+            key = jwt.PyJWK(jwk, algorithm).key
+            self.public_keys[jwk.get("kid")] = (_public_key(key), algorithm)
+            self.public_jwks.append(
+                {
+                    name: value
+                    for name, value in jwk.items()
+                    if name not in PRIVATE_JWK_MEMBERS
+                }
+            )
+
+    def _load_private_key(self, path: Path) -> None:
+        from cryptography.hazmat.primitives.serialization import (
+            load_pem_private_key,
+        )
+
+        self.private_key = load_pem_private_key(path.read_bytes(), password=None)
+        if self.key_id in self.public_keys:
+            return
+
+        # Without a JWKS entry for the signing key, the service verifies its
+        # own tokens with the public half and publishes it.
+        public_key = self.private_key.public_key()
+        self.public_keys[self.key_id] = (public_key, self.algorithm)
+
+        jwk = get_default_algorithms()[self.algorithm].to_jwk(public_key, as_dict=True)
+        jwk.update(alg=self.algorithm, use="sig")
+        if self.key_id:
+            jwk["kid"] = self.key_id
+        self.public_jwks.append(jwk)
+
+
+def _public_key(key):
+    return key.public_key() if hasattr(key, "public_key") else key
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.core.metrics import user_cache_total
+from app.core.models.user import UserPrincipal
+from app.db.models.user import User
+from app.utils.cache import CacheStats, InMemorySharedStore, LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class LocalUserCacheBackend:
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._cache = LRUCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, username: str) -> UserPrincipal | None:
+        return self._cache.get(username)
+
+    async def set(self, username: str, principal: UserPrincipal) -> None:
+        self._cache.set(username, principal)
+
+    def invalidate(self, username: str) -> None:
+        self._cache.delete(username)
+
+
+class SharedUserCacheBackend:
+    def __init__(self, store, ttl: float, prefix: str = "user-principal:") -> None:
+        self.store = store
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, username: str) -> UserPrincipal | None:
+        value = await self.store.get(self.prefix + username)
+        if value is None:
+            return None
+        return UserPrincipal.model_validate_json(value)
+
+    async def set(self, username: str, principal: UserPrincipal) -> None:
+        await self.store.set(
+            self.prefix + username,
+            principal.model_dump_json().encode(),
+            self.ttl,
+        )
+
+    def invalidate(self, username: str) -> None:
+        # ORM events fire synchronously inside flush, so the delete is scheduled
+        # on the running loop rather than awaited. Sync sessions, as used by
+        # scripts and migrations, have no loop and run the delete to completion.
+        delete = self.store.delete(self.prefix + username)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(delete)
+        else:
+            loop.create_task(delete)
+
+
+class UserCache:
+    def __init__(self, backend) -> None:
+        self.backend = backend
+        self.stats = CacheStats()
+
+    async def get(self, username: str) -> UserPrincipal | None:
+        principal = await self.backend.get(username)
+        if principal is None:
+            self.stats.misses += 1
+            user_cache_total.inc(result="miss")
+        else:
+            self.stats.hits += 1
+            user_cache_total.inc(result="hit")
+        return principal
+
+    async def set(self, principal: UserPrincipal) -> None:
+        await self.backend.set(principal.username, principal)
+
+    def invalidate(self, username: str) -> None:
+        self.backend.invalidate(username)
+
+
+def create_user_cache(shared_store=None) -> UserCache:
+    # The shared backend needs a store every worker talks to, with async
+    # ``get``, ``set(key, value, ttl)`` and ``delete`` such as a Redis client.
+    # Without one it falls back to the in-process fake, so each worker keeps
+    # its own copy.
+    if settings.USER_CACHE_BACKEND == "shared":
+        if shared_store is None:
+            logger.warning(
+                "USER_CACHE_BACKEND=shared without a shared store, "
+                "users are cached per process"
+            )
+            shared_store = InMemorySharedStore()
+        backend = SharedUserCacheBackend(
+            shared_store,
+            ttl=settings.USER_CACHE_TTL_SECONDS,
+        )
+    else:
+        backend = LocalUserCacheBackend(
+            max_size=settings.USER_CACHE_MAX_SIZE,
+            ttl=settings.USER_CACHE_TTL_SECONDS,
+        )
+
+    return UserCache(backend)
+
+
+user_cache = create_user_cache()
+
+CHANGED_USERNAMES = "changed_usernames"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User) -> None:
+    # Dropped at flush, and again once the change is committed: a request
+    # that read the old row in between would otherwise cache it until the
+    # TTL runs out.
+    history = inspect(target).attrs.username.history
+    usernames = {target.username, *(history.deleted or ())}
+    for username in usernames:
+        user_cache.invalidate(username)
+
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(CHANGED_USERNAMES, set()).update(usernames)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_users(session: Session) -> None:
+    for username in session.info.pop(CHANGED_USERNAMES, ()):
+        user_cache.invalidate(username)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def forget_changed_users(session: Session, previous_transaction) -> None:
+    session.info.pop(CHANGED_USERNAMES, None)
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import random
+import socket
+
+import httpx
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.base import engine
+from app.db.models.outbox import Webhook
+from app.db.outbox import (
+    claim_due_webhooks,
+    deactivate_webhook,
+    outbox_event_json,
+    read_outbox_events,
+    record_webhook_delivery,
+    record_webhook_failure,
+)
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+
+
+def sign(secret: str, body: bytes) -> str:
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+class UnsafeWebhookURL(ValueError):
+    pass
+
+
+def is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address)
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def resolve_webhook_url(url: str) -> str | None:
+    # Webhook URLs are chosen by users, so they must not reach loopback,
+    # link-local or private addresses from inside the network. Returns the
+    # address to connect to, or None for hosts on WEBHOOK_ALLOWED_HOSTS.
+    parsed = httpx.URL(url)
+    allowed = {
+        host.strip().lower()
+        for host in settings.WEBHOOK_ALLOWED_HOSTS.split(",")
+        if host.strip()
+    }
+    if parsed.host.lower() in allowed:
+        return None
+
+    try:
+        addresses = await asyncio.get_running_loop().getaddrinfo(
+            parsed.host, None, type=socket.SOCK_STREAM
+        )
+    except OSError:
+        raise UnsafeWebhookURL(f"Webhook host {parsed.host} does not resolve")
+
+    resolved = [address[4][0] for address in addresses]
+    if not resolved or not all(map(is_public_address, resolved)):
+        raise UnsafeWebhookURL(
+            f"Webhook host {parsed.host} resolves to a non-public address"
+        )
+    return resolved[0]
+
+
+def retry_delay(
+    attempts: int,
+    base: float = settings.WEBHOOK_BACKOFF_BASE_SECONDS,
+    maximum: float = settings.WEBHOOK_BACKOFF_MAX_SECONDS,
+) -> float:
+    # Exponential backoff with jitter, so endpoints coming back up are not
+    # hit by every worker's retries at the same moment.
+    return min(maximum, base * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+
+
+class WebhookDispatcher:
+    # Delivers each webhook's pending outbox events in order, as batches of
+    # at most batch_size. A webhook only advances once its endpoint answers
+    # 2xx, so delivery is at least once and receivers dedupe by sequence.
+
+    def __init__(
+        self,
+        batch_size: int = settings.WEBHOOK_BATCH_SIZE,
+        concurrency: int = settings.WEBHOOK_CONCURRENCY,
+        timeout: float = settings.WEBHOOK_TIMEOUT_SECONDS,
+    ) -> None:
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def run(self) -> None:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            webhooks = await claim_due_webhooks(session, self.concurrency)
+
+        if webhooks:
+            await asyncio.gather(*(self.deliver(webhook) for webhook in webhooks))
+
+    async def deliver(self, webhook: Webhook) -> None:
+        async with AsyncSession(engine) as session:
+            events = await read_outbox_events(
+                session, {webhook.user_id: webhook.last_sequence}, self.batch_size
+            )
+            # Sequences are gapless, so a claimed webhook that finds no events,
+            # or not the next one, lost events to pruning. Skipping ahead would
+            # hide that from the receiver; it is stopped so its owner resyncs
+            # from the change feed and registers it again.
+            if not events or events[0].sequence > webhook.last_sequence + 1:
+                logger.warning(
+                    "Webhook %s missed events after %s",
+                    webhook.id,
+                    webhook.last_sequence,
+                )
+                await deactivate_webhook(
+                    session,
+                    webhook.id,
+                    f"Events after sequence {webhook.last_sequence} were pruned "
+                    "before delivery; resync from GET /api/v1/changes",
+                )
+                return
+
+        body = json.dumps(
+            {
+                "webhook_id": str(webhook.id),
+                "events": [outbox_event_json(event) for event in events],
+            }
+        ).encode()
+
+        url = httpx.URL(webhook.url)
+        headers = {
+            "Content-Type": "application/json",
+            SIGNATURE_HEADER: sign(webhook.secret, body),
+        }
+        extensions = {}
+        try:
+            # The host is resolved again for every delivery, since DNS may
+            # have changed since registration. The request then goes to the
+            # checked address, so a second lookup cannot swap it; Host and
+            # SNI keep the original name for routing and certificates.
+            address = await resolve_webhook_url(webhook.url)
+            if address is not None:
+                headers["Host"] = url.netloc.decode("ascii")
+                extensions["sni_hostname"] = url.host
+                url = url.copy_with(host=address)
+
+            response = await self.client.post(
+                url, content=body, headers=headers, extensions=extensions
+            )
+            response.raise_for_status()
+        except (httpx.HTTPError, UnsafeWebhookURL) as e:
+            logger.warning("Webhook %s delivery failed: %s", webhook.id, e)
+            async with AsyncSession(engine) as session:
+                await record_webhook_failure(
+                    session, webhook, str(e), retry_delay(webhook.attempts + 1)
+                )
+            return
+
+        async with AsyncSession(engine) as session:
+            await record_webhook_delivery(session, webhook.id, events[-1].sequence)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+webhook_dispatcher = WebhookDispatcher()
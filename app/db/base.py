@@ -1,16 +1,34 @@
-from sqlmodel import Session, SQLModel, create_engine
+import time
 
-from app.core.config import settings
+from sqlalchemy import event
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-database_url = settings.DATABASE_URL
+from app.core.metrics import request_query_stats
+from app.db.engine import engines
 
-engine = create_engine(database_url, echo=True)
+engine = engines.async_engine
 
 
-def init_db():
-    SQLModel.metadata.create_all(engine)
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def start_query_timer(connection, cursor, statement, parameters, context, executemany):
+    connection.info.setdefault("query_started_at", []).append(time.perf_counter())
 
 
-def get_session():
-    with Session(engine) as session:
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def record_query_time(connection, cursor, statement, parameters, context, executemany):
+    started_at = connection.info["query_started_at"].pop()
+    stats = request_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started_at
+
+
+async def init_db():
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+
+
+async def get_session():
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
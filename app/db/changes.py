@@ -0,0 +1,148 @@
+import json
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.models.job_application import JobApplicationRead
+from app.db.models.event import JobApplicationEvent
+from app.db.models.job_application import JobApplication, JobApplicationStatus
+from app.db.models.outbox import OutboxEvent
+from app.db.stats import StatsDelta, apply_stats_delta
+from app.db.versions import bump_collection_version
+from app.utils.concurrency import read_flights
+
+CHANGED_USERS = "changed_user_ids"
+
+# Called after commit with the ids of users whose applications changed.
+commit_listeners: list[Callable[[set[UUID]], None]] = []
+
+
+class ApplicationChanges:
+    # Collects the job application writes of one request so that derived data
+    # is written in the same transaction as the rows themselves.
+
+    def __init__(self, user_id: UUID) -> None:
+        self.user_id = user_id
+        self.stats = StatsDelta()
+        self.events: list[dict] = []
+        self.outbox: list[dict] = []
+        self.changed = False
+
+    def created(self, application: JobApplication) -> None:
+        self.changed = True
+        self.stats.add(application.status, application.applied_at)
+        self._event(application.id, None, application.status, application.applied_at)
+        self._publish(
+            "application.created",
+            application.id,
+            JobApplicationRead.model_validate(application).model_dump(mode="json"),
+        )
+
+    def updated(
+        self,
+        id: UUID,
+        previous_status: JobApplicationStatus,
+        values: dict,
+    ) -> None:
+        self.changed = True
+        if "status" in values:
+            self.stats.change_status(previous_status, values["status"])
+            if values["status"] != previous_status:
+                self._event(id, previous_status, values["status"])
+        self._publish("application.updated", id, {"id": id, **values})
+
+    def deleted(
+        self,
+        id: UUID,
+        status: JobApplicationStatus,
+        applied_at: datetime,
+    ) -> None:
+        self.changed = True
+        self.stats.remove(status, applied_at)
+        self._publish("application.deleted", id, {"id": id})
+
+    def restored(self, application: JobApplication) -> None:
+        self.changed = True
+        self.stats.add(application.status, application.applied_at)
+        self._publish(
+            "application.restored",
+            application.id,
+            JobApplicationRead.model_validate(application).model_dump(mode="json"),
+        )
+
+    def _event(
+        self,
+        id: UUID,
+        from_status: JobApplicationStatus | None,
+        to_status: JobApplicationStatus,
+        occurred_at: datetime | None = None,
+    ) -> None:
+        self.events.append(
+            JobApplicationEvent(
+                occurred_at=occurred_at or datetime.utcnow(),
+                application_id=id,
+                user_id=self.user_id,
+                from_status=from_status,
+                to_status=to_status,
+            ).model_dump()
+        )
+
+    def _publish(self, type: str, id: UUID, payload: dict) -> None:
+        self.outbox.append(
+            {
+                "user_id": self.user_id,
+                "type": type,
+                "application_id": id,
+                "payload": json.dumps(to_jsonable_python(payload)),
+                "created_at": datetime.utcnow(),
+            }
+        )
+
+    async def flush(self, session: AsyncSession) -> None:
+        if not self.changed:
+            return
+
+        # Each outbox event takes one collection version as its sequence. The
+        # version row is locked before the counters, so a stats repair that
+        # locks it first never misses a concurrent increment.
+        version = await bump_collection_version(
+            session, self.user_id, datetime.utcnow(), increment=len(self.outbox)
+        )
+        await apply_stats_delta(session, self.user_id, self.stats)
+        if self.events:
+            await session.exec(insert(JobApplicationEvent), params=self.events)
+        first = version - len(self.outbox) + 1
+        await session.exec(
+            insert(OutboxEvent),
+            params=[
+                {**row, "sequence": first + index}
+                for index, row in enumerate(self.outbox)
+            ],
+        )
+        session.info.setdefault(CHANGED_USERS, set()).add(self.user_id)
+        self.stats = StatsDelta()
+        self.events = []
+        self.outbox = []
+        self.changed = False
+
+
+@event.listens_for(Session, "after_commit")
+def announce_changes(session: Session) -> None:
+    # Reads that start after the commit must not join a query that began
+    # before it, and the change feed can pick up the new events right away.
+    user_ids = session.info.pop(CHANGED_USERS, set())
+    for user_id in user_ids:
+        read_flights.forget(user_id)
+    if user_ids:
+        for listener in commit_listeners:
+            listener(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_users(session: Session) -> None:
+    session.info.pop(CHANGED_USERS, None)
@@ -1,27 +1,25 @@
-import psycopg2
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.core.config import settings
+from app.db.engine import engines
 
-engine = create_engine(settings.DATABASE_URL)
+engine = engines.sync_engine
 
 
 class PostgresConnectionManager:
-    def __init__(
-        self,
-        connection_params=settings.DATABASE_URL,
-    ):
-        self.connection_params = connection_params
+    def __init__(self, engine=engine):
+        self.engine = engine
         self.connection = None
 
     def __enter__(self):
-        self.connection = psycopg2.connect(**self.connection_params)
+        self.connection = self.engine.raw_connection()
         return self.connection
 
     def __exit__(self, exc_type, exc_value, traceback):
         if self.connection:
-            self.connection.commit()
+            if exc_type is not None:
+                self.connection.rollback()
+            else:
+                self.connection.commit()
             self.connection.close()
 
 
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.models.job_application import JobApplication, not_deleted
+
+
+def delete_applications_statement(*criteria):
+    # One statement both checks ownership and removes the rows; RETURNING
+    # hands back what the status counters need without another SELECT.
+    if settings.SOFT_DELETE:
+        statement = update(JobApplication).values(
+            deleted_at=datetime.utcnow(),
+            version=JobApplication.version + 1,
+        )
+    else:
+        statement = delete(JobApplication)
+
+    return (
+        statement.where(*criteria, not_deleted())
+        .returning(JobApplication.id, JobApplication.status, JobApplication.applied_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def restore_application_statement(*criteria):
+    # Only soft-deleted rows can come back; purged ones are gone for good.
+    return (
+        update(JobApplication)
+        .values(deleted_at=None, version=JobApplication.version + 1)
+        .where(*criteria, col(JobApplication.deleted_at).is_not(None))
+        .returning(JobApplication)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def purge_deleted_applications(
+    session: AsyncSession,
+    batch_size: int = settings.PURGE_BATCH_SIZE,
+    retention_seconds: float = settings.PURGE_RETENTION_SECONDS,
+) -> int:
+    cutoff = datetime.utcnow() - timedelta(seconds=retention_seconds)
+    purged = 0
+
+    # Each batch is its own short transaction, so the purge never holds row
+    # locks on job_applications for longer than one bounded DELETE. Rows that
+    # another transaction has locked are skipped until the next run.
+    while True:
+        batch = (
+            select(JobApplication.id)
+            .where(col(JobApplication.deleted_at) < cutoff)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.exec(
+            delete(JobApplication).where(col(JobApplication.id).in_(batch))
+        )
+        await session.commit()
+
+        purged += result.rowcount
+        if result.rowcount < batch_size:
+            return purged
@@ -0,0 +1,10 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def dialect_insert(session: AsyncSession, model):
+    # INSERT ... ON CONFLICT is dialect specific; both supported backends
+    # share the same on_conflict_do_update() interface.
+    if session.bind.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
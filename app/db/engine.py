@@ -0,0 +1,156 @@
+import time
+from uuid import uuid4
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import db_pool_checkout_wait_seconds
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+class PoolMetrics:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+        db_pool_checkout_wait_seconds.observe(seconds, engine=self.name)
+
+    def as_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+
+def timed_pool_class(pool_class: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    # Pools are re-instantiated on dispose(), so the metrics live on the class.
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return pool_class._do_get(self)
+        finally:
+            self.metrics.observe(time.perf_counter() - started)
+
+    return type(
+        f"Timed{pool_class.__name__}",
+        (pool_class,),
+        {"metrics": metrics, "_do_get": _do_get, "__module__": pool_class.__module__},
+    )
+
+
+def get_async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend in ASYNC_DRIVERS:
+        url = url.set(drivername=ASYNC_DRIVERS[backend])
+
+    return url.render_as_string(hide_password=False)
+
+
+class EngineRegistry:
+    def __init__(self, database_url: str = settings.DATABASE_URL) -> None:
+        self.database_url = database_url
+        self.metrics = {"async": PoolMetrics("async"), "sync": PoolMetrics("sync")}
+        self._async_engine: AsyncEngine | None = None
+        self._sync_engine: Engine | None = None
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        if self._async_engine is None:
+            url = get_async_database_url(self.database_url)
+            self._async_engine = create_async_engine(
+                url,
+                echo=settings.DB_ECHO,
+                **self._engine_options(url, AsyncAdaptedQueuePool, "async"),
+            )
+        return self._async_engine
+
+    @property
+    def sync_engine(self) -> Engine:
+        if self._sync_engine is None:
+            self._sync_engine = create_engine(
+                self.database_url,
+                echo=settings.DB_ECHO,
+                **self._engine_options(self.database_url, QueuePool, "sync"),
+            )
+        return self._sync_engine
+
+    def _engine_options(self, database_url: str, pool_class: type[Pool], name: str):
+        url = make_url(database_url)
+        options = {"connect_args": self._connect_args(url.get_driver_name())}
+
+        in_memory = url.database in (None, "", ":memory:")
+        if url.get_backend_name() == "sqlite" and in_memory:
+            return options
+
+        if settings.DB_EXTERNAL_POOLER:
+            options["poolclass"] = NullPool
+            return options
+
+        options.update(
+            poolclass=timed_pool_class(pool_class, self.metrics[name]),
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+        return options
+
+    def _connect_args(self, driver: str) -> dict:
+        connect_args = {}
+        timeout = settings.DB_STATEMENT_TIMEOUT_MS
+
+        if driver == "asyncpg":
+            if timeout:
+                connect_args["server_settings"] = {"statement_timeout": str(timeout)}
+            if settings.DB_EXTERNAL_POOLER:
+                # Transaction-mode poolers hand each transaction to a different
+                # server connection, so named prepared statements can't be reused.
+                connect_args["statement_cache_size"] = 0
+                connect_args["prepared_statement_cache_size"] = 0
+                connect_args["prepared_statement_name_func"] = (
+                    lambda: f"__asyncpg_{uuid4()}__"
+                )
+        elif driver == "psycopg2" and timeout:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+
+        return connect_args
+
+    def pool_status(self) -> dict:
+        status = {}
+        for name, engine in (
+            ("async", self._async_engine),
+            ("sync", self._sync_engine),
+        ):
+            if engine is None:
+                continue
+            status[name] = {
+                "pool": engine.pool.status(),
+                **self.metrics[name].as_dict(),
+            }
+        return status
+
+    async def dispose(self) -> None:
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+        if self._sync_engine is not None:
+            self._sync_engine.dispose()
+
+
+engines = EngineRegistry()
@@ -0,0 +1,154 @@
+from datetime import datetime
+
+from sqlalchemy import delete, text
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.models.event import JobApplicationEvent
+
+PARTITION_PREFIX = "job_application_events_"
+DEFAULT_PARTITION = "job_application_events_default"
+
+
+def month_start(value: datetime, months: int = 0) -> datetime:
+    month = value.year * 12 + value.month - 1 + months
+    return datetime(month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y_%m}"
+
+
+async def maintain_event_partitions(
+    session: AsyncSession,
+    months_ahead: int = settings.EVENT_PARTITION_MONTHS_AHEAD,
+    retention_months: int = settings.EVENT_RETENTION_MONTHS,
+) -> tuple[list[str], list[str]]:
+    now = datetime.utcnow()
+    cutoff = month_start(now, -retention_months)
+
+    if session.bind.dialect.name != "postgresql":
+        # SQLite has no partitions; retention is a plain range delete.
+        await session.exec(
+            delete(JobApplicationEvent).where(
+                col(JobApplicationEvent.occurred_at) < cutoff
+            )
+        )
+        await session.commit()
+        return [], []
+
+    existing = set(
+        (
+            await session.exec(
+                text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE parent.relname = 'job_application_events'"
+                )
+            )
+        ).scalars()
+    )
+    await session.commit()
+
+    # Every partition change commits on its own, so one failure leaves the
+    # changes before it in place and locks are held for one change only.
+    created = []
+    for months in range(months_ahead + 1):
+        month = month_start(now, months)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        await _create_partition(
+            session,
+            name,
+            month,
+            month_start(month, 1),
+            has_default=DEFAULT_PARTITION in existing,
+        )
+        created.append(name)
+
+    # Dropping a partition is a catalog change, unlike deleting its rows,
+    # and leaves no dead tuples behind for vacuum.
+    dropped = []
+    for name in sorted(existing):
+        try:
+            month = datetime.strptime(name.removeprefix(PARTITION_PREFIX), "%Y_%m")
+        except ValueError:
+            continue
+        if month_start(month, 1) <= cutoff:
+            await session.exec(text(f"DROP TABLE IF EXISTS {name}"))
+            await session.commit()
+            dropped.append(name)
+
+    # Rows that landed in the default partition are never dropped with a
+    # month, so they are deleted once they fall out of retention.
+    if DEFAULT_PARTITION in existing:
+        await session.exec(
+            text(f"DELETE FROM {DEFAULT_PARTITION} WHERE occurred_at < :cutoff"),
+            params={"cutoff": cutoff},
+        )
+        await session.commit()
+
+    return created, dropped
+
+
+async def _create_partition(
+    session: AsyncSession,
+    name: str,
+    start: datetime,
+    end: datetime,
+    has_default: bool = True,
+) -> None:
+    bounds = {"start": start, "end": end}
+    in_range = "occurred_at >= :start AND occurred_at < :end"
+    partition = (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF job_application_events "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+    # Postgres refuses to create a partition while the default partition
+    # holds rows of its range. Those rows are written before the partition
+    # existed, so they are moved over with the default partition detached.
+    stranded = (
+        has_default
+        and (
+            await session.exec(
+                text(
+                    f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"
+                ),
+                params=bounds,
+            )
+        ).scalar()
+    )
+    if not stranded:
+        await session.exec(text(partition))
+        await session.commit()
+        return
+
+    await session.exec(
+        text(
+            "ALTER TABLE job_application_events "
+            f"DETACH PARTITION {DEFAULT_PARTITION}"
+        )
+    )
+    await session.exec(text(partition))
+    await session.exec(
+        text(
+            "INSERT INTO job_application_events "
+            f"SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"
+        ),
+        params=bounds,
+    )
+    await session.exec(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"),
+        params=bounds,
+    )
+    await session.exec(
+        text(
+            "ALTER TABLE job_application_events "
+            f"ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+        )
+    )
+    await session.commit()
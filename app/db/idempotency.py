@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.dialects import dialect_insert
+from app.db.models.idempotency import IdempotencyKey
+
+
+async def claim_idempotency_key(
+    session: AsyncSession,
+    user_id: UUID,
+    key: str,
+    fingerprint: str,
+    ttl_seconds: float = settings.IDEMPOTENCY_TTL_SECONDS,
+) -> IdempotencyKey | None:
+    # Returns None when this request now owns the key, or the stored row when
+    # another request already used it. The claim is part of the caller's
+    # transaction: a concurrent claim of the same key waits on the unique
+    # index until it commits, and a rollback releases the key again.
+    now = datetime.utcnow()
+    values = {
+        "user_id": user_id,
+        "key": key,
+        "fingerprint": fingerprint,
+        "created_at": now,
+        "expires_at": now + timedelta(seconds=ttl_seconds),
+    }
+    statement = dialect_insert(session, IdempotencyKey).values(**values)
+    statement = statement.on_conflict_do_update(
+        index_elements=["user_id", "key"],
+        set_={
+            **{name: statement.excluded[name] for name in values},
+            "status_code": None,
+            "headers": None,
+            "body": None,
+        },
+        where=col(IdempotencyKey.expires_at) <= now,
+    ).returning(IdempotencyKey.key)
+
+    if (await session.exec(statement)).first() is not None:
+        return None
+
+    query = (
+        select(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id)
+        .where(IdempotencyKey.key == key)
+    )
+    return (await session.exec(query)).first()
+
+
+async def record_idempotent_response(
+    session: AsyncSession,
+    user_id: UUID,
+    key: str,
+    status_code: int,
+    headers: str,
+    body: bytes,
+) -> None:
+    await session.exec(
+        update(IdempotencyKey)
+        .where(col(IdempotencyKey.user_id) == user_id)
+        .where(col(IdempotencyKey.key) == key)
+        .values(status_code=status_code, headers=headers, body=body)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def purge_idempotency_keys(session: AsyncSession) -> int:
+    result = await session.exec(
+        delete(IdempotencyKey).where(col(IdempotencyKey.expires_at) < datetime.utcnow())
+    )
+    await session.commit()
+    return result.rowcount
@@ -0,0 +1,12 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class JobApplicationCollectionVersion(SQLModel, table=True):
+    __tablename__: str = "job_application_collection_versions"
+
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
+    version: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
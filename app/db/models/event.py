@@ -0,0 +1,48 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DDL, Index, event
+from sqlmodel import Field, SQLModel
+
+from app.db.models.job_application import JobApplicationStatus
+from app.utils.ids import uuid7
+
+
+class JobApplicationEvent(SQLModel, table=True):
+    __tablename__: str = "job_application_events"
+    # Range partitioned by month on Postgres; the partition key has to be
+    # part of the primary key there.
+    __table_args__ = (
+        Index(
+            "ix_job_application_events_application_id_occurred_at",
+            "application_id",
+            "occurred_at",
+        ),
+        Index(
+            "ix_job_application_events_user_id_occurred_at",
+            "user_id",
+            "occurred_at",
+        ),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    occurred_at: datetime = Field(default_factory=datetime.utcnow, primary_key=True)
+    # No foreign key to job_applications: the history outlives purged rows
+    # and is only removed by dropping whole partitions.
+    application_id: UUID
+    user_id: UUID = Field(foreign_key="users.id")
+    from_status: JobApplicationStatus | None = Field(default=None)
+    to_status: JobApplicationStatus
+
+
+# Rows outside every monthly partition land here instead of failing the
+# write; the maintenance task creates partitions ahead so it stays empty.
+event.listen(
+    JobApplicationEvent.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE job_application_events_default "
+        "PARTITION OF job_application_events DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
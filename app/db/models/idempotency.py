@@ -0,0 +1,18 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyKey(SQLModel, table=True):
+    __tablename__: str = "idempotency_keys"
+
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
+    key: str = Field(primary_key=True, max_length=255)
+    fingerprint: str
+    # Empty until the request that claimed the key commits its response.
+    status_code: int | None = Field(default=None)
+    headers: str | None = Field(default=None)
+    body: bytes | None = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
@@ -1,8 +1,11 @@
 from datetime import datetime
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import DDL, Index, event, text
+from sqlmodel import Field, Relationship, SQLModel, col
+
+from app.utils.ids import uuid7
 
 
 class JobApplicationStatus(str, Enum):
@@ -14,18 +17,121 @@ class JobApplicationStatus(str, Enum):
 
 class JobApplication(SQLModel, table=True):
     __tablename__: str = "job_applications"
+    __table_args__ = (
+        Index("ix_job_applications_user_id_status", "user_id", "status"),
+        Index("ix_job_applications_user_id_updated_at", "user_id", "updated_at"),
+        Index(
+            "ix_job_applications_user_id_lower_company",
+            "user_id",
+            text("lower(company)"),
+        ),
+        Index(
+            "ix_job_applications_live_user_id_applied_at_id",
+            "user_id",
+            "applied_at",
+            "id",
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_job_applications_deleted_at",
+            "deleted_at",
+            sqlite_where=text("deleted_at IS NOT NULL"),
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     company: str = Field(default="Unknown")
     status: JobApplicationStatus = Field(default=JobApplicationStatus.REVIEWING)
     url: str | None = Field(max_length=255)
 
     applied_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime | None = Field(default_factory=datetime.utcnow)
+    version: int = Field(default=1)
+    deleted_at: datetime | None = Field(default=None)
 
     user_id: UUID | None = Field(default=None, foreign_key="users.id")
 
     user: "User" = Relationship(back_populates="job_applications")
 
 
+def not_deleted():
+    # Soft deleted rows stay in the table until purged; every read and write
+    # of live applications filters them out, which also lets the planner use
+    # the partial indexes above.
+    return col(JobApplication.deleted_at).is_(None)
+
+
+# asyncpg prepares every statement and a prepared statement holds a single
+# command, so the extension and the index are issued separately.
+event.listen(
+    JobApplication.__table__,
+    "after_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+event.listen(
+    JobApplication.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_job_applications_lower_company_trgm "
+        "ON job_applications USING gin (lower(company) gin_trgm_ops)"
+    ).execute_if(dialect="postgresql"),
+)
+
+# Full-text search. Postgres keeps a generated, weighted tsvector with a GIN
+# index; SQLite mirrors company and url into an FTS5 table through triggers.
+# Non-alphanumerics are folded to spaces so URL fragments become words.
+SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE job_applications ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', regexp_replace("
+        "coalesce(company, ''), '[^[:alnum:]]+', ' ', 'g')), 'A') || "
+        "setweight(to_tsvector('simple', regexp_replace("
+        "coalesce(url, ''), '[^[:alnum:]]+', ' ', 'g')), 'B')"
+        ") STORED",
+        "CREATE INDEX ix_job_applications_search_vector "
+        "ON job_applications USING gin (search_vector)",
+    ],
+    # The FTS5 table is keyed on search_id, an explicit integer column, since
+    # VACUUM may renumber the implicit rowids of a table without an INTEGER
+    # PRIMARY KEY. New rows take the next search_id in the insert trigger.
+    "sqlite": [
+        "ALTER TABLE job_applications ADD COLUMN search_id INTEGER",
+        "CREATE UNIQUE INDEX ix_job_applications_search_id "
+        "ON job_applications (search_id)",
+        "CREATE VIRTUAL TABLE job_applications_fts USING fts5("
+        "company, url, content='job_applications', content_rowid='search_id', "
+        "prefix='2 3')",
+        "CREATE TRIGGER job_applications_fts_insert "
+        "AFTER INSERT ON job_applications BEGIN "
+        "UPDATE job_applications SET search_id = ("
+        "SELECT coalesce(max(search_id), 0) + 1 FROM job_applications"
+        ") WHERE rowid = new.rowid AND new.search_id IS NULL; "
+        "INSERT INTO job_applications_fts(rowid, company, url) "
+        "SELECT search_id, company, url FROM job_applications "
+        "WHERE rowid = new.rowid; END",
+        "CREATE TRIGGER job_applications_fts_delete "
+        "AFTER DELETE ON job_applications BEGIN "
+        "INSERT INTO job_applications_fts(job_applications_fts, rowid, company, url) "
+        "VALUES ('delete', old.search_id, old.company, old.url); END",
+        "CREATE TRIGGER job_applications_fts_update "
+        "AFTER UPDATE OF company, url ON job_applications BEGIN "
+        "INSERT INTO job_applications_fts(job_applications_fts, rowid, company, url) "
+        "VALUES ('delete', old.search_id, old.company, old.url); "
+        "INSERT INTO job_applications_fts(rowid, company, url) "
+        "VALUES (new.search_id, new.company, new.url); END",
+    ],
+}
+
+for dialect, statements in SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(
+            JobApplication.__table__,
+            "after_create",
+            DDL(statement).execute_if(dialect=dialect),
+        )
+
+
 from app.db.models.user import User  # noqa
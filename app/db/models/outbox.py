@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+from app.utils.ids import uuid7
+
+
+class OutboxEvent(SQLModel, table=True):
+    __tablename__: str = "outbox_events"
+
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
+    # Per-user and gapless: the collection version right after the change.
+    sequence: int = Field(primary_key=True)
+    type: str
+    application_id: UUID
+    payload: str
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class Webhook(SQLModel, table=True):
+    __tablename__: str = "webhooks"
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id", index=True)
+    url: str = Field(max_length=2048)
+    secret: str
+    active: bool = Field(default=True)
+    # Highest sequence the endpoint has acknowledged.
+    last_sequence: int = Field(default=0)
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    last_error: str | None = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,22 @@
+from datetime import date
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+from app.db.models.job_application import JobApplicationStatus
+
+
+class JobApplicationStatusCount(SQLModel, table=True):
+    __tablename__: str = "job_application_status_counts"
+
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
+    status: JobApplicationStatus = Field(primary_key=True)
+    count: int = Field(default=0)
+
+
+class JobApplicationWeeklyCount(SQLModel, table=True):
+    __tablename__: str = "job_application_weekly_counts"
+
+    user_id: UUID = Field(foreign_key="users.id", primary_key=True)
+    week_start: date = Field(primary_key=True)
+    count: int = Field(default=0)
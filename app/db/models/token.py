@@ -0,0 +1,29 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+from app.utils.ids import uuid7
+
+
+class RefreshToken(SQLModel, table=True):
+    __tablename__: str = "refresh_tokens"
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    token_hash: str = Field(index=True, unique=True)
+    session_id: UUID = Field(index=True)
+    user_id: UUID = Field(foreign_key="users.id", index=True)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
+    rotated_at: datetime | None = Field(default=None)
+    revoked_at: datetime | None = Field(default=None)
+
+
+class RevokedSession(SQLModel, table=True):
+    __tablename__: str = "revoked_sessions"
+
+    session_id: UUID = Field(primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id")
+    revoked_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
@@ -0,0 +1,173 @@
+import json
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.models.collection_version import JobApplicationCollectionVersion
+from app.db.models.outbox import OutboxEvent, Webhook
+
+
+def outbox_event_json(event: OutboxEvent) -> dict:
+    return {
+        "sequence": event.sequence,
+        "type": event.type,
+        "application_id": str(event.application_id),
+        "occurred_at": event.created_at.isoformat(),
+        "data": json.loads(event.payload),
+    }
+
+
+async def read_outbox_events(
+    session: AsyncSession,
+    cursors: dict[UUID, int],
+    limit: int = settings.OUTBOX_BATCH_SIZE,
+) -> list[OutboxEvent]:
+    # Events after each user's cursor, read for all users in one statement;
+    # every branch is a range scan of the primary key.
+    query = (
+        select(OutboxEvent)
+        .where(
+            or_(
+                *(
+                    and_(
+                        OutboxEvent.user_id == user_id, OutboxEvent.sequence > sequence
+                    )
+                    for user_id, sequence in cursors.items()
+                )
+            )
+        )
+        .order_by(col(OutboxEvent.user_id), col(OutboxEvent.sequence))
+        .limit(limit)
+    )
+    return (await session.exec(query)).all()
+
+
+async def current_sequence(session: AsyncSession, user_id: UUID) -> int:
+    query = select(JobApplicationCollectionVersion.version).where(
+        JobApplicationCollectionVersion.user_id == user_id
+    )
+    return (await session.exec(query)).first() or 0
+
+
+async def missed_events(session: AsyncSession, user_id: UUID, since: int) -> bool:
+    # True when events after `since` were already pruned, or `since` was never
+    # issued; the client has to resynchronise instead of resuming.
+    current = await current_sequence(session, user_id)
+    if since > current:
+        return True
+
+    oldest = (
+        await session.exec(
+            select(func.min(OutboxEvent.sequence)).where(OutboxEvent.user_id == user_id)
+        )
+    ).first()
+    if oldest is None:
+        return since < current
+    return since < oldest - 1
+
+
+async def prune_outbox(
+    session: AsyncSession,
+    retention_seconds: float = settings.OUTBOX_RETENTION_SECONDS,
+) -> int:
+    cutoff = datetime.utcnow() - timedelta(seconds=retention_seconds)
+    result = await session.exec(
+        delete(OutboxEvent).where(col(OutboxEvent.created_at) < cutoff)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def claim_due_webhooks(
+    session: AsyncSession,
+    limit: int,
+    lease_seconds: float = settings.WEBHOOK_LEASE_SECONDS,
+) -> list[Webhook]:
+    # Webhooks behind their user's sequence are leased by pushing their next
+    # attempt into the future; the lease commits before any HTTP call, so no
+    # transaction stays open while an endpoint responds. Other workers skip
+    # the locked rows and a crashed worker's lease simply runs out.
+    now = datetime.utcnow()
+    sequence = (
+        select(JobApplicationCollectionVersion.version)
+        .where(JobApplicationCollectionVersion.user_id == Webhook.user_id)
+        .scalar_subquery()
+    )
+    due = (
+        select(Webhook.id)
+        .where(col(Webhook.active).is_(True))
+        .where(col(Webhook.next_attempt_at) <= now)
+        .where(col(Webhook.last_sequence) < sequence)
+        .order_by(col(Webhook.next_attempt_at))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(Webhook)
+        .where(col(Webhook.id).in_(due))
+        .values(next_attempt_at=now + timedelta(seconds=lease_seconds))
+        .returning(Webhook)
+        .execution_options(synchronize_session=False)
+    )
+    webhooks = (await session.exec(statement)).scalars().all()
+    await session.commit()
+    return webhooks
+
+
+async def record_webhook_delivery(
+    session: AsyncSession,
+    webhook_id: UUID,
+    sequence: int,
+) -> None:
+    await session.exec(
+        update(Webhook)
+        .where(col(Webhook.id) == webhook_id)
+        .values(
+            last_sequence=sequence,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+            last_error=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+async def record_webhook_failure(
+    session: AsyncSession,
+    webhook: Webhook,
+    error: str,
+    retry_in: float,
+    max_attempts: int = settings.WEBHOOK_MAX_ATTEMPTS,
+) -> None:
+    attempts = webhook.attempts + 1
+    await session.exec(
+        update(Webhook)
+        .where(col(Webhook.id) == webhook.id)
+        .values(
+            attempts=attempts,
+            active=attempts < max_attempts,
+            next_attempt_at=datetime.utcnow() + timedelta(seconds=retry_in),
+            last_error=error[:1000],
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+async def deactivate_webhook(
+    session: AsyncSession,
+    webhook_id: UUID,
+    error: str,
+) -> None:
+    await session.exec(
+        update(Webhook)
+        .where(col(Webhook.id) == webhook_id)
+        .values(active=False, last_error=error[:1000])
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
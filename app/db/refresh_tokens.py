@@ -0,0 +1,167 @@
+import secrets
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from uuid import UUID
+
+from sqlalchemy import delete, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.revocation import revocation_index
+from app.db.dialects import dialect_insert
+from app.db.models.token import RefreshToken, RevokedSession
+from app.db.models.user import User
+
+
+class RefreshTokenReused(Exception):
+    def __init__(self, revoked: list[RevokedSession]) -> None:
+        super().__init__("Refresh token was already rotated")
+        self.revoked = revoked
+
+
+class RotatedToken:
+    def __init__(
+        self,
+        user_id: UUID,
+        username: str,
+        session_id: UUID,
+        refresh_token: str,
+    ) -> None:
+        self.user_id = user_id
+        self.username = username
+        self.session_id = session_id
+        self.refresh_token = refresh_token
+
+
+def hash_token(token: str) -> str:
+    return sha256(token.encode()).hexdigest()
+
+
+def issue_refresh_token(session: AsyncSession, user_id: UUID, session_id: UUID) -> str:
+    token = secrets.token_urlsafe(32)
+    session.add(
+        RefreshToken(
+            token_hash=hash_token(token),
+            session_id=session_id,
+            user_id=user_id,
+            expires_at=datetime.utcnow()
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return token
+
+
+async def rotate_refresh_token(
+    session: AsyncSession,
+    token: str,
+) -> RotatedToken | None:
+    now = datetime.utcnow()
+    token_hash = hash_token(token)
+    username = (
+        select(User.username).where(User.id == RefreshToken.user_id).scalar_subquery()
+    )
+    statement = (
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == token_hash)
+        .where(col(RefreshToken.rotated_at).is_(None))
+        .where(col(RefreshToken.revoked_at).is_(None))
+        .where(RefreshToken.expires_at > now)
+        .values(rotated_at=now)
+        .returning(RefreshToken.user_id, RefreshToken.session_id, username)
+        .execution_options(synchronize_session=False)
+    )
+    row = (await session.exec(statement)).first()
+
+    if row is None:
+        # A rotated token presented again means it leaked: whoever holds the
+        # newer token may not be the user, so the whole session is revoked.
+        query = (
+            select(RefreshToken.user_id, RefreshToken.session_id)
+            .where(RefreshToken.token_hash == token_hash)
+            .where(col(RefreshToken.rotated_at).is_not(None))
+        )
+        reused = (await session.exec(query)).first()
+        if reused:
+            raise RefreshTokenReused(
+                await revoke_sessions(session, reused.user_id, [reused.session_id])
+            )
+        return None
+
+    user_id, session_id, username = row
+    refresh_token = issue_refresh_token(session, user_id, session_id)
+    return RotatedToken(user_id, username, session_id, refresh_token)
+
+
+async def revoke_sessions(
+    session: AsyncSession,
+    user_id: UUID,
+    session_ids: list[UUID] | None = None,
+) -> list[RevokedSession]:
+    now = datetime.utcnow()
+    statement = (
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id)
+        .where(col(RefreshToken.revoked_at).is_(None))
+        .values(revoked_at=now)
+        .returning(RefreshToken.session_id)
+        .execution_options(synchronize_session=False)
+    )
+    if session_ids is not None:
+        statement = statement.where(col(RefreshToken.session_id).in_(session_ids))
+
+    revoked_ids = set((await session.exec(statement)).scalars().all())
+    revoked_ids.update(session_ids or ())
+    if not revoked_ids:
+        return []
+
+    # Access tokens of a revoked session stay valid on paper until they
+    # expire, so the revocation only has to be remembered that long.
+    expires_at = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    revoked = [
+        RevokedSession(
+            session_id=session_id,
+            user_id=user_id,
+            revoked_at=now,
+            expires_at=expires_at,
+        )
+        for session_id in revoked_ids
+    ]
+    statement = dialect_insert(session, RevokedSession).values(
+        [revoked_session.model_dump() for revoked_session in revoked]
+    )
+    await session.exec(
+        statement.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_={"expires_at": statement.excluded.expires_at},
+        )
+    )
+    return revoked
+
+
+def mirror_revocations(revoked: list[RevokedSession]) -> None:
+    # Called after commit, so this worker rejects the tokens immediately;
+    # the others pick the rows up on their next reload.
+    for revoked_session in revoked:
+        revocation_index.add(
+            str(revoked_session.session_id),
+            _timestamp(revoked_session.expires_at),
+        )
+
+
+async def reload_revocations(session: AsyncSession) -> None:
+    now = datetime.utcnow()
+    await session.exec(delete(RevokedSession).where(RevokedSession.expires_at <= now))
+    await session.exec(delete(RefreshToken).where(RefreshToken.expires_at <= now))
+    await session.commit()
+
+    rows = await session.exec(
+        select(RevokedSession.session_id, RevokedSession.expires_at)
+    )
+    revocation_index.merge(
+        {str(session_id): _timestamp(expires_at) for session_id, expires_at in rows}
+    )
+
+
+def _timestamp(moment: datetime) -> float:
+    return moment.replace(tzinfo=timezone.utc).timestamp()
@@ -0,0 +1,50 @@
+import re
+
+from sqlalchemy import column, func, literal_column, table
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.models.job_application import JobApplication, not_deleted
+
+MAX_SEARCH_TERMS = 8
+
+# Same split as the indexed documents: runs of letters and digits.
+TERM_PATTERN = re.compile(r"[^\W_]+")
+
+search_vector = literal_column("job_applications.search_vector")
+fts = table("job_applications_fts", column("rowid"))
+fts_table = literal_column("job_applications_fts")
+
+
+def search_terms(text: str) -> list[str]:
+    return TERM_PATTERN.findall(text.lower())[:MAX_SEARCH_TERMS]
+
+
+def search_statement(session: AsyncSession, user_id, terms: list[str]):
+    # Every term is matched as a prefix, so partial words and URL fragments
+    # such as "acm" or "careers" still find "Acme" and ".../careers/123".
+    # Terms only ever contain letters and digits, which keeps both query
+    # syntaxes safe without escaping.
+    if session.bind.dialect.name == "postgresql":
+        query = func.to_tsquery(
+            literal_column("'simple'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms),
+        )
+        rank = func.ts_rank(search_vector, query)
+        statement = select(JobApplication, rank.label("rank")).where(
+            search_vector.op("@@")(query)
+        )
+    else:
+        # bm25() is lower for better matches and weighs company over url.
+        rank = -func.bm25(fts_table, 2.0, 1.0)
+        statement = (
+            select(JobApplication, rank.label("rank"))
+            .join(fts, fts.c.rowid == literal_column("job_applications.search_id"))
+            .where(fts_table.op("MATCH")(" AND ".join(f'"{t}"*' for t in terms)))
+        )
+
+    return (
+        statement.where(JobApplication.user_id == user_id)
+        .where(not_deleted())
+        .order_by(rank.desc(), col(JobApplication.id))
+    )
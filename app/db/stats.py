@@ -0,0 +1,163 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.dialects import dialect_insert
+from app.db.models.job_application import (
+    JobApplication,
+    JobApplicationStatus,
+    not_deleted,
+)
+from app.db.models.stats import JobApplicationStatusCount, JobApplicationWeeklyCount
+from app.db.versions import lock_collection_version
+
+
+def week_start(moment: datetime) -> date:
+    return (moment - timedelta(days=moment.weekday())).date()
+
+
+class StatsDelta:
+    def __init__(self) -> None:
+        self.statuses: Counter = Counter()
+        self.weeks: Counter = Counter()
+
+    def add(self, status: JobApplicationStatus, applied_at: datetime) -> None:
+        self.statuses[status] += 1
+        self.weeks[week_start(applied_at)] += 1
+
+    def remove(self, status: JobApplicationStatus, applied_at: datetime) -> None:
+        self.statuses[status] -= 1
+        self.weeks[week_start(applied_at)] -= 1
+
+    def change_status(
+        self,
+        previous: JobApplicationStatus,
+        current: JobApplicationStatus,
+    ) -> None:
+        if previous != current:
+            self.statuses[previous] -= 1
+            self.statuses[current] += 1
+
+
+async def _increment(session: AsyncSession, model, key: str, user_id, changes):
+    # Rows go in key order, so concurrent upserts for the same user lock
+    # their counters in the same order instead of deadlocking.
+    rows = [
+        {"user_id": user_id, key: value, "count": change}
+        for value, change in sorted(changes.items())
+        if change
+    ]
+    if not rows:
+        return
+
+    statement = dialect_insert(session, model).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["user_id", key],
+        set_={"count": model.count + statement.excluded.count},
+    )
+    await session.exec(statement)
+
+
+async def apply_stats_delta(session: AsyncSession, user_id: UUID, delta: StatsDelta):
+    await _increment(
+        session, JobApplicationStatusCount, "status", user_id, delta.statuses
+    )
+    await _increment(
+        session, JobApplicationWeeklyCount, "week_start", user_id, delta.weeks
+    )
+
+
+async def read_stats(session: AsyncSession, user_id: UUID) -> dict:
+    statuses = await session.exec(
+        select(JobApplicationStatusCount).where(
+            JobApplicationStatusCount.user_id == user_id
+        )
+    )
+    weeks = await session.exec(
+        select(JobApplicationWeeklyCount)
+        .where(JobApplicationWeeklyCount.user_id == user_id)
+        .where(JobApplicationWeeklyCount.count != 0)
+        .order_by(col(JobApplicationWeeklyCount.week_start))
+    )
+
+    by_status = {status.value: 0 for status in JobApplicationStatus}
+    for row in statuses:
+        by_status[row.status.value] = row.count
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "by_week": [
+            {"week_start": row.week_start.isoformat(), "count": row.count}
+            for row in weeks
+        ],
+    }
+
+
+async def rebuild_stats(
+    session: AsyncSession,
+    user_id: UUID,
+    repair: bool = False,
+) -> dict:
+    if repair:
+        # Writers lock the collection version row before their counters, so
+        # holding it keeps increments out until the counters are rewritten.
+        await lock_collection_version(session, user_id)
+
+    expected = StatsDelta()
+    rows = await session.stream(
+        select(JobApplication.status, JobApplication.applied_at)
+        .where(JobApplication.user_id == user_id)
+        .where(not_deleted())
+    )
+    async for status, applied_at in rows:
+        expected.add(status, applied_at)
+
+    stored = await read_stats(session, user_id)
+    stored_weeks = {
+        date.fromisoformat(week["week_start"]): week["count"]
+        for week in stored["by_week"]
+    }
+
+    differences = [
+        {
+            "status": status.value,
+            "stored": stored["by_status"][status.value],
+            "actual": expected.statuses[status],
+        }
+        for status in JobApplicationStatus
+        if stored["by_status"][status.value] != expected.statuses[status]
+    ] + [
+        {
+            "week_start": week.isoformat(),
+            "stored": stored_weeks.get(week, 0),
+            "actual": expected.weeks[week],
+        }
+        for week in sorted(set(stored_weeks) | set(expected.weeks))
+        if stored_weeks.get(week, 0) != expected.weeks[week]
+    ]
+
+    if repair and differences:
+        await session.exec(
+            delete(JobApplicationStatusCount).where(
+                col(JobApplicationStatusCount.user_id) == user_id
+            )
+        )
+        await session.exec(
+            delete(JobApplicationWeeklyCount).where(
+                col(JobApplicationWeeklyCount.user_id) == user_id
+            )
+        )
+        await apply_stats_delta(session, user_id, expected)
+    if repair:
+        await session.commit()
+
+    return {
+        "consistent": not differences,
+        "differences": differences,
+        "repaired": repair and bool(differences),
+    }
@@ -0,0 +1,100 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.models.job_application import (
+    JobApplication,
+    JobApplicationStatus,
+    not_deleted,
+)
+
+
+class UpdatedApplication:
+    def __init__(
+        self,
+        application: JobApplication,
+        previous_status: JobApplicationStatus,
+    ) -> None:
+        self.application = application
+        self.previous_status = previous_status
+
+
+def _matching(id, user_id: UUID, version: int | None) -> list:
+    conditions = [
+        JobApplication.id == id,
+        JobApplication.user_id == user_id,
+        not_deleted(),
+    ]
+    if version is not None:
+        conditions.append(JobApplication.version == version)
+    return conditions
+
+
+async def update_job_application(
+    session: AsyncSession,
+    id,
+    user_id: UUID,
+    values: dict,
+    version: int | None = None,
+) -> UpdatedApplication | None:
+    # None means no row matched: the application does not exist for this
+    # user, or ``version`` is no longer the current one.
+    if session.bind.dialect.name == "postgresql":
+        return await _update_from_locked(session, id, user_id, values, version)
+    return await _update_after_bump(session, id, user_id, values, version)
+
+
+async def _update_from_locked(session, id, user_id, values, version):
+    # One statement: the FROM subquery locks the row and, under READ COMMITTED,
+    # re-reads it after any concurrent writer commits, so ``old.status`` is the
+    # status this UPDATE replaces.
+    old = (
+        select(JobApplication.id, JobApplication.status)
+        .where(*_matching(id, user_id, version))
+        .with_for_update()
+        .subquery("old")
+    )
+    statement = (
+        update(JobApplication)
+        .where(JobApplication.id == old.c.id)
+        .values(
+            **values,
+            version=JobApplication.version + 1,
+            updated_at=datetime.utcnow(),
+        )
+        .returning(JobApplication, old.c.status)
+        .execution_options(synchronize_session=False)
+    )
+    updated = (await session.exec(statement)).first()
+    if updated is None:
+        return None
+    return UpdatedApplication(*updated)
+
+
+async def _update_after_bump(session, id, user_id, values, version):
+    # SQLite's RETURNING sees only the updated row, never a FROM subquery.
+    # Bumping the version first takes the database write lock and returns the
+    # untouched status; no other writer can run before the second UPDATE.
+    bump = (
+        update(JobApplication)
+        .where(*_matching(id, user_id, version))
+        .values(version=JobApplication.version + 1)
+        .returning(JobApplication.status)
+        .execution_options(synchronize_session=False)
+    )
+    previous_status = (await session.exec(bump)).scalar()
+    if previous_status is None:
+        return None
+
+    statement = (
+        update(JobApplication)
+        .where(JobApplication.id == id)
+        .values(**values, updated_at=datetime.utcnow())
+        .returning(JobApplication)
+        .execution_options(synchronize_session=False)
+    )
+    application = (await session.exec(statement)).scalar()
+    return UpdatedApplication(application, previous_status)
@@ -0,0 +1,52 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.dialects import dialect_insert
+from app.db.models.collection_version import JobApplicationCollectionVersion
+
+
+async def bump_collection_version(
+    session: AsyncSession,
+    user_id: UUID,
+    updated_at: datetime,
+    increment: int = 1,
+) -> int:
+    # The upsert locks the user's row until commit, so writers of one user
+    # take versions in commit order; the change feed uses them as sequences.
+    statement = dialect_insert(session, JobApplicationCollectionVersion).values(
+        user_id=user_id, version=increment, updated_at=updated_at
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={
+            "version": JobApplicationCollectionVersion.version + increment,
+            "updated_at": statement.excluded.updated_at,
+        },
+    ).returning(JobApplicationCollectionVersion.version)
+    return (await session.exec(statement)).scalar_one()
+
+
+async def get_collection_version(
+    session: AsyncSession,
+    user_id: UUID,
+) -> JobApplicationCollectionVersion | None:
+    query = select(JobApplicationCollectionVersion).where(
+        JobApplicationCollectionVersion.user_id == user_id
+    )
+    return (await session.exec(query)).first()
+
+
+async def lock_collection_version(session: AsyncSession, user_id: UUID) -> None:
+    # Takes the same row lock as a write without taking a version, so no
+    # sequence is skipped; the row is created if the user never wrote.
+    statement = dialect_insert(session, JobApplicationCollectionVersion).values(
+        user_id=user_id, version=0, updated_at=datetime.utcnow()
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={"version": JobApplicationCollectionVersion.version},
+    )
+    await session.exec(statement)
@@ -1,22 +1,151 @@
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.middleware import (
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestIdMiddleware,
+)
 from app.api.v1.auth import router as auth_router
+from app.api.v1.batch import router as batch_router
+from app.api.v1.bulk import router as bulk_router
+from app.api.v1.changes import router as changes_router
+from app.api.v1.export import router as export_router
 from app.api.v1.health import router as health_router
 from app.api.v1.job_applications import router as applications_router
-from app.db.base import init_db
+from app.api.v1.jwks import router as jwks_router
+from app.api.v1.metrics import router as metrics_router
+from app.api.v1.search import router as search_router
+from app.api.v1.stats import router as stats_router
+from app.api.v1.timeline import router as timeline_router
+from app.api.v1.webhooks import router as webhooks_router
+from app.core.change_feed import change_feed
+from app.core.config import settings
+from app.core.hash import hashing_service
+from app.core.health import health_monitor
+from app.core.metrics import registry
+from app.core.webhooks import webhook_dispatcher
+from app.db.base import engine, init_db
+from app.db.deletes import purge_deleted_applications
+from app.db.engine import engines
+from app.db.events import maintain_event_partitions
+from app.db.idempotency import purge_idempotency_keys
+from app.db.outbox import prune_outbox
+from app.db.refresh_tokens import reload_revocations
 from app.utils.logger import LoggerFactory
+from app.utils.tasks import PeriodicTask
 
-factory = LoggerFactory()
-logger = factory.create_logger(name="my_logger", filename="main.log")
+factory = LoggerFactory(
+    level=settings.LOG_LEVEL,
+    json_format=settings.LOG_JSON,
+    debug_rate=settings.LOG_DEBUG_RATE,
+    queue_size=settings.LOG_QUEUE_SIZE,
+)
+logger = factory.create_logger(name="app", filename="main.log")
+
+
+async def flush_metrics():
+    registry.flush()
+
+
+async def refresh_revocations():
+    async with AsyncSession(engine) as session:
+        await reload_revocations(session)
+
+
+async def purge_deleted():
+    async with AsyncSession(engine) as session:
+        purged = await purge_deleted_applications(session)
+    if purged:
+        logger.info("Purged %s deleted job applications", purged)
+
+
+async def purge_idempotency():
+    async with AsyncSession(engine) as session:
+        purged = await purge_idempotency_keys(session)
+    if purged:
+        logger.info("Purged %s expired idempotency keys", purged)
+
+
+async def purge_outbox():
+    async with AsyncSession(engine) as session:
+        purged = await prune_outbox(session)
+    if purged:
+        logger.info("Pruned %s outbox events", purged)
+
+
+async def maintain_events():
+    async with AsyncSession(engine) as session:
+        created, dropped = await maintain_event_partitions(session)
+    if created or dropped:
+        logger.info("Event partitions created %s, dropped %s", created, dropped)
 
 
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
-    init_db()
+    factory.start()
+    await init_db()
+
+    tasks = [
+        PeriodicTask(
+            "health-probes",
+            settings.HEALTH_PROBE_INTERVAL_SECONDS,
+            health_monitor.run,
+        ),
+        PeriodicTask(
+            "metrics-flush",
+            settings.METRICS_FLUSH_INTERVAL_SECONDS,
+            flush_metrics,
+        ),
+        PeriodicTask(
+            "soft-delete-purge",
+            settings.PURGE_INTERVAL_SECONDS,
+            purge_deleted,
+        ),
+        PeriodicTask(
+            "idempotency-purge",
+            settings.PURGE_INTERVAL_SECONDS,
+            purge_idempotency,
+        ),
+        PeriodicTask(
+            "revocation-reload",
+            settings.REVOCATION_REFRESH_SECONDS,
+            refresh_revocations,
+        ),
+        PeriodicTask(
+            "event-partitions",
+            settings.EVENT_PARTITION_INTERVAL_SECONDS,
+            maintain_events,
+        ),
+        # The feed waits for commits or its own poll interval between reads.
+        PeriodicTask("change-feed", 0, change_feed.poll),
+        PeriodicTask(
+            "webhook-dispatch",
+            settings.WEBHOOK_POLL_INTERVAL_SECONDS,
+            webhook_dispatcher.run,
+        ),
+        PeriodicTask(
+            "outbox-prune",
+            settings.PURGE_INTERVAL_SECONDS,
+            purge_outbox,
+        ),
+    ]
+    for task in tasks:
+        task.start()
+
     yield
-    print("clean up lifespan")
+
+    for task in tasks:
+        await task.stop()
+    await webhook_dispatcher.close()
+    registry.mark_process_dead(os.getpid())
+    await engines.dispose()
+    hashing_service.shutdown()
+    logger.info("Application has been shut down!")
+    factory.shutdown()
 
 
 def create_app():
@@ -30,8 +159,23 @@ def create_app():
 
     logger.info("Application has been instanced!")
 
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+
+    app.include_router(metrics_router)
+    app.include_router(jwks_router)
     app.include_router(auth_router, prefix="/api/v1")
     app.include_router(health_router, prefix="/api/v1")
+    app.include_router(batch_router, prefix="/api/v1")
+    app.include_router(bulk_router, prefix="/api/v1")
+    app.include_router(changes_router, prefix="/api/v1")
+    app.include_router(export_router, prefix="/api/v1")
+    app.include_router(stats_router, prefix="/api/v1")
+    app.include_router(search_router, prefix="/api/v1")
+    app.include_router(timeline_router, prefix="/api/v1")
+    app.include_router(webhooks_router, prefix="/api/v1")
     app.include_router(applications_router, prefix="/api/v1")
 
     logger.info("Routes as been registered!")
@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+# Settings are read when app.core.config is imported, so the test database and
+# a JWT-capable algorithm have to be in place before any app module loads.
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='app-tests-')}/test.db"
+)
+os.environ.setdefault("HASH_ALGORITHM", "HS256")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from uuid import uuid4  # noqa: E402
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    # app.main opens main.log in the working directory when it is imported.
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("logs"))
+    try:
+        from app.main import app
+    finally:
+        os.chdir(cwd)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    with TestClient(app) as client:
+        yield client
+
+
+def register(client: TestClient) -> dict:
+    credentials = {"username": f"user-{uuid4().hex}", "password": "password"}
+    client.post("/api/v1/register", data=credentials)
+    token = client.post("/api/v1/token", data=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def headers(client):
+    return register(client)
+
+
+@pytest.fixture
+def create_application(client, headers):
+    def create(company: str = "Acme", status: str = "reviewing") -> dict:
+        body = {"company": company, "status": status, "url": None}
+        response = client.post("/api/v1/", json=body, headers=headers)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
@@ -0,0 +1,95 @@
+import time
+from uuid import uuid4
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.api.v1.auth as auth_module
+from app.core.revocation import revocation_index
+from app.db.base import engine
+from app.db.refresh_tokens import reload_revocations
+
+
+def login(client, credentials: dict) -> dict:
+    response = client.post("/api/v1/token", data=credentials)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def refresh(client, tokens: dict):
+    return client.post(
+        "/api/v1/token/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+
+
+def authorized(client, tokens: dict) -> bool:
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    return client.get("/api/v1/", headers=headers).status_code == 200
+
+
+def new_user(client) -> dict:
+    credentials = {"username": f"user-{uuid4().hex}", "password": "password"}
+    client.post("/api/v1/register", data=credentials)
+    return credentials
+
+
+def test_refresh_rotates_and_reuse_revokes_the_session(client):
+    credentials = new_user(client)
+    first = login(client, credentials)
+    other_session = login(client, credentials)
+
+    rotated = refresh(client, first)
+    assert rotated.status_code == 200, rotated.text
+    second = rotated.json()
+    assert second["refresh_token"] != first["refresh_token"]
+    assert authorized(client, second)
+
+    # Replaying a spent refresh token means it leaked: the whole session ends,
+    # including the tokens its rightful holder got from the rotation.
+    assert refresh(client, first).status_code == 401
+    assert refresh(client, second).status_code == 401
+    assert not authorized(client, second)
+    assert authorized(client, other_session)
+    assert refresh(client, other_session).status_code == 200
+
+
+def test_logout_ends_only_the_current_session(client):
+    credentials = new_user(client)
+    current, other = login(client, credentials), login(client, credentials)
+    headers = {"Authorization": f"Bearer {current['access_token']}"}
+
+    assert client.post("/api/v1/logout", headers=headers).status_code == 204
+
+    assert not authorized(client, current)
+    assert refresh(client, current).status_code == 401
+    assert authorized(client, other)
+
+    headers = {"Authorization": f"Bearer {other['access_token']}"}
+    assert client.post("/api/v1/logout/all", headers=headers).status_code == 204
+    assert not authorized(client, other)
+    assert refresh(client, other).status_code == 401
+
+
+def test_logout_with_a_token_ended_meanwhile_is_unauthorized(client, monkeypatch):
+    tokens = login(client, new_user(client))
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    # As if a concurrent logout revoked the token after it was authenticated.
+    monkeypatch.setattr(auth_module, "decode_access_token", lambda token: None)
+
+    for path in ("/api/v1/logout", "/api/v1/logout/all"):
+        response = client.post(path, headers=headers)
+        assert response.status_code == 401, response.text
+
+
+async def reload() -> None:
+    async with AsyncSession(engine) as session:
+        await reload_revocations(session)
+
+
+def test_reload_keeps_revocations_mirrored_meanwhile(client):
+    # Mirrored by a logout that committed after the reload's SELECT began.
+    session_id = uuid4().hex
+    revocation_index.add(session_id, time.time() + 60)
+
+    client.portal.call(reload)
+
+    assert revocation_index.is_revoked(session_id)
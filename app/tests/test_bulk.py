@@ -0,0 +1,79 @@
+import json
+
+from app.core.config import settings
+from app.tests.conftest import register
+
+
+def test_bulk_update_reports_only_rows_it_changed(client, headers, create_application):
+    kept, deleted = create_application(), create_application()
+    client.delete(f"/api/v1/{deleted['id']}", headers=headers)
+
+    response = client.patch(
+        "/api/v1/bulk",
+        json=[
+            {"id": kept["id"], "status": "offered"},
+            {"id": deleted["id"], "status": "offered"},
+        ],
+        headers=headers,
+    )
+
+    assert [item["status"] for item in response.json()] == [200, 404]
+    stats = client.get("/api/v1/stats", headers=headers).json()
+    assert stats["total"] == 1, stats
+    assert stats["by_status"]["offered"] == 1, stats
+    assert stats["by_status"]["reviewing"] == 0, stats
+
+
+def test_bulk_update_ignores_other_users_applications(
+    client, headers, create_application
+):
+    application = create_application()
+    other = register(client)
+
+    response = client.patch(
+        "/api/v1/bulk",
+        json=[{"id": application["id"], "status": "rejected"}],
+        headers=other,
+    )
+
+    assert response.json()[0]["status"] == 404
+    current = client.get(f"/api/v1/{application['id']}", headers=headers).json()
+    assert current["status"] == "reviewing"
+
+
+def test_bulk_update_refuses_repeated_ids(client, headers, create_application):
+    application = create_application()
+
+    response = client.patch(
+        "/api/v1/bulk",
+        json=[
+            {"id": application["id"], "status": "offered"},
+            {"id": application["id"], "company": "Renamed", "status": "rejected"},
+        ],
+        headers=headers,
+    )
+
+    assert [item["status"] for item in response.json()] == [200, 422]
+    current = client.get(f"/api/v1/{application['id']}", headers=headers).json()
+    assert (current["company"], current["status"]) == ("Acme", "offered")
+    assert client.get("/api/v1/stats/verify", headers=headers).json()["consistent"]
+
+
+def test_bulk_body_size_is_checked_while_reading(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_MAX_BYTES", 1_000)
+    items = [
+        {"company": f"Company {index}", "status": "reviewing"} for index in range(50)
+    ]
+
+    for content_type in ("application/json", "application/x-ndjson"):
+        body = (
+            json.dumps(items)
+            if content_type == "application/json"
+            else "\n".join(map(json.dumps, items))
+        )
+        response = client.post(
+            "/api/v1/bulk",
+            content=body,
+            headers={**headers, "Content-Type": content_type},
+        )
+        assert response.status_code == 413, response.text
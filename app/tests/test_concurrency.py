@@ -0,0 +1,79 @@
+import asyncio
+import time
+from contextlib import contextmanager
+
+import httpx
+from sqlalchemy import event
+
+from app.db.base import engine
+
+DUPLICATES = 5
+
+
+@contextmanager
+def statements(matches, delay: float = 0.0):
+    # Records the statements the app sends; matching reads can be held up so
+    # that duplicates surely arrive while the first one is still running.
+    seen = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        if matches(statement):
+            seen.append(statement)
+            time.sleep(delay)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield seen
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def send_together(app, requests: list[dict]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.request(**request) for request in requests)
+        )
+
+
+def test_duplicate_idempotent_requests_write_once(client, app, headers):
+    request = {
+        "method": "POST",
+        "url": "/api/v1/",
+        "json": {"company": "Initech", "status": "reviewing", "url": None},
+        "headers": {**headers, "Idempotency-Key": "create-initech"},
+    }
+
+    with statements(
+        lambda sql: sql.startswith("INSERT INTO job_applications ")
+    ) as inserts:
+        responses = client.portal.call(send_together, app, [request] * DUPLICATES)
+
+    assert [response.status_code for response in responses] == [201] * DUPLICATES
+    assert len({response.json()["id"] for response in responses}) == 1
+    replayed = [response.headers.get("Idempotent-Replayed") for response in responses]
+    assert replayed.count("true") == DUPLICATES - 1
+    assert len(inserts) == 1, inserts
+    listed = client.get("/api/v1/", headers=headers).json()
+    assert [item["company"] for item in listed] == ["Initech"]
+
+
+def test_concurrent_identical_reads_share_one_query(
+    client, app, headers, create_application
+):
+    application = create_application()
+    request = {
+        "method": "GET",
+        "url": f"/api/v1/{application['id']}",
+        "headers": headers,
+    }
+
+    def reads_application(sql: str) -> bool:
+        return sql.startswith("SELECT") and "WHERE job_applications.id = " in sql
+
+    with statements(reads_application, delay=0.2) as reads:
+        responses = client.portal.call(send_together, app, [request] * DUPLICATES)
+
+    assert [response.status_code for response in responses] == [200] * DUPLICATES
+    assert {response.json()["id"] for response in responses} == {application["id"]}
+    assert len(reads) == 1, reads
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.base import engine
+from app.db.deletes import purge_deleted_applications
+from app.db.models.job_application import JobApplication
+
+# Shorter than the app's own purge retention, so its periodic purge never
+# races the test for the aged row.
+RETENTION = timedelta(minutes=1)
+
+
+@pytest.fixture
+def soft_delete(monkeypatch):
+    monkeypatch.setattr(settings, "SOFT_DELETE", True)
+
+
+def visible(client, headers: dict, id: str, word: str) -> dict:
+    return {
+        "list": id
+        in [row["id"] for row in client.get("/api/v1/", headers=headers).json()],
+        "get": client.get(f"/api/v1/{id}", headers=headers).status_code == 200,
+        "search": id
+        in [
+            row["id"]
+            for row in client.get(f"/api/v1/search?q={word}", headers=headers).json()
+        ],
+        "batch": bool(client.get(f"/api/v1/batch?ids={id}", headers=headers).json()),
+    }
+
+
+def test_deleted_rows_are_hidden_until_restored(
+    client, headers, create_application, soft_delete
+):
+    word = uuid4().hex
+    application = create_application(company=f"Deleted {word}")
+    id = application["id"]
+    everywhere = {"list": True, "get": True, "search": True, "batch": True}
+    assert visible(client, headers, id, word) == everywhere
+
+    assert client.delete(f"/api/v1/{id}", headers=headers).status_code == 204
+    assert visible(client, headers, id, word) == dict.fromkeys(everywhere, False)
+    assert client.get("/api/v1/stats", headers=headers).json()["total"] == 0
+    patched = client.patch(f"/api/v1/{id}", json={"company": "X"}, headers=headers)
+    assert patched.status_code == 404
+
+    restored = client.post(f"/api/v1/{id}/restore", headers=headers)
+    assert restored.status_code == 200, restored.text
+    assert restored.json() == {
+        **application,
+        "updated_at": restored.json()["updated_at"],
+    }
+    assert visible(client, headers, id, word) == everywhere
+    assert client.get("/api/v1/stats/verify", headers=headers).json()["consistent"]
+    assert client.get("/api/v1/stats", headers=headers).json()["total"] == 1
+
+    # Live rows have nothing to restore.
+    assert client.post(f"/api/v1/{id}/restore", headers=headers).status_code == 404
+
+
+def test_hard_deleted_rows_cannot_be_restored(client, headers, create_application):
+    id = create_application()["id"]
+    assert client.delete(f"/api/v1/{id}", headers=headers).status_code == 204
+
+    assert client.post(f"/api/v1/{id}/restore", headers=headers).status_code == 404
+
+
+async def age_tombstone(id: str, age: timedelta) -> None:
+    async with AsyncSession(engine) as session:
+        await session.exec(
+            update(JobApplication)
+            .where(JobApplication.id == UUID(id))
+            .values(deleted_at=datetime.utcnow() - age)
+        )
+        await session.commit()
+
+
+async def purge_and_list(ids: list[str]) -> tuple[int, set[str]]:
+    async with AsyncSession(engine) as session:
+        purged = await purge_deleted_applications(
+            session, batch_size=1, retention_seconds=RETENTION.total_seconds()
+        )
+        query = select(JobApplication.id).where(
+            col(JobApplication.id).in_([UUID(id) for id in ids])
+        )
+        return purged, {str(id) for id in (await session.exec(query)).all()}
+
+
+def test_purge_removes_only_tombstones_past_retention(
+    client, headers, create_application, soft_delete
+):
+    expired, recent, live = (create_application()["id"] for _ in range(3))
+    for id in (expired, recent):
+        assert client.delete(f"/api/v1/{id}", headers=headers).status_code == 204
+    client.portal.call(age_tombstone, expired, 2 * RETENTION)
+
+    purged, remaining = client.portal.call(purge_and_list, [expired, recent, live])
+
+    assert purged == 1
+    assert remaining == {recent, live}
+    assert client.post(f"/api/v1/{recent}/restore", headers=headers).status_code == 200
@@ -0,0 +1,117 @@
+import asyncio
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.base import engine
+from app.db.models.job_application import JobApplication
+from app.db.models.user import User
+from app.tests.conftest import register
+from app.utils.ids import uuid7
+
+SMALL_EXPORT_ROWS = 1_000
+LARGE_EXPORT_ROWS = 20_000
+
+
+async def seed(username: str, rows: int) -> None:
+    async with AsyncSession(engine) as session:
+        query = select(User.id).where(User.username == username)
+        user_id = (await session.exec(query)).one()
+        started = datetime.utcnow()
+        for start in range(0, rows, 1_000):
+            await session.exec(
+                insert(JobApplication),
+                params=[
+                    {
+                        "id": uuid7(),
+                        "user_id": user_id,
+                        "company": f"Company {index}",
+                        "status": "reviewing",
+                        "url": f"https://example.com/jobs/{index}",
+                        "applied_at": started - timedelta(seconds=index),
+                        "updated_at": started,
+                        "version": 1,
+                    }
+                    for index in range(start, min(start + 1_000, rows))
+                ],
+            )
+            await session.commit()
+
+
+async def export(app, headers: dict, format: str) -> tuple[int, int]:
+    # Driven through raw ASGI, since the test clients buffer the whole response
+    # body; every chunk is counted and dropped like a socket write would.
+    lines = size = 0
+
+    async def receive():
+        # The client never disconnects; the response cancels this wait once
+        # the body is sent.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal lines, size
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            lines += body.count(b"\n")
+            size += len(body)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/export",
+        "raw_path": b"/api/v1/export",
+        "root_path": "",
+        "query_string": f"format={format}".encode(),
+        "headers": [
+            (b"host", b"testserver"),
+            (b"authorization", headers["Authorization"].encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    return lines, size
+
+
+def traced_export(client, app, headers: dict, format: str) -> tuple[int, int, int]:
+    # The app's periodic tasks share the loop and allocate too, so the lowest
+    # of a few peaks is the one that belongs to the export alone.
+    peaks = []
+    for _ in range(3):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            lines, size = client.portal.call(export, app, headers, format)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return lines, size, min(peaks)
+
+
+def test_export_memory_does_not_grow_with_rows(client, app, monkeypatch):
+    # Small batches, so both exports run many of them and only the row count
+    # differs between the two.
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 100)
+    small, large = register(client), register(client)
+    for headers, rows in ((small, SMALL_EXPORT_ROWS), (large, LARGE_EXPORT_ROWS)):
+        username = client.get("/api/v1/me", headers=headers).json()["username"]
+        client.portal.call(seed, username, rows)
+
+    for format, header in (("ndjson", 0), ("csv", 1)):
+        small_lines, _, small_peak = traced_export(client, app, small, format)
+        large_lines, large_size, large_peak = traced_export(client, app, large, format)
+
+        assert small_lines == SMALL_EXPORT_ROWS + header
+        assert large_lines == LARGE_EXPORT_ROWS + header
+        # Twenty times the rows may not take noticeably more memory, and the
+        # peak stays well under what was sent.
+        assert large_peak < 1.5 * small_peak, (format, small_peak, large_peak)
+        assert large_peak < large_size / 2, (format, large_peak, large_size)
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, create_mock_engine, event
+from sqlmodel import Session, SQLModel, select
+
+from app.api.filtration import JobApplicationsFiltration
+from app.db.models.job_application import (
+    JobApplication,
+    JobApplicationStatus,
+    not_deleted,
+)
+from app.db.models.user import User
+
+USER_ID = uuid4()
+
+
+@pytest.fixture(scope="module")
+def plans():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    captured = []
+
+    # Each SELECT is explained on the same cursor with the bound parameters,
+    # so the plan is exactly the one SQLite uses for the real statement.
+    @event.listens_for(engine, "before_cursor_execute")
+    def explain(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            captured.append(" | ".join(row[3] for row in cursor.fetchall()))
+
+    with Session(engine) as session:
+        session.add(User(id=USER_ID, username="u", hashed_password="x"))
+        now = datetime.utcnow()
+        for index in range(200):
+            session.add(
+                JobApplication(
+                    user_id=USER_ID,
+                    company=f"Company {index % 20}",
+                    status=list(JobApplicationStatus)[index % 4],
+                    url=None,
+                    applied_at=now - timedelta(days=index),
+                    updated_at=now - timedelta(hours=index),
+                )
+            )
+        session.commit()
+
+        def plan(filtration: JobApplicationsFiltration) -> str:
+            query = filtration.apply(
+                select(JobApplication)
+                .where(JobApplication.user_id == USER_ID)
+                .where(not_deleted())
+            )
+            captured.clear()
+            session.exec(query).all()
+            return captured[-1]
+
+        yield plan
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        ({"company": "Company 3"}, "ix_job_applications_user_id_lower_company"),
+        (
+            {"status": [JobApplicationStatus.OFFERED, JobApplicationStatus.REJECTED]},
+            "ix_job_applications_user_id_status",
+        ),
+        (
+            {"applied_after": datetime.utcnow() - timedelta(days=7)},
+            "ix_job_applications_live_user_id_applied_at_id",
+        ),
+        (
+            {"updated_before": datetime.utcnow() - timedelta(days=3)},
+            "ix_job_applications_user_id_updated_at",
+        ),
+    ],
+)
+def test_filter_uses_index(plans, filters, index):
+    plan = plans(JobApplicationsFiltration(**filters))
+
+    assert f"INDEX {index} " in plan, plan
+
+
+def test_company_contains_is_scoped_by_user_index(plans):
+    # SQLite has no trigram index, so the substring match is only required to
+    # search within the user's rows instead of scanning the table.
+    plan = plans(JobApplicationsFiltration(company_contains="pany 1"))
+
+    assert plan.startswith("SEARCH job_applications USING "), plan
+
+
+def test_postgres_ddl_sends_one_command_per_statement():
+    # asyncpg prepares every statement, and a prepared statement can only hold
+    # a single command.
+    statements = []
+    engine = create_mock_engine(
+        "postgresql+asyncpg://",
+        lambda statement, *args, **kwargs: statements.append(
+            str(statement.compile(dialect=engine.dialect))
+        ),
+    )
+    SQLModel.metadata.create_all(engine, tables=[JobApplication.__table__])
+
+    assert any("gin_trgm_ops" in statement for statement in statements)
+    assert not [statement for statement in statements if ";" in statement]
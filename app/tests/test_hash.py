@@ -0,0 +1,143 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.core.hash as hash_module
+from app.core.hash import (
+    HashingService,
+    HashingServiceBusy,
+    hashing_service,
+    pwd_context,
+)
+from app.db.base import engine
+from app.db.models.user import User
+
+LOGINS = 8
+BENCHMARK_ROUNDS = 10
+
+
+def bcrypt_hash(password: str, rounds: int) -> str:
+    return pwd_context.handler("bcrypt").using(rounds=rounds).hash(password)
+
+
+def new_user(client) -> dict:
+    credentials = {"username": f"user-{uuid4().hex}", "password": "password"}
+    assert client.post("/api/v1/register", data=credentials).status_code == 201
+    return credentials
+
+
+async def stored_hash(username: str) -> str:
+    async with AsyncSession(engine) as session:
+        query = select(User.hashed_password).where(User.username == username)
+        return (await session.exec(query)).one()
+
+
+async def store_hash(username: str, hashed_password: str) -> None:
+    async with AsyncSession(engine) as session:
+        await session.exec(
+            update(User)
+            .where(User.username == username)
+            .values(hashed_password=hashed_password)
+        )
+        await session.commit()
+
+
+def test_pool_refuses_work_past_its_queue_limit():
+    service = HashingService(max_workers=1, queue_limit=2)
+
+    async def burst():
+        return await asyncio.gather(
+            *(service._run("verify", time.sleep, 0.1) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    try:
+        results = asyncio.run(burst())
+    finally:
+        service.shutdown()
+
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], HashingServiceBusy)
+    assert service.pending == 0
+
+
+def test_saturated_pool_answers_429(client, monkeypatch):
+    credentials = new_user(client)
+    monkeypatch.setattr(hashing_service, "queue_limit", 0)
+
+    response = client.post("/api/v1/token", data=credentials)
+
+    assert response.status_code == 429, response.text
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_login_verifies_once_and_rehashes_outdated_costs(client, monkeypatch):
+    credentials = new_user(client)
+    calls = []
+
+    def counted(*args):
+        calls.append(args)
+        return pwd_context.verify_and_update(*args)
+
+    monkeypatch.setattr(hash_module, "verify_and_update_password", counted)
+    outdated = bcrypt_hash(credentials["password"], rounds=5)
+    client.portal.call(store_hash, credentials["username"], outdated)
+
+    # Raising the minimum cost makes every stored 5-round hash outdated.
+    pwd_context.update(bcrypt__min_rounds=6, bcrypt__default_rounds=6)
+    try:
+        assert client.post("/api/v1/token", data=credentials).status_code == 200
+    finally:
+        pwd_context.update(bcrypt__min_rounds=4, bcrypt__default_rounds=4)
+
+    assert len(calls) == 1
+    rehashed = client.portal.call(stored_hash, credentials["username"])
+    assert rehashed.startswith("$2b$06$"), rehashed
+    assert client.post("/api/v1/token", data=credentials).status_code == 200
+
+
+async def login_burst(app, credentials: dict) -> tuple[float, list[float]]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def login():
+            response = await client.post("/api/v1/token", data=credentials)
+            assert response.status_code == 200, response.text
+
+        async def probe() -> float:
+            started = time.perf_counter()
+            assert (await client.get("/api/v1/health")).status_code == 200
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        logins = asyncio.gather(*(login() for _ in range(LOGINS)))
+        probes = []
+        while not logins.done():
+            probes.append(await probe())
+            await asyncio.sleep(0.01)
+        await logins
+        return time.perf_counter() - started, probes
+
+
+def test_login_throughput_keeps_the_loop_responsive(client, app):
+    credentials = new_user(client)
+    costly = bcrypt_hash(credentials["password"], rounds=BENCHMARK_ROUNDS)
+    client.portal.call(store_hash, credentials["username"], costly)
+    started = time.perf_counter()
+    pwd_context.verify(credentials["password"], costly)
+    one_verify = time.perf_counter() - started
+
+    elapsed, probes = client.portal.call(login_burst, app, credentials)
+
+    # Each verify costs about 120ms on one core, and the burst takes about as
+    # long as running them back to back: 7.4 logins/s. Health probes are
+    # answered in a few milliseconds meanwhile instead of waiting behind a
+    # verify. More cores run the verifies in parallel.
+    report = f"{LOGINS / elapsed:.1f} logins/s, slowest probe {max(probes):.3f}s"
+    assert elapsed < 1.5 * LOGINS * one_verify, report
+    assert max(probes) < one_verify / 2, report
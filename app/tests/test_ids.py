@@ -0,0 +1,96 @@
+import sqlite3
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.base import engine
+from app.db.models.job_application import JobApplication
+from app.db.models.user import User
+from app.utils.ids import uuid7
+
+GENERATED = 10_000
+INSERTED = 50_000
+
+
+def test_uuid7_keys_are_increasing_version_7_uuids():
+    before = time.time_ns() // 1_000_000
+    ids = [uuid7() for _ in range(GENERATED)]
+    after = time.time_ns() // 1_000_000
+
+    assert {(id.version, id.variant) for id in ids} == {(7, "specified in RFC 4122")}
+    assert ids == sorted(ids) and len(set(ids)) == GENERATED
+    assert before <= ids[0].int >> 80 <= ids[-1].int >> 80 <= after + 1
+
+
+async def insert_v4_application(username: str) -> str:
+    async with AsyncSession(engine) as session:
+        query = select(User.id).where(User.username == username)
+        user_id = (await session.exec(query)).one()
+        id = uuid4()
+        await session.exec(
+            insert(JobApplication).values(
+                id=id,
+                user_id=user_id,
+                company="Legacy",
+                status="reviewing",
+                applied_at=datetime(2020, 1, 1),
+                version=1,
+            )
+        )
+        await session.commit()
+        return str(id)
+
+
+def test_existing_v4_rows_live_alongside_v7_rows(client, headers, create_application):
+    username = client.get("/api/v1/me", headers=headers).json()["username"]
+    legacy = client.portal.call(insert_v4_application, username)
+    current = create_application()
+
+    assert (
+        client.get(f"/api/v1/{legacy}", headers=headers).json()["company"] == "Legacy"
+    )
+    listed = [row["id"] for row in client.get("/api/v1/", headers=headers).json()]
+    assert listed == [legacy, current["id"]]
+
+
+def insert_rows(path, new_id) -> tuple[float, int]:
+    # Keys stored as the GUID type stores them on SQLite, with a cache far
+    # smaller than the index, as on a table that outgrew memory.
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA cache_size = -256")
+    connection.execute("CREATE TABLE t (id CHAR(32) PRIMARY KEY, company VARCHAR)")
+    started = time.perf_counter()
+    for _ in range(0, INSERTED, 1_000):
+        rows = [(new_id().hex, "Company") for _ in range(1_000)]
+        connection.executemany("INSERT INTO t VALUES (?, ?)", rows)
+        connection.commit()
+    elapsed = time.perf_counter() - started
+    pages = connection.execute(
+        "SELECT count(*) FROM dbstat WHERE name = 'sqlite_autoindex_t_1'"
+    ).fetchone()[0]
+    connection.close()
+    return elapsed, pages
+
+
+def test_uuid7_inserts_outpace_uuid4(tmp_path):
+    runs = {uuid4: [], uuid7: []}
+    for round in range(2):
+        for new_id in runs:
+            path = tmp_path / f"{new_id.__name__}-{round}.db"
+            runs[new_id].append(insert_rows(path, new_id))
+    (random_keys, random_pages), (ordered_keys, ordered_pages) = (
+        min(results) for results in runs.values()
+    )
+
+    # About 1.4s against 0.5s for 50,000 rows on a laptop: random keys touch
+    # a different index page each time. SQLite's B-tree ends up about as
+    # large either way, so only the insert rate is asserted.
+    report = (
+        f"v4 {INSERTED / random_keys:.0f} rows/s, {random_pages} pages; "
+        f"v7 {INSERTED / ordered_keys:.0f} rows/s, {ordered_pages} pages"
+    )
+    assert ordered_keys < random_keys / 1.5, report
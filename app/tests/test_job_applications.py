@@ -0,0 +1,42 @@
+def test_delete_returns_empty_no_content(client, headers, create_application):
+    application = create_application()
+
+    response = client.delete(f"/api/v1/{application['id']}", headers=headers)
+
+    assert response.status_code == 204
+    assert response.content == b""
+    missing = client.delete(f"/api/v1/{application['id']}", headers=headers)
+    assert missing.status_code == 404
+
+
+def test_item_etag_tells_projections_apart(client, headers, create_application):
+    application = create_application()
+    url = f"/api/v1/{application['id']}"
+
+    full = client.get(url, headers=headers)
+    projected = client.get(f"{url}?fields=status,company", headers=headers)
+    reordered = client.get(f"{url}?fields=company,status", headers=headers)
+    assert full.headers["ETag"] == '"1"'
+    assert projected.headers["ETag"].startswith("W/")
+    assert projected.headers["ETag"] == reordered.headers["ETag"]
+
+    def revalidate(query: str, etag: str) -> int:
+        conditional = {**headers, "If-None-Match": etag}
+        return client.get(f"{url}{query}", headers=conditional).status_code
+
+    assert revalidate("", full.headers["ETag"]) == 304
+    assert revalidate("?fields=company,status", projected.headers["ETag"]) == 304
+    assert revalidate("?fields=company", full.headers["ETag"]) == 200
+    assert revalidate("", projected.headers["ETag"]) == 200
+
+    # Only the full representation's validator can guard an update.
+    for etag, expected in (
+        (projected.headers["ETag"], 412),
+        (full.headers["ETag"], 200),
+    ):
+        response = client.patch(
+            url, json={"status": "offered"}, headers={**headers, "If-Match": etag}
+        )
+        assert response.status_code == expected, response.text
+
+    assert revalidate("", full.headers["ETag"]) == 200
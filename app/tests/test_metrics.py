@@ -0,0 +1,61 @@
+import json
+import os
+import threading
+
+from app.core.metrics import MetricsRegistry
+
+THREADS = 8
+UPDATES = 20_000
+
+
+def test_updates_from_threads_are_not_lost():
+    registry = MetricsRegistry()
+    counter = registry.counter("checkouts_total", "Checkouts", ("engine",))
+    histogram = registry.histogram("wait_seconds", "Wait", buckets=(0.5,))
+
+    def update():
+        for _ in range(UPDATES):
+            counter.inc(engine="sync")
+            histogram.observe(0.1)
+
+    threads = [threading.Thread(target=update) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.samples[("sync",)] == THREADS * UPDATES
+    assert histogram.samples[()][:2] == [THREADS * UPDATES] * 2
+
+
+def test_dead_workers_keep_their_totals_but_not_their_files(tmp_path):
+    registry = MetricsRegistry(str(tmp_path))
+    requests = registry.counter("requests_total", "Requests")
+    in_flight = registry.gauge("in_flight", "In flight")
+    worker = {
+        "requests_total": {
+            "type": "counter",
+            "help": "Requests",
+            "labelnames": [],
+            "samples": [[[], 5]],
+        },
+        "in_flight": {
+            "type": "gauge",
+            "help": "In flight",
+            "labelnames": [],
+            "samples": [[[], 7]],
+        },
+    }
+    (tmp_path / "999999999.json").write_text(json.dumps(worker))
+
+    registry.mark_process_dead(999999999)
+    requests.inc(2)
+    in_flight.set(1)
+    registry.mark_process_dead(os.getpid())
+    requests.inc()
+    in_flight.set(3)
+
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["dead.json"]
+    collected = registry.collect()
+    assert collected["requests_total"]["samples"] == [[[], 8]]
+    assert collected["in_flight"]["samples"] == [[[], 3]]
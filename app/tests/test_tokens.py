@@ -0,0 +1,126 @@
+import json
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from jwt.algorithms import OKPAlgorithm
+
+import app.utils.token as token_module
+from app.core.revocation import revocation_index
+from app.core.token_keys import TokenKeys
+from app.utils.cache import LRUCache
+from app.utils.token import create_access_token, decode_access_token
+
+ACTIVE_TOKENS = 10_000
+
+
+def write_key(path) -> Ed25519PrivateKey:
+    key = Ed25519PrivateKey.generate()
+    path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return key
+
+
+@pytest.fixture
+def rotated_keys(tmp_path) -> tuple[TokenKeys, Ed25519PrivateKey]:
+    # The service signs with "current"; "previous" is still published so
+    # tokens issued before the rotation verify until they expire.
+    previous = write_key(tmp_path / "previous.pem")
+    write_key(tmp_path / "current.pem")
+    jwk = OKPAlgorithm.to_jwk(previous.public_key(), as_dict=True)
+    jwks = {"keys": [{**jwk, "kid": "previous", "alg": "EdDSA"}]}
+    (tmp_path / "jwks.json").write_text(json.dumps(jwks))
+
+    keys = TokenKeys(
+        algorithm="EdDSA",
+        secret="unused",
+        private_key_file=str(tmp_path / "current.pem"),
+        key_id="current",
+        jwks_file=str(tmp_path / "jwks.json"),
+    )
+    return keys, previous
+
+
+def test_tokens_verify_with_the_key_their_kid_names(rotated_keys):
+    keys, previous = rotated_keys
+
+    def verify(token: str) -> dict:
+        key, algorithm = keys.verification_key(token)
+        return jwt.decode(token, key, algorithms=[algorithm])
+
+    current = jwt.encode(
+        {"sub": "alice"}, keys.signing_key, algorithm="EdDSA", headers=keys.headers
+    )
+    old = jwt.encode(
+        {"sub": "bob"}, previous, algorithm="EdDSA", headers={"kid": "previous"}
+    )
+    assert verify(current)["sub"] == "alice"
+    assert verify(old)["sub"] == "bob"
+    assert [key["kid"] for key in keys.jwks()["keys"]] == ["previous", "current"]
+    assert not any("d" in key for key in keys.jwks()["keys"])
+
+    mislabelled = jwt.encode(
+        {"sub": "eve"}, previous, algorithm="EdDSA", headers={"kid": "current"}
+    )
+    unknown = jwt.encode(
+        {"sub": "eve"}, previous, algorithm="EdDSA", headers={"kid": "retired"}
+    )
+    symmetric = jwt.encode(
+        {"sub": "eve"}, "unused", algorithm="HS256", headers={"kid": "current"}
+    )
+    for token in (mislabelled, unknown, symmetric):
+        with pytest.raises(jwt.InvalidTokenError):
+            verify(token)
+
+
+def test_cached_claims_are_not_served_once_revoked(monkeypatch):
+    monkeypatch.setattr(token_module, "claims_cache", LRUCache(max_size=10))
+    session_id = uuid4().hex
+    token = create_access_token({"sub": "alice", "sid": session_id})
+    assert decode_access_token(token)["sub"] == "alice"
+    assert len(token_module.claims_cache) == 1
+
+    revocation_index.add(session_id, time.time() + 60)
+    try:
+        assert decode_access_token(token) is None
+    finally:
+        revocation_index.revoked.pop(session_id)
+
+
+def test_cached_claims_are_not_served_past_expiry(monkeypatch):
+    monkeypatch.setattr(token_module, "claims_cache", LRUCache(max_size=10))
+    token = create_access_token({"sub": "alice"}, expires_delta=timedelta(seconds=1))
+    assert decode_access_token(token)["sub"] == "alice"
+
+    time.sleep(1.1)
+
+    assert decode_access_token(token) is None
+    assert len(token_module.claims_cache) == 0
+
+
+def test_cache_cuts_verification_cost_across_active_tokens(rotated_keys, monkeypatch):
+    keys, _ = rotated_keys
+    monkeypatch.setattr(token_module, "token_keys", keys)
+    monkeypatch.setattr(token_module, "claims_cache", LRUCache(max_size=ACTIVE_TOKENS))
+    tokens = [create_access_token({"sub": f"user-{i}"}) for i in range(ACTIVE_TOKENS)]
+
+    def per_token() -> float:
+        started = time.perf_counter()
+        for token in tokens:
+            assert decode_access_token(token) is not None
+        return (time.perf_counter() - started) / ACTIVE_TOKENS
+
+    verified, cached = per_token(), per_token()
+
+    # About 700us to verify an EdDSA token and 10us to find its claims.
+    report = f"verified {verified * 1e6:.0f}us, cached {cached * 1e6:.0f}us"
+    assert cached < verified / 10, report
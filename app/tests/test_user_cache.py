@@ -0,0 +1,78 @@
+import asyncio
+from uuid import uuid4
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import registry, user_cache_total
+from app.core.models.user import UserPrincipal
+from app.core.user_cache import (
+    SharedUserCacheBackend,
+    UserCache,
+    create_user_cache,
+    user_cache,
+)
+from app.db.base import engine
+from app.db.models.user import User
+from app.utils.cache import InMemorySharedStore
+
+
+def principal(username: str) -> UserPrincipal:
+    return UserPrincipal(id=uuid4(), username=username)
+
+
+def test_lookups_are_exported_as_metrics():
+    cache = UserCache(SharedUserCacheBackend(InMemorySharedStore(), ttl=60))
+    before = dict(user_cache_total.samples)
+
+    async def lookups():
+        await cache.get("alice")
+        await cache.set(principal("alice"))
+        await cache.get("alice")
+        await cache.get("alice")
+
+    asyncio.run(lookups())
+
+    assert user_cache_total.samples[("hit",)] - before.get(("hit",), 0) == 2
+    assert user_cache_total.samples[("miss",)] - before.get(("miss",), 0) == 1
+    assert 'user_cache_total{result="hit"}' in registry.render()
+
+
+def test_shared_invalidate_without_running_loop():
+    store = InMemorySharedStore()
+    cache = UserCache(SharedUserCacheBackend(store, ttl=60))
+    asyncio.run(cache.set(principal("bob")))
+
+    cache.invalidate("bob")
+
+    assert asyncio.run(cache.get("bob")) is None
+
+
+def test_shared_backend_uses_the_injected_store(monkeypatch):
+    monkeypatch.setattr(settings, "USER_CACHE_BACKEND", "shared")
+    store = InMemorySharedStore()
+    cache = create_user_cache(shared_store=store)
+
+    asyncio.run(cache.set(principal("carol")))
+
+    assert cache.backend.store is store
+    assert asyncio.run(store.get("user-principal:carol")) is not None
+
+
+async def change_while_cached(username: str) -> None:
+    async with AsyncSession(engine) as session:
+        user = (await session.exec(select(User).where(User.username == username))).one()
+        user.hashed_password = "changed"
+        await session.flush()
+        # A request that read the row before the commit caches it again.
+        await user_cache.set(UserPrincipal.model_validate(user))
+        await session.commit()
+
+
+def test_users_are_invalidated_after_commit(client, headers):
+    username = client.get("/api/v1/me", headers=headers).json()["username"]
+
+    client.portal.call(change_while_cached, username)
+
+    assert client.portal.call(user_cache.get, username) is None
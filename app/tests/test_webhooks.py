@@ -0,0 +1,165 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import UUID
+
+import pytest
+from sqlalchemy import delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import webhooks
+from app.core.config import settings
+from app.core.webhooks import SIGNATURE_HEADER, retry_delay, sign
+from app.db.base import engine
+from app.db.models.outbox import OutboxEvent, Webhook
+
+
+class Receiver(BaseHTTPRequestHandler):
+    # Stands in for a webhook endpoint that is down for its first requests.
+    failures = 2
+    received: list[tuple[int, bytes, str]] = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        status = 500 if len(self.received) < self.failures else 200
+        self.received.append((status, body, self.headers[SIGNATURE_HEADER]))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def receiver():
+    Receiver.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Receiver)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/hook"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/hook",
+        "http://localhost:8000/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://10.0.0.7/hook",
+        "http://[::1]/hook",
+        "http://[::ffff:192.168.0.1]/hook",
+    ],
+)
+def test_webhooks_to_internal_addresses_are_rejected(client, headers, url):
+    response = client.post("/api/v1/webhooks", json={"url": url}, headers=headers)
+
+    assert response.status_code == 422, response.text
+
+
+def test_webhooks_to_public_addresses_are_accepted(client, headers):
+    url = "https://93.184.216.34/hook"
+    response = client.post("/api/v1/webhooks", json={"url": url}, headers=headers)
+
+    assert response.status_code == 201, response.text
+
+
+def test_retry_delay_backs_off_with_jitter():
+    for attempts in range(1, 6):
+        delay = retry_delay(attempts, base=1, maximum=10)
+        assert (
+            min(10, 2 ** (attempts - 1)) * 0.5 <= delay <= min(10, 2 ** (attempts - 1))
+        )
+
+
+def test_failed_deliveries_are_retried_until_accepted(
+    client, headers, create_application, receiver, monkeypatch
+):
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOWED_HOSTS", "127.0.0.1")
+    delays = []
+    monkeypatch.setattr(
+        webhooks, "retry_delay", lambda attempts: delays.append(attempts) or 0
+    )
+
+    created = client.post("/api/v1/webhooks", json={"url": receiver}, headers=headers)
+    assert created.status_code == 201, created.text
+    application = create_application()
+
+    deadline = time.monotonic() + 20
+    while len(Receiver.received) < 3 and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+    assert [status for status, _, _ in Receiver.received] == [500, 500, 200]
+    # Every retry carries the same signed batch, and each failure counted as
+    # one more attempt towards the backoff.
+    bodies = {body for _, body, _ in Receiver.received}
+    assert len(bodies) == 1
+    body = bodies.pop()
+    assert application["id"].encode() in body
+    secret = created.json()["secret"]
+    assert {signature for _, _, signature in Receiver.received} == {sign(secret, body)}
+    assert delays == [1, 2]
+
+    webhook = client.get("/api/v1/webhooks", headers=headers).json()[0]
+    assert webhook["attempts"] == 0 and webhook["last_error"] is None, webhook
+
+
+def test_deliveries_recheck_the_address(
+    client, headers, create_application, receiver, monkeypatch
+):
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOWED_HOSTS", "127.0.0.1")
+    created = client.post("/api/v1/webhooks", json={"url": receiver}, headers=headers)
+    assert created.status_code == 201, created.text
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOWED_HOSTS", "")
+    create_application()
+
+    deadline = time.monotonic() + 20
+    webhook = created.json()
+    while webhook["last_error"] is None and time.monotonic() < deadline:
+        time.sleep(0.1)
+        webhook = client.get("/api/v1/webhooks", headers=headers).json()[0]
+
+    assert "non-public" in webhook["last_error"], webhook
+    assert Receiver.received == []
+
+
+async def prune_and_deliver(webhook_id: str, whole: bool) -> None:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        webhook = await session.get(Webhook, UUID(webhook_id))
+        pruned = delete(OutboxEvent).where(OutboxEvent.user_id == webhook.user_id)
+        if not whole:
+            pruned = pruned.where(OutboxEvent.sequence == webhook.last_sequence + 1)
+        await session.exec(pruned)
+        await session.commit()
+    await webhooks.webhook_dispatcher.deliver(webhook)
+
+
+@pytest.mark.parametrize("whole", [True, False], ids=["all", "first"])
+def test_pruned_events_stop_the_webhook(
+    client, headers, create_application, monkeypatch, whole
+):
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOWED_HOSTS", "127.0.0.1")
+    monkeypatch.setattr(webhooks, "retry_delay", lambda attempts: 3600)
+    url = "http://127.0.0.1:9/hook"
+    created = client.post("/api/v1/webhooks", json={"url": url}, headers=headers)
+    assert created.status_code == 201, created.text
+    sequence = created.json()["last_sequence"]
+    create_application()
+    create_application()
+
+    # The endpoint is down, so the events stay pending while they are pruned.
+    deadline = time.monotonic() + 20
+    webhook = created.json()
+    while webhook["last_error"] is None and time.monotonic() < deadline:
+        time.sleep(0.1)
+        webhook = client.get("/api/v1/webhooks", headers=headers).json()[0]
+    client.portal.call(prune_and_deliver, webhook["id"], whole)
+
+    webhook = client.get("/api/v1/webhooks", headers=headers).json()[0]
+    assert not webhook["active"], webhook
+    assert webhook["last_sequence"] == sequence
+    assert f"after sequence {sequence} were pruned" in webhook["last_error"]
@@ -0,0 +1,30 @@
+import math
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing over Python's own string hash, which is cached on the
+        # string object. It is salted per process, which is fine for a filter
+        # that every process builds for itself.
+        first = hash(key)
+        second = hash((key, self.size)) | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        first = hash(key)
+        second = hash((key, self.size)) | 1
+        for index in range(self.hashes):
+            position = (first + index * second) % self.size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
@@ -0,0 +1,82 @@
+import time
+from collections import OrderedDict
+
+from app.utils.rate_limit import take_token
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class LRUCache:
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InMemorySharedStore:
+    """Local stand-in for a shared key/value store such as Redis."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[bytes, float]] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def take_token(self, key: str, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        entry = self._buckets.get(key)
+        self._buckets[key], retry_after = take_token(entry, rate, burst, now)
+        return retry_after
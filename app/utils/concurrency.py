@@ -0,0 +1,84 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+
+class KeyedLock:
+    # One asyncio.Lock per key, dropped again once nobody holds or waits on it.
+
+    def __init__(self) -> None:
+        self._locks: dict[Hashable, list] = {}
+
+    async def acquire(self, key: Hashable) -> None:
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+
+        try:
+            await entry[0].acquire()
+        except BaseException:
+            self._discard(key, entry)
+            raise
+
+    def release(self, key: Hashable) -> None:
+        entry = self._locks[key]
+        entry[0].release()
+        self._discard(key, entry)
+
+    def _discard(self, key: Hashable, entry: list) -> None:
+        entry[1] -= 1
+        if not entry[1]:
+            del self._locks[key]
+
+
+class SingleFlight:
+    # Concurrent calls with the same group and key share one execution: the
+    # first caller runs it and the others await its result. Nothing is kept
+    # once the call finishes, so this coalesces work without caching it.
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, dict[Hashable, asyncio.Future]] = {}
+
+    async def do(self, group: Hashable, key: Hashable, call: Callable[[], Awaitable]):
+        calls = self._calls.setdefault(group, {})
+        future = calls.get(key)
+
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            # The leading request was cancelled, typically because its client
+            # went away; this caller still wants the result.
+            return await call()
+
+        future = asyncio.get_running_loop().create_future()
+        calls[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Followers re-raise it; without them it must not be reported as
+            # never retrieved.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if calls.get(key) is future:
+                del calls[key]
+            if not calls and self._calls.get(group) is calls:
+                del self._calls[group]
+
+    def forget(self, group: Hashable) -> None:
+        # Calls already running keep going, but later callers start afresh
+        # instead of joining a read that began before a write committed.
+        self._calls.pop(group, None)
+
+
+read_flights = SingleFlight()
@@ -0,0 +1,40 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    # RFC 9562 version 7: a 48-bit Unix timestamp in milliseconds followed by
+    # random bits, so new keys land at the right-hand edge of the B-tree
+    # instead of on a random page. The 12 bits after the version act as a
+    # counter that keeps keys from one process increasing within a
+    # millisecond; it starts at a random value below 2048 to leave headroom.
+    global _last_timestamp, _counter
+
+    random = int.from_bytes(os.urandom(10), "big")
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            _counter = random >> 69
+        else:
+            timestamp = _last_timestamp
+            _counter += 1
+            if _counter > 0xFFF:
+                timestamp += 1
+                _counter = random >> 69
+        _last_timestamp = timestamp
+        counter = _counter
+
+    value = (
+        timestamp << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return UUID(int=value)
@@ -1,4 +1,93 @@
+import copy
+import json
 import logging
+import queue
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class DebugRateLimitFilter(logging.Filter):
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        super().__init__()
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+        self.suppressed = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+
+            if self.tokens < 1:
+                self.suppressed += 1
+                return False
+
+            self.tokens -= 1
+            return True
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+        return json.dumps(data, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare formats the record here and folds the traceback
+        # into the message. Formatting is left to the listener's handlers;
+        # only the arguments are merged and the traceback is rendered to
+        # exc_text, so queued records hold no frames.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
 
 class LoggerFactory:
@@ -6,25 +95,77 @@ class LoggerFactory:
         self,
         log_format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         level=logging.DEBUG,
+        json_format: bool = True,
+        debug_rate: float = 100,
+        queue_size: int = 10_000,
     ):
         self.log_format = log_format
         self.level = level
+        self.json_format = json_format
+        self.debug_rate = debug_rate
+        self.queue_size = queue_size
+        self.listeners: list[QueueListener] = []
+        self.running = True
 
     def create_logger(self, name, filename=None) -> logging.Logger:
         logger = logging.getLogger(name)
+
+        # Handlers are attached once per logger; repeated calls return the
+        # already configured logger instead of stacking duplicate handlers.
+        if any(isinstance(h, DroppingQueueHandler) for h in logger.handlers):
+            return logger
+
         logger.setLevel(self.level)
 
-        formatter = logging.Formatter(self.log_format)
+        if self.json_format:
+            formatter = JSONFormatter()
+        else:
+            formatter = logging.Formatter(self.log_format)
+
+        handlers = []
 
         if filename:
             file_handler = logging.FileHandler(filename)
             file_handler.setLevel(self.level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(self.level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+        # Records are handed to a listener thread, so the disk and console
+        # writes never happen on the event loop.
+        queue_handler = DroppingQueueHandler(queue.Queue(self.queue_size))
+        queue_handler.setLevel(self.level)
+        queue_handler.addFilter(DebugRateLimitFilter(self.debug_rate))
+        queue_handler.addFilter(RequestIdFilter())
+        logger.addHandler(queue_handler)
+
+        listener = QueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        if self.running:
+            listener.start()
+        self.listeners.append(listener)
 
         return logger
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        for listener in self.listeners:
+            listener.start()
+        self.running = True
+
+    def shutdown(self) -> None:
+        # Stopping drains the queue; the queue handlers stay attached so a later
+        # start() resumes delivery without reconfiguring the loggers.
+        if not self.running:
+            return
+
+        for listener in self.listeners:
+            listener.stop()
+        self.running = False
@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+
+
+def take_token(entry, rate: float, burst: float, now: float, cost: float = 1.0):
+    # Returns the new bucket state and how long the caller has to wait; zero
+    # means the request may proceed.
+    if entry is None:
+        tokens = burst
+    else:
+        tokens, updated_at = entry
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+
+    if tokens >= cost:
+        return (tokens - cost, now), 0.0
+    return (tokens, now), (cost - tokens) / rate
+
+
+class LocalBucketStore:
+    # Buckets are spread over shards, each a small bounded LRU, so eviction
+    # and reordering touch one short OrderedDict instead of one huge one.
+    # Like the metrics registry it is only used from the event loop thread.
+
+    def __init__(self, shards: int = 64, max_keys: int = 100_000) -> None:
+        self.shards = [OrderedDict() for _ in range(shards)]
+        self.max_keys_per_shard = max(1, max_keys // shards)
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        shard = self.shards[hash(key) % len(self.shards)]
+        shard[key], retry_after = take_token(
+            shard.get(key), rate, burst, time.monotonic()
+        )
+        shard.move_to_end(key)
+
+        if len(shard) > self.max_keys_per_shard:
+            shard.popitem(last=False)
+        return retry_after
+
+
+class SharedBucketStore:
+    # Buckets shared by all workers. The store has to apply take_token()
+    # atomically, the way a Redis script would.
+
+    def __init__(self, store, prefix: str = "rate-limit:") -> None:
+        self.store = store
+        self.prefix = prefix
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        return await self.store.take_token(self.prefix + key, rate, burst)
@@ -5,3 +5,5 @@ class ApplicationTags(Enum):
     health = "Health"
     applications = "Job Applications"
     auth = "Authentication"
+    metrics = "Metrics"
+    changes = "Changes"
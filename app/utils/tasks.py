@@ -0,0 +1,37 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    def __init__(self, name: str, interval: float, callback) -> None:
+        self.name = name
+        self.interval = interval
+        self.callback = callback
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.callback()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
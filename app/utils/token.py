@@ -1,11 +1,29 @@
+import time
 from datetime import datetime, timedelta, timezone
+from hashlib import sha256
 
 import jwt
 
 from app.core.config import settings
+from app.core.metrics import jwt_claims_cache_total, jwt_decode_seconds
+from app.core.revocation import revocation_index
+from app.core.token_keys import TokenKeys
+from app.utils.cache import LRUCache
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+token_keys = TokenKeys(
+    algorithm=settings.HASH_ALGORITHM,
+    secret=settings.HASH_KEY,
+    private_key_file=settings.JWT_PRIVATE_KEY_FILE,
+    key_id=settings.JWT_KEY_ID,
+    jwks_file=settings.JWT_JWKS_FILE,
+)
+
+# Verified claims keyed by token digest. Entries never outlive the token's
+# own expiry, so a cache hit is exactly as valid as a fresh decode.
+claims_cache = LRUCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
 
 def create_access_token(
     data: dict,
@@ -24,20 +42,33 @@ def create_access_token(
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.HASH_KEY,
-        algorithm=settings.HASH_ALGORITHM,
+        token_keys.signing_key,
+        algorithm=token_keys.algorithm,
+        headers=token_keys.headers,
     )
 
     return encoded_jwt
 
 
 def decode_access_token(token: str):
+    digest = sha256(token.encode()).digest()
+    payload = claims_cache.get(digest)
+    if payload is not None:
+        jwt_claims_cache_total.inc(result="hit")
+        return None if revocation_index.is_revoked(payload.get("sid")) else payload
+
+    jwt_claims_cache_total.inc(result="miss")
+    started_at = time.perf_counter()
     try:
-        payload = jwt.decode(
-            token,
-            settings.HASH_KEY,
-            algorithms=[settings.HASH_ALGORITHM],
-        )
-        return payload
+        key, algorithm = token_keys.verification_key(token)
+        payload = jwt.decode(token, key, algorithms=[algorithm])
     except jwt.PyJWTError:
         return None
+    finally:
+        jwt_decode_seconds.observe(time.perf_counter() - started_at)
+
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        claims_cache.set(digest, payload, ttl=expires_in)
+
+    return None if revocation_index.is_revoked(payload.get("sid")) else payload
@@ -5,7 +5,13 @@ from sqlalchemy import engine_from_config, pool
 from sqlmodel import SQLModel
 
 from app.core.config import settings
+from app.db.models.collection_version import JobApplicationCollectionVersion  # noqa
+from app.db.models.event import JobApplicationEvent  # noqa
+from app.db.models.idempotency import IdempotencyKey  # noqa
 from app.db.models.job_application import JobApplication  # noqa
+from app.db.models.outbox import OutboxEvent, Webhook  # noqa
+from app.db.models.stats import JobApplicationStatusCount  # noqa
+from app.db.models.token import RefreshToken  # noqa
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -23,6 +29,24 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+# Full-text search lives outside the models: the SQLite FTS5 tables and their
+# search_id key, and the generated Postgres search_vector column. Autogenerate
+# would otherwise try to drop them.
+SEARCH_TABLE_PREFIX = "job_applications_fts"
+SEARCH_COLUMNS = {"search_id", "search_vector"}
+SEARCH_INDEXES = {"ix_job_applications_search_id", "ix_job_applications_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table":
+        return not name.startswith(SEARCH_TABLE_PREFIX)
+    if type_ == "column":
+        return not (object.table.name == "job_applications" and name in SEARCH_COLUMNS)
+    if type_ == "index":
+        return name not in SEARCH_INDEXES
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -45,6 +69,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -67,7 +92,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
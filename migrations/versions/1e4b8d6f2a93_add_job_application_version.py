@@ -0,0 +1,29 @@
+"""Add job application version
+
+Revision ID: 1e4b8d6f2a93
+Revises: c7a3e1b95d08
+Create Date: 2026-10-18 14:21:56.770183
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1e4b8d6f2a93"
+down_revision: Union[str, None] = "c7a3e1b95d08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_applications",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_applications", "version")
@@ -0,0 +1,33 @@
+"""Add keyset pagination index on job_applications
+
+Revision ID: 3f9c1e7a2b4d
+Revises: d442a7e45f60
+Create Date: 2026-10-18 09:12:40.218311
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c1e7a2b4d"
+down_revision: Union[str, None] = "d442a7e45f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_job_applications_user_id_applied_at_id",
+        "job_applications",
+        ["user_id", "applied_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_job_applications_user_id_applied_at_id",
+        table_name="job_applications",
+    )
@@ -0,0 +1,75 @@
+"""Add job application stats tables
+
+Revision ID: 5d1e7c9a4f20
+Revises: 8b6d2f4e91c3
+Create Date: 2026-10-18 11:42:09.318274
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e7c9a4f20"
+down_revision: Union[str, None] = "8b6d2f4e91c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_application_status_counts",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "REVIEWING",
+                "INTERVIEWING",
+                "OFFERED",
+                "REJECTED",
+                name="jobapplicationstatus",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "status"),
+    )
+    op.create_table(
+        "job_application_weekly_counts",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "week_start"),
+    )
+
+    # Existing rows are counted once here; from then on the API keeps the
+    # counters current in the same transaction as each write.
+    op.execute("""
+        INSERT INTO job_application_status_counts (user_id, status, count)
+        SELECT user_id, status, count(*)
+        FROM job_applications
+        GROUP BY user_id, status
+        """)
+    if op.get_bind().dialect.name == "postgresql":
+        week_start = "date_trunc('week', applied_at)::date"
+    else:
+        week_start = (
+            "date(applied_at, '-' || ((strftime('%w', applied_at) + 6) % 7) || ' days')"
+        )
+    op.execute(f"""
+        INSERT INTO job_application_weekly_counts (user_id, week_start, count)
+        SELECT user_id, {week_start}, count(*)
+        FROM job_applications
+        GROUP BY user_id, {week_start}
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("job_application_weekly_counts")
+    op.drop_table("job_application_status_counts")
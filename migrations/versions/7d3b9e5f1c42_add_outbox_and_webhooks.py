@@ -0,0 +1,60 @@
+"""Add outbox events and webhooks
+
+Revision ID: 7d3b9e5f1c42
+Revises: 2c8f5e1a7d94
+Create Date: 2026-10-18 20:12:41.308562
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3b9e5f1c42"
+down_revision: Union[str, None] = "2c8f5e1a7d94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_events",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=False),
+        sa.Column("type", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("application_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("payload", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "sequence"),
+    )
+    op.create_index("ix_outbox_events_created_at", "outbox_events", ["created_at"])
+
+    op.create_table(
+        "webhooks",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("url", sqlmodel.sql.sqltypes.AutoString(length=2048), nullable=False),
+        sa.Column("secret", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("last_sequence", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_webhooks_user_id", "webhooks", ["user_id"])
+    op.create_index("ix_webhooks_next_attempt_at", "webhooks", ["next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhooks_next_attempt_at", table_name="webhooks")
+    op.drop_index("ix_webhooks_user_id", table_name="webhooks")
+    op.drop_table("webhooks")
+    op.drop_index("ix_outbox_events_created_at", table_name="outbox_events")
+    op.drop_table("outbox_events")
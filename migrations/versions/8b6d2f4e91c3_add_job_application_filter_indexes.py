@@ -0,0 +1,66 @@
+"""Add job application filter indexes
+
+Revision ID: 8b6d2f4e91c3
+Revises: 3f9c1e7a2b4d
+Create Date: 2026-10-18 10:03:17.554902
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b6d2f4e91c3"
+down_revision: Union[str, None] = "3f9c1e7a2b4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_job_applications_user_id_status",
+        "job_applications",
+        ["user_id", "status"],
+    )
+    op.create_index(
+        "ix_job_applications_user_id_updated_at",
+        "job_applications",
+        ["user_id", "updated_at"],
+    )
+    op.create_index(
+        "ix_job_applications_user_id_lower_company",
+        "job_applications",
+        ["user_id", sa.text("lower(company)")],
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_job_applications_lower_company_trgm",
+            "job_applications",
+            [sa.text("lower(company) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(
+            "ix_job_applications_lower_company_trgm",
+            table_name="job_applications",
+        )
+
+    op.drop_index(
+        "ix_job_applications_user_id_lower_company",
+        table_name="job_applications",
+    )
+    op.drop_index(
+        "ix_job_applications_user_id_updated_at",
+        table_name="job_applications",
+    )
+    op.drop_index(
+        "ix_job_applications_user_id_status",
+        table_name="job_applications",
+    )
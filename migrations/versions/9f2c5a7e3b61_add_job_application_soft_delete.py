@@ -0,0 +1,62 @@
+"""Add job application soft delete
+
+Revision ID: 9f2c5a7e3b61
+Revises: 1e4b8d6f2a93
+Create Date: 2026-10-18 15:12:38.045619
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9f2c5a7e3b61"
+down_revision: Union[str, None] = "1e4b8d6f2a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_applications",
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_job_applications_live_user_id_applied_at_id",
+        "job_applications",
+        ["user_id", "applied_at", "id"],
+        sqlite_where=sa.text("deleted_at IS NULL"),
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_job_applications_deleted_at",
+        "job_applications",
+        ["deleted_at"],
+        sqlite_where=sa.text("deleted_at IS NOT NULL"),
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    # Every live query filters out tombstones, so the partial index replaces
+    # the full keyset index.
+    op.drop_index(
+        "ix_job_applications_user_id_applied_at_id",
+        table_name="job_applications",
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_job_applications_user_id_applied_at_id",
+        "job_applications",
+        ["user_id", "applied_at", "id"],
+    )
+    op.drop_index(
+        "ix_job_applications_deleted_at",
+        table_name="job_applications",
+    )
+    op.drop_index(
+        "ix_job_applications_live_user_id_applied_at_id",
+        table_name="job_applications",
+    )
+    op.drop_column("job_applications", "deleted_at")
@@ -0,0 +1,83 @@
+"""Add job application full-text search
+
+Revision ID: b5f0d3a8c217
+Revises: 4a8e2d1c7f56
+Create Date: 2026-10-18 17:24:51.306718
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5f0d3a8c217"
+down_revision: Union[str, None] = "4a8e2d1c7f56"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        # The generated column is computed for existing rows while the table
+        # is rewritten, so no separate backfill is needed.
+        op.execute(
+            "ALTER TABLE job_applications ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', regexp_replace("
+            "coalesce(company, ''), '[^[:alnum:]]+', ' ', 'g')), 'A') || "
+            "setweight(to_tsvector('simple', regexp_replace("
+            "coalesce(url, ''), '[^[:alnum:]]+', ' ', 'g')), 'B')"
+            ") STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_job_applications_search_vector "
+            "ON job_applications USING gin (search_vector)"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE job_applications_fts USING fts5("
+            "company, url, content='job_applications', content_rowid='rowid', "
+            "prefix='2 3')"
+        )
+        op.execute(
+            "CREATE TRIGGER job_applications_fts_insert "
+            "AFTER INSERT ON job_applications BEGIN "
+            "INSERT INTO job_applications_fts(rowid, company, url) "
+            "VALUES (new.rowid, new.company, new.url); END"
+        )
+        op.execute(
+            "CREATE TRIGGER job_applications_fts_delete "
+            "AFTER DELETE ON job_applications BEGIN "
+            "INSERT INTO job_applications_fts"
+            "(job_applications_fts, rowid, company, url) "
+            "VALUES ('delete', old.rowid, old.company, old.url); END"
+        )
+        op.execute(
+            "CREATE TRIGGER job_applications_fts_update "
+            "AFTER UPDATE OF company, url ON job_applications BEGIN "
+            "INSERT INTO job_applications_fts"
+            "(job_applications_fts, rowid, company, url) "
+            "VALUES ('delete', old.rowid, old.company, old.url); "
+            "INSERT INTO job_applications_fts(rowid, company, url) "
+            "VALUES (new.rowid, new.company, new.url); END"
+        )
+        op.execute(
+            "INSERT INTO job_applications_fts(job_applications_fts) "
+            "VALUES ('rebuild')"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.execute("DROP INDEX ix_job_applications_search_vector")
+        op.execute("ALTER TABLE job_applications DROP COLUMN search_vector")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER job_applications_fts_update")
+        op.execute("DROP TRIGGER job_applications_fts_delete")
+        op.execute("DROP TRIGGER job_applications_fts_insert")
+        op.execute("DROP TABLE job_applications_fts")
@@ -0,0 +1,41 @@
+"""Add job application collection versions
+
+Revision ID: c7a3e1b95d08
+Revises: 5d1e7c9a4f20
+Create Date: 2026-10-18 13:05:41.902417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a3e1b95d08"
+down_revision: Union[str, None] = "5d1e7c9a4f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_application_collection_versions",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute("""
+        INSERT INTO job_application_collection_versions (user_id, version, updated_at)
+        SELECT user_id, 1, max(coalesce(updated_at, applied_at))
+        FROM job_applications
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("job_application_collection_versions")
@@ -0,0 +1,75 @@
+"""Add job application status events
+
+Revision ID: e6a9b4c2d813
+Revises: b5f0d3a8c217
+Create Date: 2026-10-18 18:12:40.918245
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a9b4c2d813"
+down_revision: Union[str, None] = "b5f0d3a8c217"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def status_enum() -> sa.Enum:
+    return sa.Enum(
+        "REVIEWING",
+        "INTERVIEWING",
+        "OFFERED",
+        "REJECTED",
+        name="jobapplicationstatus",
+        create_type=False,
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_application_events",
+        sa.Column("id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column("application_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("from_status", status_enum(), nullable=True),
+        sa.Column("to_status", status_enum(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id", "occurred_at"),
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+    op.create_index(
+        "ix_job_application_events_application_id_occurred_at",
+        "job_application_events",
+        ["application_id", "occurred_at"],
+    )
+    op.create_index(
+        "ix_job_application_events_user_id_occurred_at",
+        "job_application_events",
+        ["user_id", "occurred_at"],
+    )
+
+    # Monthly partitions are created ahead by the event-partitions task; the
+    # default partition only catches writes that outrun it.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "CREATE TABLE job_application_events_default "
+            "PARTITION OF job_application_events DEFAULT"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_job_application_events_user_id_occurred_at",
+        table_name="job_application_events",
+    )
+    op.drop_index(
+        "ix_job_application_events_application_id_occurred_at",
+        table_name="job_application_events",
+    )
+    op.drop_table("job_application_events")
@@ -0,0 +1,96 @@
+"""Key SQLite job application search on an explicit search_id
+
+Revision ID: f1d7c3a9e520
+Revises: 7d3b9e5f1c42
+Create Date: 2026-10-18 21:03:17.514920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1d7c3a9e520"
+down_revision: Union[str, None] = "7d3b9e5f1c42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_search(key: str, assign_key: bool) -> None:
+    op.execute(
+        "CREATE VIRTUAL TABLE job_applications_fts USING fts5("
+        f"company, url, content='job_applications', content_rowid='{key}', "
+        "prefix='2 3')"
+    )
+    if assign_key:
+        insert = (
+            "CREATE TRIGGER job_applications_fts_insert "
+            "AFTER INSERT ON job_applications BEGIN "
+            "UPDATE job_applications SET search_id = ("
+            "SELECT coalesce(max(search_id), 0) + 1 FROM job_applications"
+            ") WHERE rowid = new.rowid AND new.search_id IS NULL; "
+            "INSERT INTO job_applications_fts(rowid, company, url) "
+            "SELECT search_id, company, url FROM job_applications "
+            "WHERE rowid = new.rowid; END"
+        )
+    else:
+        insert = (
+            "CREATE TRIGGER job_applications_fts_insert "
+            "AFTER INSERT ON job_applications BEGIN "
+            "INSERT INTO job_applications_fts(rowid, company, url) "
+            "VALUES (new.rowid, new.company, new.url); END"
+        )
+    op.execute(insert)
+    op.execute(
+        "CREATE TRIGGER job_applications_fts_delete "
+        "AFTER DELETE ON job_applications BEGIN "
+        "INSERT INTO job_applications_fts"
+        "(job_applications_fts, rowid, company, url) "
+        f"VALUES ('delete', old.{key}, old.company, old.url); END"
+    )
+    op.execute(
+        "CREATE TRIGGER job_applications_fts_update "
+        "AFTER UPDATE OF company, url ON job_applications BEGIN "
+        "INSERT INTO job_applications_fts"
+        "(job_applications_fts, rowid, company, url) "
+        f"VALUES ('delete', old.{key}, old.company, old.url); "
+        "INSERT INTO job_applications_fts(rowid, company, url) "
+        f"VALUES (new.{key}, new.company, new.url); END"
+    )
+    op.execute(
+        "INSERT INTO job_applications_fts(job_applications_fts) VALUES ('rebuild')"
+    )
+
+
+def _drop_search() -> None:
+    op.execute("DROP TRIGGER job_applications_fts_update")
+    op.execute("DROP TRIGGER job_applications_fts_delete")
+    op.execute("DROP TRIGGER job_applications_fts_insert")
+    op.execute("DROP TABLE job_applications_fts")
+
+
+def upgrade() -> None:
+    # Postgres searches a generated column of the row itself; only the SQLite
+    # FTS5 table points at rows by an integer key.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _drop_search()
+    op.execute("ALTER TABLE job_applications ADD COLUMN search_id INTEGER")
+    op.execute("UPDATE job_applications SET search_id = rowid")
+    op.execute(
+        "CREATE UNIQUE INDEX ix_job_applications_search_id "
+        "ON job_applications (search_id)"
+    )
+    _create_search("search_id", assign_key=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _drop_search()
+    op.execute("DROP INDEX ix_job_applications_search_id")
+    op.execute("ALTER TABLE job_applications DROP COLUMN search_id")
+    _create_search("rowid", assign_key=False)